@@ -44,21 +44,31 @@ except ImportError:
 from Live.Clip import MidiNoteSpecification
 
 import threading
+import array
+import bisect
+import heapq
 import random
 import re
 import math
+import hashlib
 import os
 import shutil
 import struct
 import subprocess
+import sys
 import tempfile
-import wave
+import warnings
 from urllib.parse import unquote, urlparse
-try:
-    import audioop
-except ImportError:
-    audioop = None
-from itertools import zip_longest
+# audioop is deprecated since Python 3.11 and removed in 3.13; the peak reader
+# falls back to array when it is missing.
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore', DeprecationWarning)
+    try:
+        import audioop
+    except ImportError:
+        audioop = None
+from itertools import islice, zip_longest
+from types import MappingProxyType
 import time
 
 secret_version_number = 21
@@ -1771,9 +1781,33 @@ class Tap(ControlSurface):
     SYSEX_STRING_ESCAPE_CHAR = "\\"
     SYSEX_STRING_RESERVED_SYMBOLS = (",", "|", ";", "^", "-", "%", ":", "/", "<", "*", "$", "_", "&", "(", ")", "\\")
     MUTATOR_GENERATION_COOLDOWN_SECONDS = 1.25
+    MUTATOR_GENERATION_MEMO_SIZE = 32
+    # Settings fields generation reads, besides the operation depth keys.
+    # Scheduling-only fields (regenerate_mode, return_mode, ...) stay out of
+    # the generation memo key.
+    MUTATOR_GENERATIVE_SETTINGS = (
+        "preset",
+        "algorithm",
+        "companion_mode",
+        "depth",
+        "mutations_per_pass",
+        "mutator_slots",
+        "mutator_slot_count",
+        "root",
+        "scale",
+        "seed",
+        "target_pitches",
+        "_active_mutator_slots",
+        "_signature_numerator",
+    )
     FOLLOW_ACTION_NAME_MARKER_RE = re.compile(r"\s*\[TapFA:v1\|([^\]]*)\]")
     DECOUPLED_AUTOMATION_NAME_MARKER_RE = re.compile(r"\s*\[TapAuto:v2\|([^\]]*)\]")
     DECOUPLED_AUTOMATION_ANY_NAME_MARKER_RE = re.compile(r"\s*\[TapAuto:v[0-9]+\|([^\]]*)\]")
+    CLIP_NAME_MARKER_CACHE_SIZE = 1024
+    # Whole-state SysEx messages: only the last one queued in a tick is sent.
+    COALESCED_SYSEX_IDS = frozenset((0x01, 0x30, 0x4D, 0x5D, 0x6D, 0x7D))
+    # Per-control SysEx messages, coalesced per value of their first "|" field.
+    COALESCED_SYSEX_FIELD_IDS = frozenset((0x28,))
     MUTATOR_NAME_MARKER_RE = re.compile(r"\s*\[(?:TapComp|TapMut):v1\|([^\]]*)\]")
     MUTATOR_ANY_NAME_MARKER_RE = re.compile(r"\s*\[(?:TapComp|TapMut):v[0-9]+\|([^\]]*)\]")
     SYSEX_TEXT_SYMBOL_REPLACEMENTS = (
@@ -1783,6 +1817,15 @@ class Tap(ControlSurface):
         ('𝄫', 'bb'),
         ('𝄪', '##'),
     )
+    SYSEX_TEXT_SYMBOL_TABLE = str.maketrans(dict(SYSEX_TEXT_SYMBOL_REPLACEMENTS))
+    # zip/map rather than a comprehension, which cannot see class attributes.
+    SYSEX_STRING_ESCAPE_TABLE = str.maketrans(dict(zip(
+        SYSEX_STRING_RESERVED_SYMBOLS,
+        map(SYSEX_STRING_ESCAPE_CHAR.__add__, SYSEX_STRING_RESERVED_SYMBOLS),
+    )))
+    SYSEX_ESCAPED_CHAR_RE = re.compile(re.escape(SYSEX_STRING_ESCAPE_CHAR) + '(.)', re.S)
+    SYSEX_TEXT_CACHE_SIZE = 4096
+    SYSEX_TEXT_CACHE_MAX_LENGTH = 256
     SYSEX_ROUND_BRACKET_TEXT_RE = re.compile(r'\(([^()]*)\)')
     SYSEX_SQUARE_BRACKET_TEXT_RE = re.compile(r'\[([^\[\]]*)\]')
     SYSEX_CURLY_BRACKET_TEXT_RE = re.compile(r'\{([^{}]*)\}')
@@ -1851,6 +1894,8 @@ class Tap(ControlSurface):
     DISPLAY_VALUE_NUMBER_PATTERN = re.compile(r'(?<![\d.])([+-]?\d+)\.(\d+)(?![\d.])')
     PARAMETER_METADATA_RECHECK_INTERVAL = 0.1
     PARAMETER_METADATA_RECHECK_DURATION = 1.2
+    PARAMETER_METADATA_FRAGMENT_CACHE_SIZE = 512
+    PARAMETER_METADATA_PLACEHOLDER_TTL = 1.0
     UNMAPPED_PARAMETER_METADATA_ITEM = "*--&&-|0|127|0.0|0.0|32|"
     UNMAPPED_PARAMETER_METADATA = ",".join([UNMAPPED_PARAMETER_METADATA_ITEM] * 8)
     TRACK_DEVICE_NAV_NAME = "line.3.horizontal"
@@ -1868,7 +1913,34 @@ class Tap(ControlSurface):
     AUTOMATION_ENVELOPE_MAX_SAMPLES = 1024
     AUTOMATION_ENVELOPE_LINEAR_EPSILON = 0.0015
     AUTOMATION_ENVELOPE_JUMP_THRESHOLD = 0.1
+    AUTOMATION_ENVELOPE_MAX_POINTS = 256
     AUTOMATION_FOLDED_ENDPOINT_ORDER = 2147483647
+    AUTOMATION_PAGE_CACHE_SECONDS = 0.25
+    AUTOMATION_BINARY_ENVELOPE_VERSION = 1
+    AUTOMATION_BINARY_TICKS_PER_BEAT = 3840
+    AUTOMATION_BINARY_VALUE_MAX = 0x3FFF
+    SIMPLER_WAVEFORM_DISK_CACHE_APP_DIRECTORY = "Tap"
+    SIMPLER_WAVEFORM_DISK_CACHE_DIRECTORY = "WaveformCache"
+    SIMPLER_WAVEFORM_DISK_CACHE_EXTENSION = ".tpk"
+    SIMPLER_WAVEFORM_DISK_CACHE_MAGIC = b"TapP"
+    SIMPLER_WAVEFORM_DISK_CACHE_VERSION = 2
+    # magic, version, source mtime (ns), source size, path length, peak count,
+    # base min/max bin count
+    SIMPLER_WAVEFORM_DISK_CACHE_HEADER = struct.Struct('<4sBqQHHI')
+    SIMPLER_WAVEFORM_POINT_COUNT = 512
+    SIMPLER_WAVEFORM_VIEW_POINT_COUNT = 112
+    SIMPLER_WAVEFORM_MIN_BIN_FRAMES = 64
+    SIMPLER_WAVEFORM_MAX_BINS = 1 << 16
+    SIMPLER_WAVEFORM_DISK_CACHE_ENTRY_COUNT = 64
+    # Sized so the cache holds 64 samples even at the finest pyramid
+    # (MAX_BINS min/max bins each), with room for a long file path.
+    SIMPLER_WAVEFORM_DISK_CACHE_MAX_BYTES = SIMPLER_WAVEFORM_DISK_CACHE_ENTRY_COUNT * (
+        SIMPLER_WAVEFORM_DISK_CACHE_HEADER.size + 1024 + SIMPLER_WAVEFORM_POINT_COUNT + 2 * SIMPLER_WAVEFORM_MAX_BINS
+    )
+    AUDIO_PEAK_BLOCK_BYTES = 1 << 20
+    AFCONVERT_PATH = '/usr/bin/afconvert'
+    # Maps unsigned 8-bit WAV samples onto signed two's complement bytes.
+    UNSIGNED_8BIT_TO_SIGNED = bytes((value ^ 0x80) for value in range(256))
     
 
     def __init__(self, c_instance):
@@ -1887,9 +1959,12 @@ class Tap(ControlSurface):
             return_count = 12  # Maximum of 12 Sends and 12 Returns
             max_clip_slots = 800  # Adjust this number based on your needs
             self.playing_position_listeners = [None] * max_clip_slots
-            self.current_clip_notes = []
             self.last_selected_clip_slot = None
-            self.last_raw_notes = None
+            self._playhead_note_index = None
+            self._playhead_note_index_clip = None
+            # (start, end) of the playhead clip's marker/loop range while no
+            # note starts outside it; cleared by its notes listener.
+            self._playhead_clip_notes_inside_range = None
             self.currently_playing_notes = [False] * 128
             self.last_playing_position = 0.0
             self.last_sent_out_playing_pos = 0.0
@@ -1910,7 +1985,6 @@ class Tap(ControlSurface):
             self._disabled_parameters = []
             self._current_disabled_controls = []
             self._automation_state_listeners = {}
-            self._automation_metadata_update_timer = None
             self._automation_metadata_retry_count = 0
             self._automation_metadata_retry_start = None
             self._last_automation_signature = None
@@ -1933,6 +2007,15 @@ class Tap(ControlSurface):
             self.browser_search_result_items = []
             self.browser_showing_search_results = False
             self.browser_search_scope = ''
+            # Per-category search index, built and refreshed in the background.
+            self.browser_search_index = {}
+            self.browser_search_index_work = None
+            self.browser_search_index_queue = []
+            self.browser_search_index_generation = 0
+            self.browser_search_index_batch_size = 250
+            self.browser_search_index_suffix_batch_size = 10000
+            self.browser_search_index_max_items = 200000
+            self.browser_search_index_max_age = 600.0
             # browser navigation history for back button
             self.browser_history = []
             self.browser_folder_mapping = {
@@ -1970,7 +2053,6 @@ class Tap(ControlSurface):
             # These are the content tags exposed by Live's control-surface Browser API.
             # The desktop browser's arbitrary user tag database is not part of that API.
             self.browser_searchable_tag_indices = (0, 3, 4, 5, 6, 8, 9, 12, 13)
-            self._metadata_recheck_timer = None
             self._last_sent_metadata = None
             self._last_drum_pad_metadata = None
             self._drum_pad_change_recheck_count = 0
@@ -1981,11 +2063,11 @@ class Tap(ControlSurface):
             self._device_recheck_count = 0
             self._debug_mode = False
             self._metadata_cache = {}
+            # parameter state key -> (metadata field, expiry or None if settled)
+            self._parameter_metadata_fragment_cache = {}
             self._metadata_send_seq = 0
             self._metadata_send_seq_by_device = {}
             self._automation_metadata_device_id = None
-            self._automation_timer_lock = threading.Lock()
-            self._mixer_disconnect_timer = None
             self._follow_action_rules = {}
             self._active_follow_actions = {}
             self._handled_follow_action_launches = set()
@@ -1995,7 +2077,6 @@ class Tap(ControlSurface):
             self._parameter_name_listeners = {}
             self._parameter_name_update_timer = None
             self._active_bank_parameter_refresh_pending = False
-            self._bank_metadata_refresh_timers = []
             self._parameter_source_device = None
             self._parameter_source_listener = None
             self._bank_parameter_source_device = None
@@ -2027,6 +2108,12 @@ class Tap(ControlSurface):
             self._mutator_regeneration_states = {}
             self._mutator_generation_in_progress = set()
             self._mutator_generation_scheduled = set()
+            # Per clip key: the background generation job whose result is pending.
+            self._mutator_generation_jobs = {}
+            # Per clip key: the next regeneration, computed ahead of the boundary.
+            self._mutator_prepared_generations = {}
+            # Memo hash -> generation result, shared across calls and clips.
+            self._mutator_generation_memo = {}
             self._queued_mutator_work = {}
             self._last_mutator_generation_times = {}
             self._last_mutator_generation_request_times = {}
@@ -2040,15 +2127,41 @@ class Tap(ControlSurface):
             self._selected_clip_update_pending_metadata = False
             self._selected_clip_update_pending_notes = False
             self._clip_slot_listeners = {}
+            self._selected_clip_note_cache = None
+            self._selected_clip_note_cache_clip = None
+            self._selected_clip_note_deltas_enabled = False
+            # (start, end) beats the app asked to see for the highlighted clip.
+            self._selected_clip_note_window = None
+            self._selected_clip_note_window_clip = None
+            # Set once the app asks for 0x32 binary automation envelopes.
+            self._automation_binary_envelopes_enabled = False
+            # (page key, time, samples) of the last sampled envelope page.
+            self._automation_page_cache = None
             self._registered_track_ids = set()
             self._clip_color_listeners = {}
             self._clip_listener_track_slots = {}
+            self._clip_track_arm_listeners = {}
+            self._dirty_clip_slots = {}
+            self._clip_grid_deltas_enabled = False
             self._clip_slot_color_map = {}
             self._track_list_signature = None
             self._last_group_fold_states = None
             self._last_group_hidden_states = None
             self._previous_selected_track = None
-            self._periodic_timer_ref = None
+            # name -> (deadline, callback, args); run from update_display.
+            self._scheduled_tasks = {}
+            # Live object identity -> (raw name, {marker kind: parsed record})
+            self._clip_name_marker_cache = {}
+            # raw text -> sanitized / escaped text, least recently used first
+            self._sanitized_sysex_text_cache = {}
+            self._escaped_sysex_text_cache = {}
+            # separator -> compiled escaped-field pattern
+            self._escaped_sysex_field_patterns = {}
+            # Outgoing MIDI is queued as [packets, optimized] entries and sent
+            # once per update_display; keyed entries are replaced, not repeated.
+            self._outbound_midi_frame = []
+            self._outbound_midi_frame_keys = {}
+            self._outbound_midi_counters = {"sent": 0, "dropped": 0}
             self._clip_position_feedback_enabled = False
             self._clip_position_feedback_track_indexes = ()
             self._last_clip_position_feedback_time = 0.0
@@ -2063,7 +2176,6 @@ class Tap(ControlSurface):
             self._mixer_automation_controls = []
             self._mixer_automation_status_specs = []
             self._mixer_automation_state_listeners = []
-            self._mixer_automation_status_timers = []
             self._track_device_selected = False
             self._track_control_selection_by_track = {}
             self._track_control_bank_index_by_track = {}
@@ -2078,6 +2190,9 @@ class Tap(ControlSurface):
             self._simpler_waveform_generation = 0
             self._simpler_waveform_cache = {}
             self._simpler_waveform_cache_order = []
+            self._simpler_waveform_pyramids = {}
+            self._simpler_waveform_key = None
+            self._simpler_viewport_waveform_state = None
             self._simpler_waveform_lock = threading.Lock()
             self._simpler_waveform_pending = set()
             self._simpler_playhead_high = -1
@@ -2085,6 +2200,7 @@ class Tap(ControlSurface):
             self._simpler_playhead_enabled = None
             self._last_track_simpler_slice_signature = None
             self.periodic_timer = 1
+            self._register_sysex_handlers()
             # connection check button
             connection_check_button = ButtonElement(1, MIDI_NOTE_TYPE, 15, 94)
             connection_check_button.add_value_listener(self._connection_established)
@@ -3899,10 +4015,29 @@ class Tap(ControlSurface):
         self._send_sys_ex_message(bank_names_list, 0x5D)
         return current_bank_name, all_bank_names, connected_bank_names
 
+    def _cached_sysex_text(self, cache, value, convert):
+        text = value if isinstance(value, str) else str(value)
+        if len(text) > self.SYSEX_TEXT_CACHE_MAX_LENGTH:
+            # Whole outgoing payloads also pass through here; only names and
+            # display strings repeat often enough to be worth keeping.
+            return convert(text)
+        result = cache.pop(text, None)
+        if result is None:
+            result = convert(text)
+            if len(cache) >= self.SYSEX_TEXT_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+        cache[text] = result
+        return result
+
     def _sanitize_sysex_text(self, value):
-        sanitized_value = str(value)
-        for symbol, replacement in self.SYSEX_TEXT_SYMBOL_REPLACEMENTS:
-            sanitized_value = sanitized_value.replace(symbol, replacement)
+        return self._cached_sysex_text(self._sanitized_sysex_text_cache, value, self._sanitize_sysex_text_uncached)
+
+    def _sanitize_sysex_text_uncached(self, sanitized_value):
+        if sanitized_value.isascii():
+            # Symbol replacement, bracket pruning and the ASCII filter only
+            # ever change non-ASCII text.
+            return self.SYSEX_MULTI_SPACE_RE.sub(' ', sanitized_value).strip()
+        sanitized_value = sanitized_value.translate(self.SYSEX_TEXT_SYMBOL_TABLE)
 
         def remove_ascii_empty_bracket_group(match):
             inner_value = match.group(1)
@@ -3919,52 +4054,49 @@ class Tap(ControlSurface):
         return sanitized_value.strip()
 
     def _escape_sysex_string(self, value):
-        escaped_value = self._sanitize_sysex_text(value)
-        escaped_value = escaped_value.replace(
-            self.SYSEX_STRING_ESCAPE_CHAR,
-            self.SYSEX_STRING_ESCAPE_CHAR + self.SYSEX_STRING_ESCAPE_CHAR
-        )
-        for symbol in self.SYSEX_STRING_RESERVED_SYMBOLS:
-            if symbol == self.SYSEX_STRING_ESCAPE_CHAR:
-                continue
-            escaped_value = escaped_value.replace(symbol, self.SYSEX_STRING_ESCAPE_CHAR + symbol)
-        return escaped_value
+        return self._cached_sysex_text(self._escaped_sysex_text_cache, value, self._escape_sysex_string_uncached)
+
+    def _escape_sysex_string_uncached(self, value):
+        # Every reserved symbol, the escape character included, gets one
+        # escape character in front of it in a single translate pass.
+        return self._sanitize_sysex_text(value).translate(self.SYSEX_STRING_ESCAPE_TABLE)
 
     def _unescape_sysex_string(self, value):
-        result = []
-        escaping = False
-        for char in str(value):
-            if escaping:
-                result.append(char)
-                escaping = False
-            elif char == self.SYSEX_STRING_ESCAPE_CHAR:
-                escaping = True
-            else:
-                result.append(char)
-        if escaping:
-            result.append(self.SYSEX_STRING_ESCAPE_CHAR)
-        return ''.join(result)
+        # A trailing lone escape character has nothing to escape and is kept.
+        value = str(value)
+        if self.SYSEX_STRING_ESCAPE_CHAR not in value:
+            return value
+        return self.SYSEX_ESCAPED_CHAR_RE.sub(r'\1', value)
+
+    def _escaped_sysex_field_pattern(self, separator):
+        pattern = self._escaped_sysex_field_patterns.get(separator)
+        if pattern is None:
+            escape_char = re.escape(self.SYSEX_STRING_ESCAPE_CHAR)
+            # One field (escape pairs kept as-is) and the separator or end after it.
+            pattern = re.compile(
+                r'((?:[^{0}{1}]+|{0}.?)*)({1}|\Z)'.format(escape_char, re.escape(separator)),
+                re.S,
+            )
+            self._escaped_sysex_field_patterns[separator] = pattern
+        return pattern
 
     def _split_escaped_sysex_fields(self, value, separator):
+        """
+        Split on unescaped separators, keeping escape pairs in the fields so
+        they can be unescaped later.
+        """
+        value = str(value)
+        if self.SYSEX_STRING_ESCAPE_CHAR not in value:
+            return value.split(separator)
+        pattern = self._escaped_sysex_field_pattern(separator)
         fields = []
-        field_chars = []
-        escaping = False
-        for char in str(value):
-            if escaping:
-                field_chars.append(self.SYSEX_STRING_ESCAPE_CHAR)
-                field_chars.append(char)
-                escaping = False
-            elif char == self.SYSEX_STRING_ESCAPE_CHAR:
-                escaping = True
-            elif char == separator:
-                fields.append(''.join(field_chars))
-                field_chars = []
-            else:
-                field_chars.append(char)
-        if escaping:
-            field_chars.append(self.SYSEX_STRING_ESCAPE_CHAR)
-        fields.append(''.join(field_chars))
-        return fields
+        position = 0
+        while True:
+            match = pattern.match(value, position)
+            fields.append(match.group(1))
+            if not match.group(2):
+                return fields
+            position = match.end()
 
     def _get_parameter_display_name(self, device_param):
         raw_name = self._escape_sysex_string(device_param.name)
@@ -4238,71 +4370,7 @@ class Tap(ControlSurface):
                     name = self._get_parameter_display_name(device_param)
                     if self._tap_active_custom_kind(selected_device) == 'drumcell_sample' and control_index == 7:
                         name = 'Mode'
-                    
-                    min_val_str = None
-                    max_val_str = None
-                    default_val_str = None
-                    
-                    if min_val_str is None or max_val_str is None:
-                        try:
-                            if hasattr(device_param, 'str_for_value'):
-                                if hasattr(device_param, 'min') and hasattr(device_param, 'max'):
-                                    min_val_str = device_param.str_for_value(device_param.min)
-                                    max_val_str = device_param.str_for_value(device_param.max)
-                                else:
-                                    min_val_str = device_param.str_for_value(0.0)
-                                    max_val_str = device_param.str_for_value(1.0)
-                        except Exception:
-                            pass
-                    
-                    if min_val_str is None:
-                        min_val_str = str(device_param.min) if hasattr(device_param, 'min') else "0.0"
-                    if max_val_str is None:
-                        max_val_str = str(device_param.max) if hasattr(device_param, 'max') else "1.0"
-                    
-                    raw_default_value = None
-                    quarter_str = "0.0"
-                    if (not self._parameter_is_quantized(device_param) and hasattr(device_param, 'default_value')):
-                        try:
-                            raw_default_value = device_param.default_value
-                            if hasattr(device_param, 'str_for_value'):
-                                default_val_str = device_param.str_for_value(device_param.default_value)
-                                try:
-                                    num_val = float(default_val_str)
-                                    default_val_str = str(round(num_val, 2))
-                                except Exception:
-                                    pass
-                                if hasattr(device_param, 'min') and hasattr(device_param, 'max'):
-                                    quarter_value = device_param.min + (device_param.max - device_param.min) * 32/127
-                                    quarter_str = device_param.str_for_value(quarter_value)
-                            else:
-                                default_val_str = str(round(device_param.default_value, 2))
-                            if hasattr(device_param, 'min') and hasattr(device_param, 'max') and device_param.max != device_param.min:
-                                raw_default_value = round((raw_default_value - device_param.min) / (device_param.max - device_param.min), 3)
-                        except Exception:
-                            default_val_str = min_val_str
-                            raw_default_value = device_param.min if hasattr(device_param, 'min') else 0.0
-                    else:
-                        default_val_str = min_val_str
-                        raw_default_value = device_param.min if hasattr(device_param, 'min') else 0.0
-                    
-                    parameter_value_items = self._parameter_value_items(device_param)
-                    value_items = ';'.join(self._escape_sysex_string(item) for item in parameter_value_items)
-                    if parameter_value_items and self._parameter_is_tap_virtual(device_param, selected_device):
-                        min_val_str = parameter_value_items[0]
-                        max_val_str = parameter_value_items[-1]
-                        default_index = int(round(max(0.0, min(1.0, float(raw_default_value))) * (len(parameter_value_items) - 1)))
-                        quarter_index = int(round((32.0 / 127.0) * (len(parameter_value_items) - 1)))
-                        default_val_str = parameter_value_items[default_index]
-                        quarter_str = parameter_value_items[quarter_index]
-
-                    default_raw_str = str(raw_default_value) if raw_default_value is not None else ""
-                    min_val_str = self._escape_sysex_string(min_val_str.strip())
-                    max_val_str = self._escape_sysex_string(max_val_str.strip())
-                    default_val_str = self._escape_sysex_string(default_val_str.strip())
-                    quarter_str = self._escape_sysex_string(quarter_str.strip())
-                    param_str = f"{name.strip()}|{min_val_str}|{max_val_str}|{default_val_str}|{default_raw_str.strip()}|{quarter_str}|{value_items.strip()}"
-                    param_data.append(param_str)
+                    param_data.append(self._cached_parameter_metadata_fragment(device_param, name, selected_device))
                 else:
                     param_str = "*--&&-|0|127|0.0|0.0|32|"
                     param_data.append(param_str)
@@ -4314,6 +4382,111 @@ class Tap(ControlSurface):
         
         return ','.join(param_data)
     
+    def _cached_parameter_metadata_fragment(self, device_param, name, selected_device):
+        """
+        Returns one control's metadata field, reusing the last one built for
+        the same parameter while its name, range, default and quantization
+        are unchanged. Numeric-only fragments may be Live's unsettled
+        placeholders, so they are only kept for a short TTL and dropped by
+        every metadata recheck.
+        """
+        try:
+            key = (
+                self._live_object_identity(device_param),
+                name,
+                getattr(device_param, 'is_quantized', False),
+                getattr(device_param, 'min', None),
+                getattr(device_param, 'max', None),
+                getattr(device_param, 'default_value', None),
+                self._parameter_value_items(device_param),
+            )
+        except Exception:
+            return self._parameter_metadata_fragment(device_param, name, selected_device)
+
+        now = time.monotonic()
+        cached = self._parameter_metadata_fragment_cache.get(key)
+        if cached is not None and (cached[1] is None or cached[1] > now):
+            return cached[0]
+
+        fragment = self._parameter_metadata_fragment(device_param, name, selected_device)
+        expires_at = None
+        if self._metadata_has_only_numbers(fragment) or self._metadata_has_raw_0_127(fragment):
+            expires_at = now + self.PARAMETER_METADATA_PLACEHOLDER_TTL
+        if len(self._parameter_metadata_fragment_cache) >= self.PARAMETER_METADATA_FRAGMENT_CACHE_SIZE:
+            self._parameter_metadata_fragment_cache.clear()
+        self._parameter_metadata_fragment_cache[key] = (fragment, expires_at)
+        return fragment
+
+    def _expire_placeholder_metadata_fragments(self):
+        for key, cached in list(self._parameter_metadata_fragment_cache.items()):
+            if cached[1] is not None:
+                del self._parameter_metadata_fragment_cache[key]
+
+    def _parameter_metadata_fragment(self, device_param, name, selected_device):
+        min_val_str = None
+        max_val_str = None
+        default_val_str = None
+        
+        if min_val_str is None or max_val_str is None:
+            try:
+                if hasattr(device_param, 'str_for_value'):
+                    if hasattr(device_param, 'min') and hasattr(device_param, 'max'):
+                        min_val_str = device_param.str_for_value(device_param.min)
+                        max_val_str = device_param.str_for_value(device_param.max)
+                    else:
+                        min_val_str = device_param.str_for_value(0.0)
+                        max_val_str = device_param.str_for_value(1.0)
+            except Exception:
+                pass
+        
+        if min_val_str is None:
+            min_val_str = str(device_param.min) if hasattr(device_param, 'min') else "0.0"
+        if max_val_str is None:
+            max_val_str = str(device_param.max) if hasattr(device_param, 'max') else "1.0"
+        
+        raw_default_value = None
+        quarter_str = "0.0"
+        if (not self._parameter_is_quantized(device_param) and hasattr(device_param, 'default_value')):
+            try:
+                raw_default_value = device_param.default_value
+                if hasattr(device_param, 'str_for_value'):
+                    default_val_str = device_param.str_for_value(device_param.default_value)
+                    try:
+                        num_val = float(default_val_str)
+                        default_val_str = str(round(num_val, 2))
+                    except Exception:
+                        pass
+                    if hasattr(device_param, 'min') and hasattr(device_param, 'max'):
+                        quarter_value = device_param.min + (device_param.max - device_param.min) * 32/127
+                        quarter_str = device_param.str_for_value(quarter_value)
+                else:
+                    default_val_str = str(round(device_param.default_value, 2))
+                if hasattr(device_param, 'min') and hasattr(device_param, 'max') and device_param.max != device_param.min:
+                    raw_default_value = round((raw_default_value - device_param.min) / (device_param.max - device_param.min), 3)
+            except Exception:
+                default_val_str = min_val_str
+                raw_default_value = device_param.min if hasattr(device_param, 'min') else 0.0
+        else:
+            default_val_str = min_val_str
+            raw_default_value = device_param.min if hasattr(device_param, 'min') else 0.0
+        
+        parameter_value_items = self._parameter_value_items(device_param)
+        value_items = ';'.join(self._escape_sysex_string(item) for item in parameter_value_items)
+        if parameter_value_items and self._parameter_is_tap_virtual(device_param, selected_device):
+            min_val_str = parameter_value_items[0]
+            max_val_str = parameter_value_items[-1]
+            default_index = int(round(max(0.0, min(1.0, float(raw_default_value))) * (len(parameter_value_items) - 1)))
+            quarter_index = int(round((32.0 / 127.0) * (len(parameter_value_items) - 1)))
+            default_val_str = parameter_value_items[default_index]
+            quarter_str = parameter_value_items[quarter_index]
+
+        default_raw_str = str(raw_default_value) if raw_default_value is not None else ""
+        min_val_str = self._escape_sysex_string(min_val_str.strip())
+        max_val_str = self._escape_sysex_string(max_val_str.strip())
+        default_val_str = self._escape_sysex_string(default_val_str.strip())
+        quarter_str = self._escape_sysex_string(quarter_str.strip())
+        return f"{name.strip()}|{min_val_str}|{max_val_str}|{default_val_str}|{default_raw_str.strip()}|{quarter_str}|{value_items.strip()}"
+
     def _metadata_has_only_numbers(self, metadata):
         if not metadata:
             return False
@@ -4380,30 +4553,19 @@ class Tap(ControlSurface):
         self._mark_metadata_sent(device)
 
     def _schedule_parameter_metadata_recheck(self, delay=None):
-        if self._metadata_recheck_timer:
-            self._metadata_recheck_timer.cancel()
-
         self._drum_pad_change_recheck_count = 0
         self._drum_pad_recheck_start = time.time()
 
         recheck_delay = delay if delay is not None else self.PARAMETER_METADATA_RECHECK_INTERVAL
-        self._metadata_recheck_timer = threading.Timer(recheck_delay, self._recheck_parameter_metadata)
-        self._metadata_recheck_timer.start()
+        self._schedule_task('parameter_metadata_recheck', recheck_delay, self._recheck_parameter_metadata)
 
     def _cancel_bank_metadata_refreshes(self):
-        for timer in list(getattr(self, '_bank_metadata_refresh_timers', [])):
-            try:
-                timer.cancel()
-            except Exception:
-                pass
-        self._bank_metadata_refresh_timers = []
+        self._cancel_task('bank_metadata_refresh')
 
     def _schedule_bank_metadata_refreshes(self):
         self._cancel_bank_metadata_refreshes()
         for delay in (0.05, 0.15, 0.35, 0.75):
-            timer = threading.Timer(delay, self._refresh_active_bank_metadata)
-            self._bank_metadata_refresh_timers.append(timer)
-            timer.start()
+            self._schedule_task(('bank_metadata_refresh', delay), delay, self._refresh_active_bank_metadata)
 
     def _refresh_active_bank_metadata(self):
         if not liveobj_valid(self._device):
@@ -4483,10 +4645,9 @@ class Tap(ControlSurface):
             self._metadata_send_seq_by_device[key] = self._metadata_send_seq
     
     def _recheck_parameter_metadata(self):
-        self._metadata_recheck_timer = None
-        
         if not liveobj_valid(self._device):
             return
+        self._expire_placeholder_metadata_fragments()
         
         selected_track = self.song().view.selected_track
         selected_device = selected_track.view.selected_device
@@ -4566,8 +4727,11 @@ class Tap(ControlSurface):
         if should_continue:
             self._drum_pad_change_recheck_count += 1
             if self._drum_pad_change_recheck_count <= max_iterations:
-                self._metadata_recheck_timer = threading.Timer(self.PARAMETER_METADATA_RECHECK_INTERVAL, self._recheck_parameter_metadata)
-                self._metadata_recheck_timer.start()
+                self._schedule_task(
+                    'parameter_metadata_recheck',
+                    self.PARAMETER_METADATA_RECHECK_INTERVAL,
+                    self._recheck_parameter_metadata,
+                )
             else:
                 if is_drum_pad_device:
                     self._debug_log(f"Drum pad recheck: Reached max iterations, last metadata: {current_metadata[:100]}...")
@@ -5331,10 +5495,12 @@ class Tap(ControlSurface):
             self._debug_log('Error setting Simpler {}: {}'.format(spec['name'], str(error)))
             return False
 
-    def _clamp_simpler_waveform_center(self):
+    def _simpler_visible_width(self):
         zoom = max(0.0, min(1.0, self._simpler_zoom))
-        visible_width = max(0.04, math.pow(1.0 - zoom, 2.0))
-        half_width = visible_width * 0.5
+        return max(0.04, math.pow(1.0 - zoom, 2.0))
+
+    def _clamp_simpler_waveform_center(self):
+        half_width = self._simpler_visible_width() * 0.5
         self._simpler_waveform_center = max(
             half_width,
             min(1.0 - half_width, self._simpler_waveform_center),
@@ -5450,6 +5616,7 @@ class Tap(ControlSurface):
             self._simpler_waveform_center,
         )
         self._send_sys_ex_message(payload, 0x42)
+        self._send_simpler_viewport_waveform()
 
     def _trigger_simpler_action(self, action_index):
         device = self._simpler_device
@@ -5519,9 +5686,8 @@ class Tap(ControlSurface):
                 self._simpler_zoom = max(0.0, self._simpler_zoom - 0.12)
                 self._clamp_simpler_waveform_center()
             elif action_index in (11, 12):
-                visible_width = max(0.04, math.pow(1.0 - self._simpler_zoom, 2.0))
                 direction = -1.0 if action_index == 11 else 1.0
-                self._simpler_waveform_center += direction * visible_width * 0.25
+                self._simpler_waveform_center += direction * self._simpler_visible_width() * 0.25
                 self._clamp_simpler_waveform_center()
             elif action_index == 13 and bool(getattr(device, 'can_warp_as', False)):
                 device.warp_as(2.0)
@@ -5567,6 +5733,8 @@ class Tap(ControlSurface):
 
     def _send_simpler_waveform_clear(self):
         generation = self._simpler_waveform_generation & 0x7F
+        self._simpler_waveform_key = None
+        self._simpler_viewport_waveform_state = None
         self._send_sys_ex_message('{}|'.format(generation), 0x41)
 
     def _send_simpler_waveform(self, generation, peaks):
@@ -5586,6 +5754,78 @@ class Tap(ControlSurface):
         encoded_peaks = ''.join('{:02x}'.format(max(0, min(127, int(peak)))) for peak in peaks)
         self._debug_log('Sending Simpler waveform: {} points in one packet'.format(len(peaks)))
         self._send_sys_ex_message('{}|{}'.format(generation & 0x7F, encoded_peaks), 0x41)
+        self._simpler_viewport_waveform_state = None
+        self._send_simpler_viewport_waveform()
+
+    def _simpler_waveform_pyramid(self, minimums, maximums):
+        """
+        Build min/max levels from the finest bins up, halving the bin count per
+        level until one level fits in a single viewport packet.
+        """
+        if not minimums or not maximums:
+            return None
+        levels = [(array.array('b', minimums), array.array('b', maximums))]
+        while len(levels[-1][0]) > self.SIMPLER_WAVEFORM_VIEW_POINT_COUNT:
+            minimums, maximums = levels[-1]
+            coarser_minimums = array.array('b', map(min, minimums[0::2], minimums[1::2]))
+            coarser_maximums = array.array('b', map(max, maximums[0::2], maximums[1::2]))
+            if len(minimums) & 1:
+                coarser_minimums.append(minimums[-1])
+                coarser_maximums.append(maximums[-1])
+            levels.append((coarser_minimums, coarser_maximums))
+        return levels
+
+    def _simpler_viewport_waveform_points(self, levels, start, end, point_count):
+        """
+        Answer a viewport from the coarsest level that still has at least one
+        bin per point, so each point only folds one or two bins together.
+        """
+        visible_bins = (end - start) * len(levels[0][0])
+        level_index = 0
+        while level_index + 1 < len(levels) and visible_bins * 0.5 >= point_count:
+            visible_bins *= 0.5
+            level_index += 1
+        minimums, maximums = levels[level_index]
+        bin_count = len(minimums)
+        points = []
+        for point_index in range(point_count):
+            first = int((start + (end - start) * point_index / point_count) * bin_count)
+            last = int((start + (end - start) * (point_index + 1) / point_count) * bin_count)
+            first = max(0, min(bin_count - 1, first))
+            last = max(first + 1, min(bin_count, last))
+            points.append((min(minimums[first:last]), max(maximums[first:last])))
+        return points
+
+    def _send_simpler_viewport_waveform(self):
+        """
+        Send the zoomed min/max envelope as 0x4E "gen|start|end|hex", with
+        upper and lower amplitude as two hex bytes per point. Nothing is sent
+        when only an .asd overview exists or the viewport is unchanged.
+        """
+        levels = self._simpler_waveform_pyramids.get(self._simpler_waveform_key)
+        if not levels:
+            return
+        visible_width = self._simpler_visible_width()
+        start = max(0.0, self._simpler_waveform_center - visible_width * 0.5)
+        end = min(1.0, start + visible_width)
+        state = (self._simpler_waveform_generation, self._simpler_waveform_key, round(start, 6), round(end, 6))
+        if state == self._simpler_viewport_waveform_state:
+            return
+        self._simpler_viewport_waveform_state = state
+        points = self._simpler_viewport_waveform_points(
+            levels,
+            start,
+            end,
+            self.SIMPLER_WAVEFORM_VIEW_POINT_COUNT,
+        )
+        encoded_points = ''.join(
+            '{:02x}{:02x}'.format(max(0, maximum), max(0, -minimum))
+            for minimum, maximum in points
+        )
+        self._send_sys_ex_message(
+            '{}|{:.6f}|{:.6f}|{}'.format(self._simpler_waveform_generation & 0x7F, start, end, encoded_points),
+            0x4E,
+        )
 
     def _request_simpler_waveform(self):
         sample = self._simpler_sample
@@ -5598,97 +5838,413 @@ class Tap(ControlSurface):
         if not file_path or not os.path.isfile(file_path):
             return
 
+        cache_key = self._simpler_waveform_cache_key(file_path)
+        if cache_key is None:
+            return
+        self._simpler_waveform_key = cache_key
+
         generation = self._simpler_waveform_generation
-        cached = self._simpler_waveform_cache.get(file_path)
+        cached = self._simpler_waveform_cache.get(cache_key)
         if cached:
             self._debug_log('Using cached Simpler waveform: {} points'.format(len(cached)))
             self._send_simpler_waveform(generation, cached)
             return
 
-        self._poll_simpler_waveform(generation, file_path, 0)
-        pending_key = (generation, file_path)
+        cached = self._read_simpler_waveform_disk_cache(cache_key)
+        if cached:
+            peaks, minimums, maximums = cached
+            self._debug_log('Using on-disk Simpler waveform: {} points'.format(len(peaks)))
+            self._cache_simpler_waveform(cache_key, peaks, self._simpler_waveform_pyramid(minimums, maximums))
+            self._send_simpler_waveform(generation, peaks)
+            return
+
+        self._poll_simpler_waveform(generation, cache_key, 0)
+        pending_key = (generation, cache_key)
         if pending_key in self._simpler_waveform_pending:
             return
         self._simpler_waveform_pending.add(pending_key)
 
         worker = threading.Thread(
             target=self._build_simpler_waveform,
-            args=(generation, file_path),
+            args=(generation, cache_key),
             name='TapSimplerWaveform',
         )
         worker.daemon = True
         worker.start()
 
-    def _poll_simpler_waveform(self, generation, file_path, attempt):
+    def _poll_simpler_waveform(self, generation, cache_key, attempt):
         if generation != self._simpler_waveform_generation:
             return
-        cached = self._simpler_waveform_cache.get(file_path)
+        cached = self._simpler_waveform_cache.get(cache_key)
         if cached:
             self._send_simpler_waveform(generation, cached)
             return
         if attempt < 120:
-            self.schedule_message(5, lambda: self._poll_simpler_waveform(generation, file_path, attempt + 1))
+            self.schedule_message(5, lambda: self._poll_simpler_waveform(generation, cache_key, attempt + 1))
+
+    def _simpler_waveform_cache_key(self, file_path):
+        # Peaks stay valid only while the file's mtime and size are unchanged.
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+        return (file_path, int(stat_result.st_mtime_ns), int(stat_result.st_size))
 
-    def _cache_simpler_waveform(self, file_path, peaks):
+    def _cache_simpler_waveform(self, cache_key, peaks, pyramid=None):
         self._debug_log('Cached Simpler waveform: {} points'.format(len(peaks)))
-        self._simpler_waveform_cache[file_path] = tuple(peaks)
-        if file_path in self._simpler_waveform_cache_order:
-            self._simpler_waveform_cache_order.remove(file_path)
-        self._simpler_waveform_cache_order.append(file_path)
+        self._simpler_waveform_cache[cache_key] = tuple(peaks)
+        if pyramid:
+            self._simpler_waveform_pyramids[cache_key] = pyramid
+        else:
+            self._simpler_waveform_pyramids.pop(cache_key, None)
+        if cache_key in self._simpler_waveform_cache_order:
+            self._simpler_waveform_cache_order.remove(cache_key)
+        self._simpler_waveform_cache_order.append(cache_key)
         while len(self._simpler_waveform_cache_order) > 8:
             oldest = self._simpler_waveform_cache_order.pop(0)
             self._simpler_waveform_cache.pop(oldest, None)
+            self._simpler_waveform_pyramids.pop(oldest, None)
 
-    def _decode_audio_waveform(self, file_path, temp_prefix):
+    def _user_cache_directory(self):
+        """
+        The per-user cache root: ~/Library/Caches on macOS, %LOCALAPPDATA% on
+        Windows and $XDG_CACHE_HOME or ~/.cache elsewhere. The script folder
+        is replaced on updates and may not be writable, so it is never used.
+        """
+        home = os.path.expanduser('~')
+        if sys.platform == 'darwin':
+            root = os.path.join(home, 'Library', 'Caches')
+        elif sys.platform.startswith('win'):
+            root = os.environ.get('LOCALAPPDATA') or os.environ.get('APPDATA') or ''
+        else:
+            root = os.environ.get('XDG_CACHE_HOME') or os.path.join(home, '.cache')
+        if not os.path.isabs(root):
+            root = tempfile.gettempdir()
+        return root
+
+    def _simpler_waveform_disk_cache_directory(self):
+        return os.path.join(
+            self._user_cache_directory(),
+            self.SIMPLER_WAVEFORM_DISK_CACHE_APP_DIRECTORY,
+            self.SIMPLER_WAVEFORM_DISK_CACHE_DIRECTORY,
+        )
+
+    def _simpler_waveform_disk_cache_path(self, cache_key):
+        path_bytes = cache_key[0].encode('utf-8', errors='surrogateescape')
+        return os.path.join(
+            self._simpler_waveform_disk_cache_directory(),
+            hashlib.sha1(path_bytes).hexdigest() + self.SIMPLER_WAVEFORM_DISK_CACHE_EXTENSION,
+        )
+
+    def _read_simpler_waveform_disk_cache(self, cache_key):
+        cache_path = self._simpler_waveform_disk_cache_path(cache_key)
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                data = cache_file.read()
+        except OSError:
+            return None
+        header = self.SIMPLER_WAVEFORM_DISK_CACHE_HEADER
+        if len(data) < header.size:
+            return None
+        magic, version, mtime_ns, file_size, path_length, peak_count, bin_count = header.unpack_from(data, 0)
+        path_bytes = cache_key[0].encode('utf-8', errors='surrogateescape')
+        peaks_start = header.size + path_length
+        bins_start = peaks_start + peak_count
+        if (
+            magic != self.SIMPLER_WAVEFORM_DISK_CACHE_MAGIC or
+            version != self.SIMPLER_WAVEFORM_DISK_CACHE_VERSION or
+            mtime_ns != cache_key[1] or
+            file_size != cache_key[2] or
+            data[header.size:peaks_start] != path_bytes or
+            len(data) != bins_start + bin_count * 2
+        ):
+            return None
+        try:
+            # The file's mtime is its least-recently-used timestamp.
+            os.utime(cache_path, None)
+        except OSError:
+            pass
+        if not bin_count:
+            return tuple(data[peaks_start:bins_start]), None, None
+        return (
+            tuple(data[peaks_start:bins_start]),
+            array.array('b', data[bins_start:bins_start + bin_count]),
+            array.array('b', data[bins_start + bin_count:]),
+        )
+
+    def _write_simpler_waveform_disk_cache(self, cache_key, peaks, minimums=None, maximums=None):
+        directory = self._simpler_waveform_disk_cache_directory()
+        cache_path = self._simpler_waveform_disk_cache_path(cache_key)
+        path_bytes = cache_key[0].encode('utf-8', errors='surrogateescape')
+        peak_bytes = bytes(max(0, min(127, int(peak))) for peak in peaks[:65535])
+        if len(path_bytes) > 65535:
+            return
+        bin_bytes = b''
+        bin_count = 0
+        if minimums and maximums and len(minimums) == len(maximums):
+            bin_count = len(minimums)
+            bin_bytes = array.array('b', minimums).tobytes() + array.array('b', maximums).tobytes()
+        data = self.SIMPLER_WAVEFORM_DISK_CACHE_HEADER.pack(
+            self.SIMPLER_WAVEFORM_DISK_CACHE_MAGIC,
+            self.SIMPLER_WAVEFORM_DISK_CACHE_VERSION,
+            cache_key[1],
+            cache_key[2],
+            len(path_bytes),
+            len(peak_bytes),
+            bin_count,
+        ) + path_bytes + peak_bytes + bin_bytes
+        temp_path = cache_path + '.tmp'
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(data)
+            os.replace(temp_path, cache_path)
+        except OSError as error:
+            self._debug_log('Simpler waveform cache write failed: {}'.format(str(error)))
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+        self._evict_simpler_waveform_disk_cache(directory)
+
+    def _evict_simpler_waveform_disk_cache(self, directory):
+        entries = []
+        total_size = 0
+        try:
+            for name in os.listdir(directory):
+                if not name.endswith(self.SIMPLER_WAVEFORM_DISK_CACHE_EXTENSION):
+                    continue
+                entry_path = os.path.join(directory, name)
+                stat_result = os.stat(entry_path)
+                entries.append((stat_result.st_mtime, stat_result.st_size, entry_path))
+                total_size += stat_result.st_size
+        except OSError:
+            return
+        entries.sort()
+        while entries and total_size > self.SIMPLER_WAVEFORM_DISK_CACHE_MAX_BYTES:
+            _, entry_size, entry_path = entries.pop(0)
+            try:
+                os.remove(entry_path)
+                total_size -= entry_size
+            except OSError:
+                pass
+
+    def _pcm_audio_layout(self, audio_file):
+        """
+        Parse a RIFF/WAVE or FORM/AIFF(-C) header. Returns (channels,
+        sample_width, little_endian, is_float, unsigned_8bit, data_offset,
+        data_size), or None for anything that is not plain PCM or float.
+        """
+        header = audio_file.read(12)
+        if len(header) < 12:
+            return None
+        if header[:4] == b'RIFF' and header[8:12] == b'WAVE':
+            chunk_byte_order = '<'
+        elif header[:4] == b'FORM' and header[8:12] in (b'AIFF', b'AIFC'):
+            chunk_byte_order = '>'
+        else:
+            return None
+        file_size = os.fstat(audio_file.fileno()).st_size
+        layout = None
+        data_offset = None
+        data_size = 0
+        while True:
+            chunk_header = audio_file.read(8)
+            if len(chunk_header) < 8:
+                break
+            chunk_id = chunk_header[:4]
+            chunk_size = struct.unpack(chunk_byte_order + 'I', chunk_header[4:])[0]
+            chunk_start = audio_file.tell()
+            if chunk_id == b'fmt ':
+                chunk = audio_file.read(min(chunk_size, 64))
+                if len(chunk) < 16:
+                    return None
+                format_tag, channels, _, _, _, bits = struct.unpack_from('<HHIIHH', chunk, 0)
+                if format_tag == 0xFFFE and len(chunk) >= 26:
+                    # WAVE_FORMAT_EXTENSIBLE carries the real tag in its sub-format GUID.
+                    format_tag = struct.unpack_from('<H', chunk, 24)[0]
+                if format_tag == 1 and bits in (8, 16, 24, 32):
+                    layout = (channels, bits // 8, True, False, bits == 8)
+                elif format_tag == 3 and bits in (32, 64):
+                    layout = (channels, bits // 8, True, True, False)
+                else:
+                    return None
+            elif chunk_id == b'COMM':
+                chunk = audio_file.read(min(chunk_size, 64))
+                if len(chunk) < 18:
+                    return None
+                channels, _, bits = struct.unpack_from('>hIh', chunk, 0)
+                compression = chunk[18:22] if header[8:12] == b'AIFC' and len(chunk) >= 22 else b'NONE'
+                if compression == b'NONE' and bits in (8, 16, 24, 32):
+                    layout = (channels, (bits + 7) // 8, False, False, False)
+                elif compression == b'sowt' and bits in (16, 24, 32):
+                    layout = (channels, (bits + 7) // 8, True, False, False)
+                elif compression in (b'fl32', b'FL32'):
+                    layout = (channels, 4, False, True, False)
+                elif compression in (b'fl64', b'FL64'):
+                    layout = (channels, 8, False, True, False)
+                else:
+                    return None
+            elif chunk_id == b'data':
+                data_offset = chunk_start
+                data_size = min(chunk_size, file_size - chunk_start)
+            elif chunk_id == b'SSND':
+                chunk = audio_file.read(8)
+                if len(chunk) < 8:
+                    return None
+                sound_offset = struct.unpack('>I', chunk[:4])[0]
+                data_offset = chunk_start + 8 + sound_offset
+                data_size = min(chunk_size - 8 - sound_offset, file_size - data_offset)
+            if layout is not None and data_offset is not None:
+                break
+            audio_file.seek(chunk_start + chunk_size + (chunk_size & 1))
+        if layout is None or data_offset is None or layout[0] <= 0:
+            return None
+        return layout + (data_offset, max(0, data_size))
+
+    def _pcm_min_max(self, fragment, sample_width, little_endian, is_float, unsigned_8bit):
+        if unsigned_8bit:
+            fragment = fragment.translate(self.UNSIGNED_8BIT_TO_SIGNED)
+        if is_float:
+            values = array.array('f' if sample_width == 4 else 'd', fragment)
+            if little_endian != (sys.byteorder == 'little'):
+                values.byteswap()
+            return min(values), max(values)
+        if audioop is not None:
+            if not little_endian and sample_width > 1:
+                fragment = audioop.byteswap(fragment, sample_width)
+            return audioop.minmax(fragment, sample_width)
+        if sample_width == 3:
+            # Widen 24-bit samples into the top bytes of little-endian int32s.
+            padded = bytearray(len(fragment) // 3 * 4)
+            if little_endian:
+                padded[1::4] = fragment[0::3]
+                padded[2::4] = fragment[1::3]
+                padded[3::4] = fragment[2::3]
+            else:
+                padded[1::4] = fragment[2::3]
+                padded[2::4] = fragment[1::3]
+                padded[3::4] = fragment[0::3]
+            fragment = padded
+            sample_width = 4
+            little_endian = True
+        values = array.array({1: 'b', 2: 'h', 4: 'i'}[sample_width], fragment)
+        if sample_width > 1 and little_endian != (sys.byteorder == 'little'):
+            values.byteswap()
+        return min(values), max(values)
+
+    def _decode_pcm_waveform_bins(self, file_path):
+        """
+        Stream min/max bins out of an uncompressed WAV/AIFF file in fixed-size
+        blocks. Bins are a power-of-two number of frames wide, starting at
+        SIMPLER_WAVEFORM_MIN_BIN_FRAMES and doubling until at most
+        SIMPLER_WAVEFORM_MAX_BINS are needed. Returns (minimums, maximums), or
+        None for formats this reader does not handle.
+        """
+        with open(file_path, 'rb') as audio_file:
+            layout = self._pcm_audio_layout(audio_file)
+            if layout is None:
+                return None
+            channels, sample_width, little_endian, is_float, unsigned_8bit, data_offset, data_size = layout
+            frame_size = channels * sample_width
+            frame_count = data_size // frame_size
+            if frame_count <= 0:
+                return None
+            bin_frames = self.SIMPLER_WAVEFORM_MIN_BIN_FRAMES
+            while (frame_count + bin_frames - 1) // bin_frames > self.SIMPLER_WAVEFORM_MAX_BINS:
+                bin_frames *= 2
+            bin_count = (frame_count + bin_frames - 1) // bin_frames
+            minimums = [0] * bin_count
+            maximums = [0] * bin_count
+            block_frames = max(bin_frames, self.AUDIO_PEAK_BLOCK_BYTES // frame_size // bin_frames * bin_frames)
+            audio_file.seek(data_offset)
+            frame_index = 0
+            while frame_index < frame_count:
+                data = audio_file.read(min(block_frames, frame_count - frame_index) * frame_size)
+                block_frame_count = len(data) // frame_size
+                if block_frame_count <= 0:
+                    break
+                # Blocks are whole bins, so each bin is measured in one call.
+                for offset in range(0, block_frame_count, bin_frames):
+                    bin_index = (frame_index + offset) // bin_frames
+                    minimums[bin_index], maximums[bin_index] = self._pcm_min_max(
+                        data[offset * frame_size:(offset + bin_frames) * frame_size],
+                        sample_width,
+                        little_endian,
+                        is_float,
+                        unsigned_8bit,
+                    )
+                frame_index += block_frame_count
+        return minimums, maximums
+
+    def _normalized_waveform_bins(self, minimums, maximums):
+        """Scale raw bins to -127..127 and derive the overview peak list from them."""
+        maximum_peak = max(max(maximums), -min(minimums)) if maximums else 0
+        if maximum_peak > 0:
+            scale = 127.0 / maximum_peak
+            minimums = [max(-127, min(127, int(round(float(value) * scale)))) for value in minimums]
+            maximums = [max(-127, min(127, int(round(float(value) * scale)))) for value in maximums]
+        else:
+            minimums = [0] * len(minimums)
+            maximums = [0] * len(maximums)
+        bin_count = len(maximums)
+        point_count = max(1, min(self.SIMPLER_WAVEFORM_POINT_COUNT, bin_count))
+        peaks = []
+        for point_index in range(point_count):
+            start = point_index * bin_count // point_count
+            end = max(start + 1, (point_index + 1) * bin_count // point_count)
+            peaks.append(max(max(maximums[start:end]), -min(minimums[start:end])))
+        return peaks, minimums, maximums
+
+    def _decode_converted_waveform_bins(self, file_path, temp_prefix):
         temp_directory = tempfile.mkdtemp(prefix=temp_prefix)
         converted_path = os.path.join(temp_directory, 'waveform.wav')
-        peaks = []
         try:
             subprocess.run(
-                ['/usr/bin/afconvert', '-f', 'WAVE', '-d', 'LEI16@4000', '-c', '1', file_path, converted_path],
+                [self.AFCONVERT_PATH, '-f', 'WAVE', '-d', 'LEI16@4000', '-c', '1', file_path, converted_path],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 check=True,
                 timeout=120,
             )
-            with wave.open(converted_path, 'rb') as audio_file:
-                frame_count = audio_file.getnframes()
-                point_count = max(1, min(512, frame_count))
-                for point_index in range(point_count):
-                    end_frame = int(round(float(point_index + 1) * frame_count / point_count))
-                    frames_to_read = max(1, end_frame - audio_file.tell())
-                    frame_data = audio_file.readframes(frames_to_read)
-                    if not frame_data:
-                        peaks.append(0)
-                    elif audioop is not None:
-                        peaks.append(audioop.max(frame_data, 2))
-                    else:
-                        maximum = 0
-                        for byte_index in range(0, len(frame_data) - 1, 2):
-                            value = int.from_bytes(frame_data[byte_index:byte_index + 2], 'little', signed=True)
-                            maximum = max(maximum, abs(value))
-                        peaks.append(maximum)
-            maximum_peak = max(peaks) if peaks else 0
-            if maximum_peak > 0:
-                return [max(0, min(127, int(round(float(value) * 127.0 / maximum_peak)))) for value in peaks]
-            return [0 for _ in peaks]
+            return self._decode_pcm_waveform_bins(converted_path)
         except Exception as error:
             self._debug_log('Waveform decode failed for {}: {}'.format(file_path, str(error)))
-            return self._simpler_waveform_from_asd(file_path)
+            return None
         finally:
             shutil.rmtree(temp_directory, ignore_errors=True)
 
-    def _build_simpler_waveform(self, generation, file_path):
-        pending_key = (generation, file_path)
+    def _decode_audio_waveform(self, file_path, temp_prefix):
+        """
+        Returns (peaks, minimums, maximums). The min/max bins are None when only
+        Live's .asd overview was available.
+        """
+        try:
+            bins = self._decode_pcm_waveform_bins(file_path)
+        except Exception as error:
+            self._debug_log('PCM waveform decode failed for {}: {}'.format(file_path, str(error)))
+            bins = None
+        # Compressed formats (FLAC, MP3, AAC, ...) still need Core Audio.
+        if bins is None and os.path.isfile(self.AFCONVERT_PATH):
+            bins = self._decode_converted_waveform_bins(file_path, temp_prefix)
+        if bins is None:
+            return self._simpler_waveform_from_asd(file_path), None, None
+        return self._normalized_waveform_bins(*bins)
+
+    def _build_simpler_waveform(self, generation, cache_key):
+        pending_key = (generation, cache_key)
         with self._simpler_waveform_lock:
             if generation != self._simpler_waveform_generation:
                 self._simpler_waveform_pending.discard(pending_key)
                 return
-            peaks = self._decode_audio_waveform(file_path, 'tap-simpler-')
+            peaks, minimums, maximums = self._decode_audio_waveform(cache_key[0], 'tap-simpler-')
+            if peaks:
+                self._write_simpler_waveform_disk_cache(cache_key, peaks, minimums, maximums)
             if not peaks or generation != self._simpler_waveform_generation:
                 self._simpler_waveform_pending.discard(pending_key)
                 return
-            self._cache_simpler_waveform(file_path, peaks)
+            self._cache_simpler_waveform(cache_key, peaks, self._simpler_waveform_pyramid(minimums, maximums))
             self._simpler_waveform_pending.discard(pending_key)
 
     def _simpler_waveform_from_asd(self, file_path):
@@ -6082,10 +6638,7 @@ class Tap(ControlSurface):
             # instead of immediately, so the framework has time to finish
             # remapping parameters to the new device.
             if self.mixer_status:
-                if hasattr(self, '_mixer_disconnect_timer') and self._mixer_disconnect_timer:
-                    self._mixer_disconnect_timer.cancel()
-                self._mixer_disconnect_timer = threading.Timer(0.2, self._disconnect_device_controls)
-                self._mixer_disconnect_timer.start()
+                self._schedule_task('mixer_disconnect', 0.2, self._disconnect_device_controls)
 
         else:
             self._set_simpler_device(None)
@@ -6273,9 +6826,6 @@ class Tap(ControlSurface):
                     midi_note_number = 3
                     self.send_note_on(midi_note_number, channel, pad_number)
                     
-                    if hasattr(self, '_metadata_recheck_timer') and self._metadata_recheck_timer:
-                        self._metadata_recheck_timer.cancel()
-                    
                     self._drum_pad_change_recheck_count = 0
                     self._last_drum_pad_metadata = None
                     self._last_sent_metadata = None
@@ -6286,8 +6836,7 @@ class Tap(ControlSurface):
                     
                     # Kick off a metadata recheck loop to wait for full pad loading
                     self._debug_log("Drum pad change: starting metadata recheck loop")
-                    self._metadata_recheck_timer = threading.Timer(0.1, self._recheck_parameter_metadata)
-                    self._metadata_recheck_timer.start()
+                    self._schedule_task('parameter_metadata_recheck', 0.1, self._recheck_parameter_metadata)
             else:
                 self._debug_log("No drum pad selected")
             
@@ -6497,9 +7046,10 @@ class Tap(ControlSurface):
         name_string = self._sanitize_sysex_text(name_string)
         data = name_string.encode('ascii', errors='ignore')
         max_chunk_length = 240
+        packets = []
         if len(data) <= max_chunk_length:
             sys_ex_message = (status_byte, manufacturer_id, device_id) + tuple(data) + (end_byte, )
-            self._send_midi(sys_ex_message)
+            packets.append(sys_ex_message)
         else:
             num_of_chunks = (len(data) + max_chunk_length - 1) // max_chunk_length
             for chunk_index in range(num_of_chunks):
@@ -6511,7 +7061,58 @@ class Tap(ControlSurface):
                 chunk_data = prefix.encode('ascii') + data[start_index:end_index]
 
                 sys_ex_message = (status_byte, manufacturer_id, device_id) + tuple(chunk_data) + (end_byte, )
-                self._send_midi(sys_ex_message)
+                packets.append(sys_ex_message)
+
+        key = None
+        if manufacturer_id in self.COALESCED_SYSEX_IDS:
+            key = ('sysex', manufacturer_id)
+        elif manufacturer_id in self.COALESCED_SYSEX_FIELD_IDS:
+            key = ('sysex', manufacturer_id, name_string.split('|', 1)[0])
+        # A chunked message is queued as one entry so it is kept or dropped whole.
+        self._queue_outbound_midi(tuple(packets), key)
+
+    def _send_midi(self, midi_event_bytes, optimized=None):
+        key = None
+        if len(midi_event_bytes) == 3 and (midi_event_bytes[0] & 0xF0) == 0xB0:
+            key = ('cc', midi_event_bytes[0], midi_event_bytes[1])
+        self._queue_outbound_midi((midi_event_bytes,), key, optimized)
+        return True
+
+    def _queue_outbound_midi(self, packets, key=None, optimized=None):
+        """
+        Queue packets for the end of the current tick. A later entry with the
+        same key supersedes the queued one, which is then dropped unsent.
+        """
+        if getattr(self, '_outbound_midi_frame', None) is None:
+            # ControlSurface.__init__ and disconnect send before/after the frame exists.
+            for packet in packets:
+                ControlSurface._send_midi(self, packet, optimized)
+            return
+        entry = [packets, optimized]
+        if key is not None:
+            previous = self._outbound_midi_frame_keys.get(key)
+            if previous is not None:
+                previous[0] = None
+                self._outbound_midi_counters["dropped"] += 1
+            self._outbound_midi_frame_keys[key] = entry
+        self._outbound_midi_frame.append(entry)
+
+    def _flush_outbound_midi_frame(self):
+        frame = self._outbound_midi_frame
+        if not frame:
+            return
+        self._outbound_midi_frame = []
+        self._outbound_midi_frame_keys = {}
+        for packets, optimized in frame:
+            if packets is None:
+                continue
+            for packet in packets:
+                ControlSurface._send_midi(self, packet, optimized)
+            self._outbound_midi_counters["sent"] += 1
+
+    def outbound_midi_counters(self):
+        """Messages sent and superseded-and-dropped since the script started."""
+        return dict(self._outbound_midi_counters)
 
     def _initialize_buttons(self):
         transport.set_metronome_button(ButtonElement(1, MIDI_CC_TYPE, 0, 58))
@@ -6946,26 +7547,19 @@ class Tap(ControlSurface):
         # while the timer is pending
         self._last_automation_signature = current_signature
         
-        with self._automation_timer_lock:
-            if self._automation_metadata_update_timer:
-                self._automation_metadata_update_timer.cancel()
-        
         self._automation_metadata_device_id = id(selected_device)
         self._automation_metadata_retry_count = 0
         self._automation_metadata_retry_start = time.time()
         seq_at_schedule = self._metadata_send_seq_by_device.get(id(selected_device), 0)
-        new_timer = threading.Timer(
+        self._schedule_task(
+            'automation_metadata_refresh',
             0.05,
             self._send_refreshed_parameter_metadata,
-            args=[selected_device, seq_at_schedule]
+            selected_device,
+            seq_at_schedule,
         )
-        with self._automation_timer_lock:
-            self._automation_metadata_update_timer = new_timer
-        new_timer.start()
 
     def _send_refreshed_parameter_metadata(self, selected_device, seq_at_schedule=0):
-        with self._automation_timer_lock:
-            self._automation_metadata_update_timer = None
         if not selected_device or not liveobj_valid(selected_device):
             return
         if self._metadata_send_seq_by_device.get(id(selected_device), 0) != seq_at_schedule:
@@ -6985,14 +7579,13 @@ class Tap(ControlSurface):
                     seq_at_schedule = self._metadata_send_seq_by_device.get(id(selected_device), seq_at_schedule)
                 if self._automation_metadata_retry_count < 3 and elapsed < 0.3:
                     self._automation_metadata_retry_count += 1
-                    new_timer = threading.Timer(
+                    self._schedule_task(
+                        'automation_metadata_refresh',
                         0.05,
                         self._send_refreshed_parameter_metadata,
-                        args=[selected_device, seq_at_schedule]
+                        selected_device,
+                        seq_at_schedule,
                     )
-                    with self._automation_timer_lock:
-                        self._automation_metadata_update_timer = new_timer
-                    new_timer.start()
                 return
 
             cached_metadata = self._get_cached_metadata(selected_device)
@@ -7019,14 +7612,13 @@ class Tap(ControlSurface):
                     elapsed = time.time() - self._automation_metadata_retry_start
                 if self._automation_metadata_retry_count < 3 and elapsed < 0.3:
                     self._automation_metadata_retry_count += 1
-                    new_timer = threading.Timer(
+                    self._schedule_task(
+                        'automation_metadata_refresh',
                         0.05,
                         self._send_refreshed_parameter_metadata,
-                        args=[selected_device, seq_at_schedule]
+                        selected_device,
+                        seq_at_schedule,
                     )
-                    with self._automation_timer_lock:
-                        self._automation_metadata_update_timer = new_timer
-                    new_timer.start()
                 else:
                     self._automation_metadata_retry_count = 0
                     self._automation_metadata_retry_start = None
@@ -7036,12 +7628,14 @@ class Tap(ControlSurface):
                 self._automation_metadata_retry_start = None
 
     def _schedule_parameter_metadata_resend(self, selected_device, metadata, seq_at_schedule):
-        timer = threading.Timer(
+        self._schedule_task(
+            'parameter_metadata_resend',
             0.1,
             self._resend_parameter_metadata_if_current,
-            args=[selected_device, metadata, seq_at_schedule]
+            selected_device,
+            metadata,
+            seq_at_schedule,
         )
-        timer.start()
 
     def _resend_parameter_metadata_if_current(self, selected_device, metadata, seq_at_schedule):
         try:
@@ -7074,10 +7668,7 @@ class Tap(ControlSurface):
         self._automation_metadata_retry_count = 0
         self._automation_metadata_retry_start = None
         self._last_automation_signature = None
-        
-        if self._automation_metadata_update_timer:
-            self._automation_metadata_update_timer.cancel()
-            self._automation_metadata_update_timer = None
+        self._cancel_task('automation_metadata_refresh')
 
     def _readd_disabled_parameter_listeners(self):
         if not hasattr(self, '_device') or not liveobj_valid(self._device):
@@ -7159,12 +7750,56 @@ class Tap(ControlSurface):
 
     def _start_periodic_execution(self):
         self.periodic_timer = 1
-        if self._periodic_timer_ref is None or not self._periodic_timer_ref.is_alive():
+        if not self._task_is_scheduled('periodic_check'):
             self._periodic_execution()
 
+    def _schedule_task(self, name, delay, callback, *args):
+        """
+        Run callback(*args) on Live's main thread once delay seconds have
+        passed. Scheduling a name that is already pending replaces it.
+        """
+        self._scheduled_tasks[name] = (time.monotonic() + max(0.0, delay), callback, args)
+
+    def _cancel_task(self, name):
+        """Cancel the named task, or every (name, ...) task of a group."""
+        for task_name in list(self._scheduled_tasks):
+            if task_name == name or (isinstance(task_name, tuple) and task_name[0] == name):
+                del self._scheduled_tasks[task_name]
+
+    def _task_is_scheduled(self, name):
+        return name in self._scheduled_tasks
+
+    def _run_scheduled_tasks(self):
+        if not self._scheduled_tasks:
+            return
+        now = time.monotonic()
+        due = sorted(
+            (deadline, index, name)
+            for index, (name, (deadline, _, _)) in enumerate(list(self._scheduled_tasks.items()))
+            if deadline <= now
+        )
+        for deadline, _, name in due:
+            task = self._scheduled_tasks.get(name)
+            # A task run earlier in this pass may have cancelled or re-armed it.
+            if task is None or task[0] != deadline:
+                continue
+            del self._scheduled_tasks[name]
+            try:
+                task[1](*task[2])
+            except Exception as error:
+                self._debug_log('Scheduled task {} failed: {}'.format(name, str(error)))
+
     def update_display(self):
         ControlSurface.update_display(self)
-        if not self.was_initialized or not self._clip_position_feedback_enabled:
+        self._run_scheduled_tasks()
+        self._send_tick_feedback()
+        self._flush_outbound_midi_frame()
+
+    def _send_tick_feedback(self):
+        if not self.was_initialized:
+            return
+        self._flush_clip_slot_deltas()
+        if not self._clip_position_feedback_enabled:
             return
 
         now = time.monotonic()
@@ -7287,8 +7922,7 @@ class Tap(ControlSurface):
     def _periodic_execution(self):
         self._periodic_check()
         if self.periodic_timer == 1:
-            self._periodic_timer_ref = threading.Timer(0.3, self._periodic_execution)
-            self._periodic_timer_ref.start()
+            self._schedule_task('periodic_check', 0.3, self._periodic_execution)
 
     def _periodic_check(self):
         if self.was_initialized:
@@ -7306,11 +7940,6 @@ class Tap(ControlSurface):
             return
         self._send_track_simpler_slice_state()
         self._send_group_fold_states_if_changed()
-        # update clip slots
-        # we only need to update clip slots periodically when we are in clip slots view
-        # meaning not in the device view
-        if self.device_status is False:
-            self._update_clip_slots()
 
     def _has_follow_action_runtime_work(self):
         return bool(
@@ -7333,6 +7962,7 @@ class Tap(ControlSurface):
 
     def _ensure_song_listeners(self, song):
         self._ensure_song_listener(song, "tracks", self._on_tracks_changed)
+        self._ensure_song_listener(song, "scenes", self._on_clip_grid_scenes_changed)
         self._ensure_song_listener(song, "scale_name", self._on_scale_changed)
         self._ensure_song_listener(song, "root_note", self._on_scale_changed)
         self._ensure_song_listener(song, "tempo", self._update_tempo)
@@ -8060,14 +8690,59 @@ class Tap(ControlSurface):
             return None
         return self._decode_decoupled_automation_payload(matches[-1])
 
+    def _parse_clip_name_marker(self, kind, name):
+        if kind == "mutator":
+            return self._mutator_info_from_name(name, resolve_scale_root=False)
+        if kind == "decoupled":
+            return self._decoupled_automation_info_from_name(name)
+        if kind == "follow":
+            return self._follow_action_rule_from_name(name, None, None, None)
+        return None
+
+    def _clip_name_marker(self, live_object, kind):
+        """
+        Return the parsed "mutator", "decoupled" or "follow" marker in a clip
+        or scene name as a read-only record, or None. Records are cached per
+        object and raw name; the name listeners drop an object's entry.
+        """
+        if live_object is None or not hasattr(live_object, "name"):
+            return None
+        try:
+            name = str(live_object.name or "")
+        except Exception:
+            return None
+        key = self._live_object_identity(live_object)
+        entry = self._clip_name_marker_cache.get(key)
+        if entry is None or entry[0] != name:
+            while len(self._clip_name_marker_cache) >= self.CLIP_NAME_MARKER_CACHE_SIZE:
+                self._clip_name_marker_cache.pop(next(iter(self._clip_name_marker_cache)))
+            entry = (name, {})
+            self._clip_name_marker_cache[key] = entry
+        records = entry[1]
+        if kind not in records:
+            record = self._parse_clip_name_marker(kind, name)
+            records[kind] = MappingProxyType(record) if record else None
+        return records[kind]
+
+    def _invalidate_clip_name_marker(self, key):
+        self._clip_name_marker_cache.pop(key, None)
+
+    def _copied_marker_record(self, value):
+        """Deep-copy a cached marker record into plain, mutable containers."""
+        if isinstance(value, (dict, MappingProxyType)):
+            return {key: self._copied_marker_record(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._copied_marker_record(item) for item in value]
+        if isinstance(value, tuple):
+            return tuple(self._copied_marker_record(item) for item in value)
+        return value
+
     def _decoupled_automation_info(self, clip, device_param=None):
         try:
-            if clip is None or not hasattr(clip, "name"):
-                return None
-            info = self._decoupled_automation_info_from_name(clip.name)
-            if not info:
+            record = self._clip_name_marker(clip, "decoupled")
+            if not record:
                 return None
-            info = dict(info)
+            info = self._copied_marker_record(record)
             max_physical_length = self._decoupled_automation_max_physical_length(clip, info["note_length"])
             info["physical_length"] = self._decoupled_physical_length(info["note_length"], info["automation_lengths"].values(), max_physical_length)
             info["physical_end"] = info["note_start"] + info["physical_length"]
@@ -8195,21 +8870,27 @@ class Tap(ControlSurface):
             }
             info.update(operation_depths)
             if resolve_scale_root:
-                live_scale_index, live_root = self._current_mutator_scale_root(
-                    info.get("scale_index", 2),
-                    info.get("root", 0)
-                )
-                info["scale_index"] = live_scale_index
-                info["root"] = live_root
+                self._resolve_mutator_info_scale_root(info)
             return info
         except Exception:
             return None
 
+    def _resolve_mutator_info_scale_root(self, info):
+        live_scale_index, live_root = self._current_mutator_scale_root(
+            info.get("scale_index", 2),
+            info.get("root", 0)
+        )
+        info["scale_index"] = live_scale_index
+        info["root"] = live_root
+
     def _mutator_info(self, clip):
-        if clip is None or not hasattr(clip, "name"):
+        record = self._clip_name_marker(clip, "mutator")
+        if not record:
             return None
-        info = self._mutator_info_from_name(clip.name)
-        if not info:
+        info = self._copied_marker_record(record)
+        try:
+            self._resolve_mutator_info_scale_root(info)
+        except Exception:
             return None
         if not info.get("sections"):
             original_loop_length = max(0.0001, float(info.get("original_loop_length", 0.0001)))
@@ -8226,10 +8907,11 @@ class Tap(ControlSurface):
         return info
 
     def _mutator_source_note_range(self, clip):
-        info = self._mutator_info(clip)
+        # Only raw marker fields are needed, so read the cached records directly.
+        info = self._clip_name_marker(clip, "mutator")
         if not info:
             return None
-        decoupled_info = self._decoupled_automation_info(clip)
+        decoupled_info = self._clip_name_marker(clip, "decoupled")
         source_start = decoupled_info["note_start"] if decoupled_info else float(getattr(clip, "loop_start", 0.0))
         original_loop_length = max(
             0.0001,
@@ -8336,10 +9018,10 @@ class Tap(ControlSurface):
 
             for _, _, clip_slot in self._mutator_clip_slots():
                 clip = clip_slot.clip
-                raw_info = self._mutator_info_from_name(clip.name, resolve_scale_root=False)
+                raw_info = self._clip_name_marker(clip, "mutator")
                 if not raw_info:
                     continue
-                info = dict(raw_info)
+                info = self._copied_marker_record(raw_info)
                 scale_root_changed = (
                     int(info.get("scale_index", 2)) != scale_index
                     or int(info.get("root", 0)) != root
@@ -8352,10 +9034,8 @@ class Tap(ControlSurface):
                     continue
 
                 key = self._live_object_identity(clip)
-                settings = self._mutator_settings_from_info(
-                    info,
-                    seed=random.randint(1, 2000000000)
-                )
+                # Keep the clip's seed, so switching back to a scale is a memo hit.
+                settings = self._mutator_settings_from_info(info)
                 if self._mutator_generation_is_busy(key):
                     self._queue_mutator_generation(key, clip, settings, previous_info=info, send_updates=True)
                 elif not self._schedule_mutator_generation(key, clip, settings, previous_info=info, send_updates=True):
@@ -8755,6 +9435,27 @@ class Tap(ControlSurface):
         except Exception:
             return False
 
+    def _folded_note_bucket(self, pitch, folded_time):
+        # Buckets are twice _note_matches_folded_time's default epsilon wide,
+        # so every match lies in the same or a neighbouring bucket.
+        return int(pitch), int(math.floor(folded_time / 0.001))
+
+    def _index_notes_by_folded_time(self, notes, info):
+        buckets = {}
+        for note in notes:
+            bucket = self._folded_note_bucket(note.pitch, self._folded_note_time(note.start_time, info))
+            buckets.setdefault(bucket, []).append(note)
+        return buckets
+
+    def _notes_matching_folded_time(self, buckets, folded_time, info, pitch):
+        pitch, bucket_index = self._folded_note_bucket(pitch, folded_time)
+        matches = []
+        for neighbour in (bucket_index - 1, bucket_index, bucket_index + 1):
+            for note in buckets.get((pitch, neighbour), ()):
+                if self._note_matches_folded_time(note, folded_time, info, pitch=pitch):
+                    matches.append(note)
+        return matches
+
     def _repeat_count_for_decoupled_info(self, info):
         return max(1, int(round(info["physical_length"] / info["note_length"])))
 
@@ -9076,10 +9777,8 @@ class Tap(ControlSurface):
         if count > 1:
             sample_duration = max(0.0001, length / float(count - 1))
 
-        samples = []
-        for index in range(count):
-            time_value = start + (float(index) * sample_duration)
-            samples.append((time_value, self._automation_value_from_steps(time_value, steps)))
+        times = [start + (float(index) * sample_duration) for index in range(count)]
+        samples = list(zip(times, self._automation_values_from_steps(times, steps)))
 
         return self._automation_sorted_steps(
             (time_value, sample_duration, normalized, 0.0, 0, 0)
@@ -9378,6 +10077,16 @@ class Tap(ControlSurface):
             return None
         return self._decode_follow_action_name_payload(matches[-1], target_kind, track_index, scene_index)
 
+    def _follow_action_rule_for_object(self, live_object, target_kind, track_index, scene_index):
+        record = self._clip_name_marker(live_object, "follow")
+        if not record:
+            return None
+        rule = self._copied_marker_record(record)
+        rule["target_kind"] = target_kind
+        rule["track_index"] = track_index
+        rule["scene_index"] = scene_index
+        return rule
+
     def _follow_action_name_target(self, target_kind, track_index, scene_index):
         try:
             if target_kind == "clip":
@@ -9426,7 +10135,7 @@ class Tap(ControlSurface):
 
         try:
             for scene_index, scene in enumerate(self.song().scenes):
-                rule = self._follow_action_rule_from_name(scene.name, "scene", None, scene_index)
+                rule = self._follow_action_rule_for_object(scene, "scene", None, scene_index)
                 if rule:
                     loaded_rules[self._follow_action_key("scene", None, scene_index)] = rule
 
@@ -9434,7 +10143,7 @@ class Tap(ControlSurface):
                 for scene_index, clip_slot in enumerate(track.clip_slots):
                     if not clip_slot.has_clip:
                         continue
-                    rule = self._follow_action_rule_from_name(clip_slot.clip.name, "clip", track_index, scene_index)
+                    rule = self._follow_action_rule_for_object(clip_slot.clip, "clip", track_index, scene_index)
                     if rule:
                         loaded_rules[self._follow_action_key("clip", track_index, scene_index)] = rule
         except Exception:
@@ -10111,6 +10820,69 @@ class Tap(ControlSurface):
             self.seq_clip_playing_status = new_status
             self.send_cc(self.CLIP_PLAYING_STATUS_CC, self.CLIP_PLAYING_STATUS_CHANNEL, new_status)
 
+    def _build_playhead_note_index(self, clip):
+        """
+        Sorted note-on times for bisection, plus per pitch the sorted start
+        times and the running maximum end time, so "is this pitch still
+        sounding" is a single bisection as well.
+        """
+        raw_notes = self._fetch_clip_notes(clip)
+        notes = sorted(
+            (float(note.start_time), int(note.pitch), float(note.start_time) + float(note.duration))
+            for note in raw_notes
+        )
+        pitch_starts = {}
+        pitch_max_ends = {}
+        for start_time, pitch, end_time in notes:
+            starts = pitch_starts.setdefault(pitch, [])
+            max_ends = pitch_max_ends.setdefault(pitch, [])
+            starts.append(start_time)
+            max_ends.append(max(end_time, max_ends[-1]) if max_ends else end_time)
+        return {
+            "start_times": [note[0] for note in notes],
+            "start_pitches": [note[1] for note in notes],
+            "pitch_starts": pitch_starts,
+            "pitch_max_ends": pitch_max_ends,
+        }
+
+    def _invalidate_playhead_note_index(self):
+        self._playhead_note_index = None
+        self._playhead_clip_notes_inside_range = None
+
+    def _set_playhead_note_index_clip(self, clip):
+        previous_clip = self._playhead_note_index_clip
+        if previous_clip is not None and previous_clip != clip and liveobj_valid(previous_clip):
+            if previous_clip.notes_has_listener(self._invalidate_playhead_note_index):
+                previous_clip.remove_notes_listener(self._invalidate_playhead_note_index)
+        if clip is not None and liveobj_valid(clip):
+            if not clip.notes_has_listener(self._invalidate_playhead_note_index):
+                clip.add_notes_listener(self._invalidate_playhead_note_index)
+        self._playhead_note_index_clip = clip
+        self._playhead_note_index = None
+        self._playhead_clip_notes_inside_range = None
+
+    def _playhead_note_index_for_clip(self, clip):
+        if self._playhead_note_index_clip != clip:
+            self._set_playhead_note_index_clip(clip)
+        if self._playhead_note_index is None:
+            self._playhead_note_index = self._build_playhead_note_index(clip)
+        return self._playhead_note_index
+
+    def _playhead_note_starts_between(self, note_index, start_position, end_position):
+        start_times = note_index["start_times"]
+        low = bisect.bisect_left(start_times, start_position)
+        high = bisect.bisect_right(start_times, end_position)
+        return note_index["start_pitches"][low:high]
+
+    def _playhead_note_is_sounding(self, note_index, pitch, start_position, end_position):
+        # A note of this pitch started at or before start_position and still
+        # ends after end_position.
+        starts = note_index["pitch_starts"].get(pitch)
+        if not starts:
+            return False
+        count = bisect.bisect_right(starts, start_position)
+        return count > 0 and note_index["pitch_max_ends"][pitch][count - 1] > end_position
+
     def _clip_pos_changed(self, clip_index):
         # Only check and send things if we are in device view
         if self.device_status:
@@ -10123,30 +10895,9 @@ class Tap(ControlSurface):
                 if clip_slot is not None and clip_slot.has_clip:
                     clip_playing = clip_slot.clip
                     
-                    clip_start = min(clip_playing.start_time, clip_playing.start_marker, clip_playing.loop_start) - self.clip_length_trick
-                    time_span = (max(clip_playing.loop_end, clip_playing.end_marker, clip_playing.length) + self.clip_length_trick) - clip_start
                     loop_start = clip_playing.loop_start
                     
                     try:
-                        # Get all the notes in the clip
-                        current_raw_notes = clip_playing.get_notes_extended(0, 128, clip_start, time_span)
-                        
-                        # if the current clip has different notes save the new notes.
-                        if current_raw_notes != self.last_raw_notes:
-                            self.last_raw_notes = current_raw_notes
-
-                            # Reset the current clip notes array
-                            self.current_clip_notes = []
-                            # add all the notes to the array
-                            for midi_note in current_raw_notes:
-                                pitch = midi_note.pitch
-                                duration = midi_note.duration
-                                note_start_time = midi_note.start_time
-                                # Process note properties as needed
-                                # self.log_message("Note: Pitch {}, Start Time {}, Duration {}".format(pitch, start_time, duration))
-                                end_time = note_start_time + duration
-                                self.current_clip_notes.append([pitch, note_start_time, end_time])
-
                         # check which notes are playing at position
                         # if we detect changes send them out to app
                         clip_position = clip_playing.playing_position
@@ -10165,6 +10916,9 @@ class Tap(ControlSurface):
                                     self.send_out_playing_pos(self.last_sent_out_playing_pos, 1.0, force=True, hidden=True)
                                 
                         else:
+                            # The note index is rebuilt only after the clip's notes change.
+                            note_index = self._playhead_note_index_for_clip(clip_playing)
+
                             # making sure we have the right starting position, when jumping back to the start of clip or loop
                             if self.last_playing_position > clip_position:
                                 if clip_position >= loop_start:
@@ -10173,36 +10927,20 @@ class Tap(ControlSurface):
                                     self.last_playing_position = clip_playing.start_marker
     
                             # check if currently playing notes are still playing in this playing position
-                            for (note_index, is_playing) in enumerate(self.currently_playing_notes):
-                                if is_playing:
-                                    # Initialize a flag to indicate if a playing note was found
-                                    found_playing_note = False
-    
-                                    # Find the notes that stopped playing in since the last update
-                                    for note in self.current_clip_notes:
-                                        pitch, note_start_time, end_time = note
+                            for (pitch, is_playing) in enumerate(self.currently_playing_notes):
+                                if is_playing and not self._playhead_note_is_sounding(note_index, pitch, self.last_playing_position, clip_position):
+                                    self.currently_playing_notes[pitch] = False
+                                    # send note off for pitch note.
+                                    # self.log_message("Note off: {}".format(pitch))
+                                    self.send_note_off(pitch, 0, 100)
     
-                                        if note_start_time <= self.last_playing_position and clip_position < end_time and pitch == note_index:
-                                            # Note is still playing
-                                            found_playing_note = True
-                                            break
-    
-                                    # If no playing note was found, update the state
-                                    if not found_playing_note:
-                                        self.currently_playing_notes[note_index] = False
-                                        # send note off for note_index note.
-                                        # self.log_message("Note off: {}".format(note_index))
-                                        self.send_note_off(note_index, 0, 100)
-    
-                            # check current clip notes array which notes are on for that playing position
-                            for note in self.current_clip_notes:
-                                pitch, note_start_time, end_time = note
-                                if self.last_playing_position <= note_start_time <= clip_position:
-                                    # note starts playing
-                                    self.currently_playing_notes[pitch] = True
-                                    # send midi note on
-                                    # self.log_message("Note on: {}".format(pitch))
-                                    self.send_note_on(pitch, 0, 100)
+                            # notes that start between the last and the current playing position
+                            for pitch in self._playhead_note_starts_between(note_index, self.last_playing_position, clip_position):
+                                # note starts playing
+                                self.currently_playing_notes[pitch] = True
+                                # send midi note on
+                                # self.log_message("Note on: {}".format(pitch))
+                                self.send_note_on(pitch, 0, 100)
                             # update last playing position
                             self.last_playing_position = clip_position
                     except Exception as e:
@@ -10304,10 +11042,9 @@ class Tap(ControlSurface):
                     pass
 
     def _on_tracks_changed(self):
-        if self._metadata_recheck_timer:
-            self._metadata_recheck_timer.cancel()
-            self._metadata_recheck_timer = None
+        self._cancel_task('parameter_metadata_recheck')
         self._metadata_cache.clear()
+        self._parameter_metadata_fragment_cache.clear()
         self._metadata_send_seq_by_device.clear()
         self._sync_follow_actions_to_track_topology()
         self._update_mixer_and_tracks()
@@ -10669,12 +11406,7 @@ class Tap(ControlSurface):
         self._mixer_automation_state_listeners = []
 
     def _cancel_mixer_automation_status_resends(self):
-        for timer in list(getattr(self, '_mixer_automation_status_timers', [])):
-            try:
-                timer.cancel()
-            except Exception:
-                pass
-        self._mixer_automation_status_timers = []
+        self._cancel_task('mixer_automation_status')
 
     def _schedule_mixer_automation_status_resends(self, send_now=True):
         self._cancel_mixer_automation_status_resends()
@@ -10683,9 +11415,7 @@ class Tap(ControlSurface):
         if not getattr(self, 'mixer_status', False):
             return
         for delay in (0.05, 0.15, 0.35):
-            timer = threading.Timer(delay, self._send_mixer_automation_statuses)
-            self._mixer_automation_status_timers.append(timer)
-            timer.start()
+            self._schedule_task(('mixer_automation_status', delay), delay, self._send_mixer_automation_statuses)
 
     def _mixer_automation_state_for_parameter(self, parameter):
         try:
@@ -10837,26 +11567,42 @@ class Tap(ControlSurface):
         except ValueError:
             return None
 
-    def _make_clip_has_clip_listener(self, track):
+    def _make_clip_has_clip_listener(self, track, clip_slot=None):
+        def listener():
+            self._on_clip_has_clip_changed(track, clip_slot)
+        return listener
+
+    def _make_clip_triggered_listener(self, track, clip_slot=None):
         def listener():
-            self._on_clip_has_clip_changed(track)
+            self._on_clip_playing_status_changed(track, clip_slot)
         return listener
 
-    def _make_clip_triggered_listener(self, track):
+    def _make_clip_playing_listener(self, track, clip_slot=None):
         def listener():
-            self._on_clip_playing_status_changed(track)
+            self._on_clip_playing_status_changed(track, clip_slot)
         return listener
 
-    def _make_clip_playing_listener(self, track):
+    def _make_clip_color_listener(self, track, clip_slot=None):
         def listener():
-            self._on_clip_playing_status_changed(track)
+            self._mark_clip_slot_dirty(track, clip_slot)
         return listener
 
-    def _make_clip_color_listener(self, track):
+    def _make_clip_track_arm_listener(self, track):
         def listener():
-            self._on_clip_has_clip_changed(track)
+            self._mark_track_clip_slots_dirty(track)
         return listener
 
+    def _remove_clip_color_listener(self, clip, listener):
+        if not listener or not liveobj_valid(clip):
+            return
+        if clip.color_has_listener(listener):
+            clip.remove_color_listener(listener)
+        try:
+            if clip.is_recording_has_listener(listener):
+                clip.remove_is_recording_listener(listener)
+        except Exception:
+            pass
+
     def _sync_clip_color_listeners_for_track(self, track):
         for clip_slot in track.clip_slots:
             if clip_slot is None:
@@ -10866,19 +11612,22 @@ class Tap(ControlSurface):
                 previous_clip = self._clip_slot_color_map.get(clip_slot)
                 if previous_clip is not None and previous_clip != current_clip:
                     old_listener = self._clip_color_listeners.pop(previous_clip, None)
-                    if old_listener and liveobj_valid(previous_clip) and previous_clip.color_has_listener(old_listener):
-                        previous_clip.remove_color_listener(old_listener)
+                    self._remove_clip_color_listener(previous_clip, old_listener)
                 if current_clip not in self._clip_color_listeners:
-                    listener = self._make_clip_color_listener(track)
+                    listener = self._make_clip_color_listener(track, clip_slot)
                     self._clip_color_listeners[current_clip] = listener
                     current_clip.add_color_listener(listener)
+                    # Recording ends without a slot playing/triggered change.
+                    try:
+                        current_clip.add_is_recording_listener(listener)
+                    except Exception:
+                        pass
                 self._clip_slot_color_map[clip_slot] = current_clip
             else:
                 previous_clip = self._clip_slot_color_map.pop(clip_slot, None)
                 if previous_clip is not None:
                     old_listener = self._clip_color_listeners.pop(previous_clip, None)
-                    if old_listener and liveobj_valid(previous_clip) and previous_clip.color_has_listener(old_listener):
-                        previous_clip.remove_color_listener(old_listener)
+                    self._remove_clip_color_listener(previous_clip, old_listener)
 
     # clipSlots
     def _register_clip_listeners(self):
@@ -10894,24 +11643,35 @@ class Tap(ControlSurface):
 
                 listener_key = (clip_slot, 'has_clip')
                 if listener_key not in self._clip_slot_listeners:
-                    listener = self._make_clip_has_clip_listener(track)
+                    listener = self._make_clip_has_clip_listener(track, clip_slot)
                     self._clip_slot_listeners[listener_key] = listener
                     clip_slot.add_has_clip_listener(listener)
 
                 listener_key = (clip_slot, 'is_triggered')
                 if listener_key not in self._clip_slot_listeners:
-                    listener = self._make_clip_triggered_listener(track)
+                    listener = self._make_clip_triggered_listener(track, clip_slot)
                     self._clip_slot_listeners[listener_key] = listener
                     clip_slot.add_is_triggered_listener(listener)
 
                 listener_key = (clip_slot, 'is_playing')
                 if listener_key not in self._clip_slot_listeners:
                     try:
-                        listener = self._make_clip_playing_listener(track)
+                        listener = self._make_clip_playing_listener(track, clip_slot)
                         self._clip_slot_listeners[listener_key] = listener
                         clip_slot.add_is_playing_listener(listener)
                     except Exception:
                         pass
+
+            # Armed audio tracks show their empty slots as recordable.
+            if track not in self._clip_track_arm_listeners:
+                try:
+                    if track.can_be_armed:
+                        listener = self._make_clip_track_arm_listener(track)
+                        track.add_arm_listener(listener)
+                        track.add_has_audio_input_listener(listener)
+                        self._clip_track_arm_listeners[track] = listener
+                except Exception:
+                    pass
             
             self._registered_track_ids.add(track_id)
         
@@ -10950,7 +11710,7 @@ class Tap(ControlSurface):
                 if clip_slot.has_clip:
                     listener = self._clip_color_listeners.pop(clip_slot.clip, None)
                     if listener:
-                        clip_slot.clip.remove_color_listener(listener)
+                        self._remove_clip_color_listener(clip_slot.clip, listener)
                     else:
                         clip_slot.clip.remove_color_listener(self._on_clip_has_clip_changed)
                 # if clip_slot.has_clip:
@@ -10963,6 +11723,15 @@ class Tap(ControlSurface):
 
         for return_track, (left_listener, right_listener) in self._return_level_listeners.items():
             self._remove_output_meter_listener_pair(return_track, left_listener, right_listener)
+
+        for track, listener in self._clip_track_arm_listeners.items():
+            try:
+                if liveobj_valid(track) and track.arm_has_listener(listener):
+                    track.remove_arm_listener(listener)
+                if liveobj_valid(track) and track.has_audio_input_has_listener(listener):
+                    track.remove_has_audio_input_listener(listener)
+            except Exception:
+                pass
         
         self._track_level_listeners.clear()
         self._return_level_listeners.clear()
@@ -10970,6 +11739,8 @@ class Tap(ControlSurface):
         self._clip_slot_listeners.clear()
         self._clip_color_listeners.clear()
         self._clip_slot_color_map.clear()
+        self._clip_track_arm_listeners.clear()
+        self._dirty_clip_slots = {}
 
     # def _on_playing_position_changed(self):
     #     # self.log_message("trying to log the playing position")
@@ -10984,13 +11755,16 @@ class Tap(ControlSurface):
 
         return different_indexes
 
-    def _on_clip_playing_status_changed(self, track=None):
+    def _on_clip_playing_status_changed(self, track=None, clip_slot=None):
         # self.log_message("clip playing status changed")
         self._refresh_parameter_metadata_on_automation_change()
         if track:
             track_index = self._get_track_index(track)
             if track_index is not None:
-                self._update_clip_slots(track_index)
+                if clip_slot is not None:
+                    self._mark_clip_slot_dirty(track, clip_slot)
+                else:
+                    self._update_clip_slots(track_index)
                 self._activate_follow_actions_for_playing_clips(track_index)
                 self._evaluate_mutator_regeneration(track_index)
                 return
@@ -11040,8 +11814,9 @@ class Tap(ControlSurface):
                 pass
         return listener
 
-    def _make_follow_action_name_listener(self):
+    def _make_follow_action_name_listener(self, key=None):
         def listener():
+            self._invalidate_clip_name_marker(key)
             self._on_follow_action_name_changed()
         return listener
 
@@ -11142,7 +11917,7 @@ class Tap(ControlSurface):
                     continue
                 self._remove_named_object_listener(self._follow_action_scene_name_listeners, key)
                 try:
-                    listener = self._make_follow_action_name_listener()
+                    listener = self._make_follow_action_name_listener(key)
                     add_listener = getattr(scene, "add_name_listener", None)
                     has_listener = getattr(scene, "name_has_listener", None)
                     if add_listener and (not has_listener or not has_listener(listener)):
@@ -11185,7 +11960,7 @@ class Tap(ControlSurface):
                         continue
                     self._remove_named_object_listener(self._follow_action_clip_name_listeners, clip_key)
                     try:
-                        listener = self._make_follow_action_name_listener()
+                        listener = self._make_follow_action_name_listener(clip_key)
                         add_listener = getattr(clip, "add_name_listener", None)
                         has_listener = getattr(clip, "name_has_listener", None)
                         if add_listener and (not has_listener or not has_listener(listener)):
@@ -11327,19 +12102,71 @@ class Tap(ControlSurface):
             except Exception:
                 self._handled_follow_action_launches.discard(key)
 
-    def _on_clip_has_clip_changed(self, track=None):
+    def _on_clip_has_clip_changed(self, track=None, clip_slot=None):
         # self.log_message("has clip status changed")
         self._refresh_parameter_metadata_on_automation_change()
         if track:
             track_index = self._get_track_index(track)
             if track_index is not None:
-                self._update_clip_slots(track_index)
+                if clip_slot is not None:
+                    self._mark_clip_slot_dirty(track, clip_slot)
+                else:
+                    self._update_clip_slots(track_index)
                 self._sync_clip_color_listeners_for_track(track)
                 self._set_up_notes_playing("clip")
                 return
         self._update_clip_slots()
         self._set_up_notes_playing("clip")
 
+    def _clip_slot_state_string(self, clip_slot, is_armed, has_audio):
+        clip_value = "0"
+        try:
+            if clip_slot.is_triggered:
+                clip_value = "4"
+            elif clip_slot.is_recording:
+                clip_value = "3"
+            elif clip_slot.is_playing:
+                clip_value = "2"
+            elif clip_slot.has_clip:
+                clip_value = "1"
+            elif is_armed and has_audio:
+                clip_value = "5"
+        except Exception:
+            clip_value = "0"
+
+        color_string_value = "0"
+        
+        # this could also just be made to if value == "1", but does not hurt this way
+        if clip_value != "0" and clip_slot.has_clip:
+            # extra test if has clip because group channels don't have a clip but might be triggered etc
+            try:
+                if clip_slot.clip.color is not None:
+                    color_string_value = self._make_color_string(clip_slot.clip.color)
+            except Exception:
+                color_string_value = "0"
+
+        return "{}:{}".format(clip_value, color_string_value)
+
+    def _track_arm_state(self, track):
+        try:
+            return track.arm, track.has_audio_input
+        except Exception:
+            return False, False
+
+    def _track_clip_slot_states(self, track):
+        is_armed, has_audio = self._track_arm_state(track)
+        clip_slots = []
+        try:
+            for clip_slot in track.clip_slots:
+                clip_slots.append(self._clip_slot_state_string(clip_slot, is_armed, has_audio))
+        except Exception:
+            pass
+        return clip_slots
+
+    def _send_track_clip_slots(self, track_index, clip_slots):
+        string_prefix = str(track_index) + "%"
+        self._send_sys_ex_message(string_prefix + "-".join(clip_slots), 0x05)
+
     def _update_clip_slots(self, only_track_index=None):
         try:
             track_clips = []
@@ -11348,71 +12175,23 @@ class Tap(ControlSurface):
                 only_track_index = None
             for track_index, track in enumerate(tracks):
                 if only_track_index is not None and track_index != only_track_index:
-                    track_clips.append(self.old_clips_array[track_index] if track_index < len(self.old_clips_array) else "")
+                    track_clips.append(self.old_clips_array[track_index] if track_index < len(self.old_clips_array) else [])
                     continue
-                try:
-                    is_armed = track.arm
-                    has_audio = track.has_audio_input
-                except Exception:
-                    is_armed = False
-                    has_audio = False
-                # track clip slots
-                clip_slots = []
-                try:
-                    for clip_slot in track.clip_slots:
-                        clip_value = "0"
-                        try:
-                            if clip_slot.is_triggered:
-                                clip_value = "4"
-                            elif clip_slot.is_recording:
-                                clip_value = "3"
-                            elif clip_slot.is_playing:
-                                clip_value = "2"
-                            elif clip_slot.has_clip:
-                                clip_value = "1"
-                            elif is_armed and has_audio:
-                                clip_value = "5"
-                        except Exception:
-                            clip_value = "0"
-
-                        color_string_value = "0"
-                        
-                        # this could also just be made to if value == "1", but does not hurt this way
-                        if clip_value != "0" and clip_slot.has_clip:
-                            # extra test if has clip because group channels don't have a clip but might be triggered etc
-                            try:
-                                if clip_slot.clip.color is not None:
-                                    color_string_value = self._make_color_string(clip_slot.clip.color)
-                            except Exception:
-                                color_string_value = "0"
-                        #     playing_position = clip_slot.clip.playing_position
-                        #     length = clip_slot.clip.length
-                        #     self.log_message("playing: {} triggering {}".format(is_playing_value, is_triggered_value))
-                        # else:
-                        #     playing_position = 0.0
-                        #     length = 0.0
-
-                        clip_string = "{}:{}".format(clip_value, color_string_value)
-                        clip_slots.append(clip_string)
-                except Exception as e:
-                    pass
-                clip_slots_string = "-".join(clip_slots)
-                track_clips.append(clip_slots_string)
+                track_clips.append(self._track_clip_slot_states(track))
 
             # compare old track clips with new
             clips_difference = self.find_different_indexes(track_clips, self.old_clips_array)
             
             # safe new values
             self.old_clips_array = track_clips
+            if only_track_index is None:
+                self._dirty_clip_slots = {}
 
             # send different tracks out
-            # TODO: now this still does send out each track. not sure why. also it should only send out the clip that is changed and not the whole track I would say.
             if clips_difference != []:
                 for track_index in clips_difference:
                     if int(track_index) < len(track_clips):
-                        string_prefix = str(track_index) + "%"
-                        track_string = string_prefix + str(track_clips[track_index])
-                        self._send_sys_ex_message(track_string, 0x05)
+                        self._send_track_clip_slots(track_index, track_clips[track_index])
                     else:
                         delete_clips = "DEL" + str(track_index)
                         self._send_sys_ex_message(delete_clips, 0x05)
@@ -11421,6 +12200,89 @@ class Tap(ControlSurface):
             # self.periodic_timer = 0
             pass
 
+    def _mark_clip_slot_dirty(self, track, clip_slot):
+        if clip_slot is None:
+            return
+        self._dirty_clip_slots[clip_slot] = track
+
+    def _mark_track_clip_slots_dirty(self, track):
+        try:
+            for clip_slot in track.clip_slots:
+                self._dirty_clip_slots[clip_slot] = track
+        except Exception:
+            pass
+
+    def _flush_clip_slot_deltas(self):
+        """
+        Sends the clip slots changed since the last frame. Listener callbacks
+        only mark slots dirty, so a burst of launches resolves to one message.
+        In device view the slots stay dirty until the clip view is back.
+        """
+        if not self._dirty_clip_slots or self.device_status is not False:
+            return
+        dirty_clip_slots = self._dirty_clip_slots
+        self._dirty_clip_slots = {}
+        try:
+            tracks = self.song().tracks
+            if len(tracks) != len(self.old_clips_array):
+                self._update_clip_slots()
+                return
+            track_indexes = {}
+            for track_index, track in enumerate(tracks):
+                track_indexes[track] = track_index
+            slot_indexes_by_track = {}
+            arm_states = {}
+            deltas = []
+            changed_track_indexes = []
+            for clip_slot, track in dirty_clip_slots.items():
+                track_index = track_indexes.get(track)
+                if track_index is None:
+                    continue
+                slot_indexes = slot_indexes_by_track.get(track_index)
+                if slot_indexes is None:
+                    slot_indexes = {}
+                    for scene_index, slot in enumerate(track.clip_slots):
+                        slot_indexes[slot] = scene_index
+                    slot_indexes_by_track[track_index] = slot_indexes
+                    arm_states[track_index] = self._track_arm_state(track)
+                scene_index = slot_indexes.get(clip_slot)
+                if scene_index is None:
+                    continue
+                track_slots = self.old_clips_array[track_index]
+                if len(track_slots) != len(slot_indexes):
+                    # Scene topology changed; resend the whole track.
+                    self._update_clip_slots(track_index)
+                    continue
+                is_armed, has_audio = arm_states[track_index]
+                state = self._clip_slot_state_string(clip_slot, is_armed, has_audio)
+                if track_slots[scene_index] == state:
+                    continue
+                track_slots[scene_index] = state
+                deltas.append("{}%{}%{}".format(track_index, scene_index, state))
+                if track_index not in changed_track_indexes:
+                    changed_track_indexes.append(track_index)
+            if not deltas:
+                return
+            if self._clip_grid_deltas_enabled:
+                self._send_sys_ex_message("-".join(deltas), 0x4B)
+            else:
+                for track_index in changed_track_indexes:
+                    self._send_track_clip_slots(track_index, self.old_clips_array[track_index])
+        except Exception:
+            pass
+
+    def _request_full_clip_grid(self, message):
+        # Apps that ask for the grid understand per-slot 0x4B deltas.
+        self._clip_grid_deltas_enabled = True
+        self.old_clips_array = []
+        self._update_clip_slots()
+
+    def _on_clip_grid_scenes_changed(self):
+        if not self.was_initialized:
+            return
+        self._register_clip_listeners()
+        self._update_clip_slots()
+
     def _on_scale_changed(self):
         song = self.song()
         scale = song.scale_name
@@ -11484,435 +12346,485 @@ class Tap(ControlSurface):
                 # Non-chunked message → handle directly
                 self._handle_full_sysex(message)
 
-    def _handle_full_sysex(self, message):
+    def _register_sysex_handler(self, manufacturer_id, min_length, handler):
+        self._sysex_handlers[manufacturer_id] = (min_length, handler)
+
+    def _register_sysex_handlers(self):
+        self._sysex_handlers = {}
+        register = self._register_sysex_handler
         # Clip/Mixer views explicitly provide the raw track indexes currently
         # visible in the app. Keep position work completely dormant elsewhere.
-        if len(message) >= 3 and message[1] == 0x47:
-            self._set_clip_position_feedback(self.extract_values_from_sysex_message(message))
-            return
+        register(0x47, 3, self._handle_clip_position_feedback_sysex)
         # Push-style Simpler option row.
-        if len(message) >= 4 and message[1] == 0x43:
-            values = self.extract_values_from_sysex_message(message)
-            if values:
-                self._trigger_simpler_action(values[0])
-            return
+        register(0x43, 4, self._handle_simpler_action_sysex)
         # Simpler's two-axis Zoom control sends zoom and waveform center as
         # two 14-bit normalized values.
-        if len(message) >= 7 and message[1] == 0x46:
-            self._set_simpler_viewport(self.extract_values_from_sysex_message(message))
-            return
+        register(0x46, 7, self._handle_simpler_viewport_sysex)
         # The app may connect after the one-time sample-change waveform send.
-        if len(message) >= 4 and message[1] == 0x45:
-            self._debug_log('Simpler waveform requested by app')
-            self._request_simpler_waveform()
-            return
+        register(0x45, 4, self._handle_simpler_waveform_request_sysex)
         # Browser name search and content-tag filtering are performed here in the
         # Remote Script so the app only ever receives the current 12-item page.
-        if len(message) >= 3 and message[1] == 0x3C:
-            self._browser_search(message)
-            return
+        register(0x3C, 3, self._browser_search)
         # Preview the item at the supplied one-based row index, or stop at zero.
-        if len(message) >= 3 and message[1] == 0x3D:
-            values = self.extract_values_from_sysex_message(message)
-            self._browser_preview(values[0] if values else 0)
+        register(0x3D, 3, self._handle_browser_preview_sysex)
+        register(9, 2, self._handle_fire_clip_sysex)
+        register(10, 2, self._handle_delete_clip_sysex)
+        register(11, 2, self._handle_copy_paste_clip_sysex)
+        register(12, 2, self._handle_scale_root_sysex)
+        register(13, 2, self._handle_duplicate_loop_sysex)
+        register(14, 2, self._handle_add_notes_sysex)
+        register(15, 2, self._handle_remove_notes_sysex)
+        register(16, 3, self._handle_modify_notes_sysex)
+        register(17, 6, self._handle_clip_marker_sysex)
+        register(18, 4, self._handle_visible_channels_sysex)
+        register(19, 2, self._handle_combine_clips_sysex)
+        register(20, 3, self._handle_toggle_arm_sysex)
+        register(21, 3, self._handle_select_next_clip_sysex)
+        register(22, 2, self._handle_tempo_sysex)
+        register(23, 3, self._handle_metronome_sysex)
+        register(35, 2, self._set_follow_action_rule)
+        register(36, 2, self._delete_follow_action_rule)
+        register(37, 2, self._handle_follow_action_state_request_sysex)
+        register(38, 2, self._handle_stop_track_clips_sysex)
+        register(39, 2, self._set_device_control_high_resolution)
+        register(43, 2, self._handle_tap_tempo_sysex)
+        register(44, 3, self._handle_toggle_group_fold_sysex)
+        register(45, 3, self._handle_add_random_effect_sysex)
+        register(46, 3, self._handle_browser_insert_after_device_sysex)
+        register(47, 4, self._handle_move_device_sysex)
+        register(48, 4, self._handle_rack_snapshot_command)
+        register(49, 2, self._send_automation_envelope)
+        register(50, 2, self._set_automation_envelope)
+        register(51, 2, self._set_decoupled_automation_length)
+        register(52, 2, self._handle_unfold_decoupled_automation_sysex)
+        register(53, 2, self._clear_automation_envelope)
+        register(54, 2, self._clear_all_automation_envelopes)
+        register(55, 2, self._set_mutator_clip)
+        register(56, 2, self._handle_end_mutator_clip_sysex)
+        register(57, 2, self._update_mutator_clip_settings)
+        register(58, 2, self._replace_rhythm_generator_lane)
+        # request selected track local controls (ModWheel/Pressure)
+        register(59, 2, self._handle_track_local_control_request_sysex)
+        # The full clip grid is only sent on demand; changes follow as deltas.
+        register(0x48, 2, self._request_full_clip_grid)
+        # Full step sequencer note resync; later edits follow as deltas.
+        register(0x49, 2, self._request_selected_clip_notes_resync)
+        # Restrict step sequencer note sends to the beat range the app shows.
+        register(0x4A, 9, self._set_selected_clip_note_window)
+        # Automation envelope responses as 0x32 binary instead of 0x31 text.
+        register(0x4B, 4, self._set_automation_envelope_format)
+
+    def _handle_full_sysex(self, message):
+        if len(message) < 2:
+            return
+        entry = self._sysex_handlers.get(message[1])
+        if entry is None:
             return
+        min_length, handler = entry
+        if len(message) < min_length:
+            return
+        handler(message)
+
+    def _handle_clip_position_feedback_sysex(self, message):
+        self._set_clip_position_feedback(self.extract_values_from_sysex_message(message))
+
+    def _handle_simpler_action_sysex(self, message):
+        values = self.extract_values_from_sysex_message(message)
+        if values:
+            self._trigger_simpler_action(values[0])
+
+    def _handle_simpler_viewport_sysex(self, message):
+        self._set_simpler_viewport(self.extract_values_from_sysex_message(message))
+
+    def _handle_simpler_waveform_request_sysex(self, message):
+        self._debug_log('Simpler waveform requested by app')
+        self._request_simpler_waveform()
+
+    def _handle_browser_preview_sysex(self, message):
+        values = self.extract_values_from_sysex_message(message)
+        self._browser_preview(values[0] if values else 0)
+
+    def _handle_fire_clip_sysex(self, message):
         # start stop clip
-        if len(message) >= 2 and message[1] == 9:
-            values = self.extract_values_from_sysex_message(message)
-            if len(values) == 3:
-                self._fire_clip(values[0], values[1], values[2])
-        # delete clip
-        if len(message) >= 2 and message[1] == 10:
-            values = self.extract_values_from_sysex_message(message)
-            if len(values) == 2:
-                self._delete_clip(values[0], values[1])
-        # copy paste clip
-        if len(message) >= 2 and message[1] == 11:
-            values = self.extract_values_from_sysex_message(message)
-            if len(values) == 4:
-                self._copy_paste_clip(values[0], values[1], values[2], values[3])
-        # scale and rootnote
-        if len(message) >= 2 and message[1] == 12:
-            values = self.decode_sys_ex_scale_root(message)
-            if len(values) == 2:
-                self._set_scale_root_note(values[0], values[1])
-        # duplicate loop
-        if len(message) >= 2 and message[1] == 13:
-            values = self.extract_values_from_sysex_message(message)
-            if len(values) == 2:
-                self._duplicate_loop(values[0], values[1])
-        # request selected track local controls (ModWheel/Pressure)
-        if len(message) >= 2 and message[1] == 59:
-            self._send_track_local_control_state()
-        
+        values = self.extract_values_from_sysex_message(message)
+        if len(values) == 3:
+            self._fire_clip(values[0], values[1], values[2])
+
+    def _handle_delete_clip_sysex(self, message):
+        values = self.extract_values_from_sysex_message(message)
+        if len(values) == 2:
+            self._delete_clip(values[0], values[1])
+
+    def _handle_copy_paste_clip_sysex(self, message):
+        values = self.extract_values_from_sysex_message(message)
+        if len(values) == 4:
+            self._copy_paste_clip(values[0], values[1], values[2], values[3])
+
+    def _handle_scale_root_sysex(self, message):
+        values = self.decode_sys_ex_scale_root(message)
+        if len(values) == 2:
+            self._set_scale_root_note(values[0], values[1])
+
+    def _handle_duplicate_loop_sysex(self, message):
+        values = self.extract_values_from_sysex_message(message)
+        if len(values) == 2:
+            self._duplicate_loop(values[0], values[1])
+
+    def _handle_track_local_control_request_sysex(self, message):
+        self._send_track_local_control_state()
+
+    def _handle_add_notes_sysex(self, message):
         # add MULTIPLE notes
-        if len(message) >= 2 and message[1] == 14:
-            index = 2
-            new_notes = []
-            new_note_values = []
+        index = 2
+        new_notes = []
+        new_note_values = []
+
+        # Decode all notes in the message
+        while index < (len(message) - 1):
+            # Decode the pitch of the note
+            note_pitch = message[index]
+            index += 1
+
+            # Decode the start time (3 bytes, 7-bit packed)
+            if index + 3 > len(message):
+                break
+            start_time = self._from_3_7bit_bytes(message, index)
+            index += 3
+
+            # Decode the duration (3 bytes, 7-bit packed)
+            if index + 3 > len(message):
+                break
+            duration = self._from_3_7bit_bytes(message, index)
+            index += 3
+
+            # Decode velocity
+            if index >= len(message):
+                break
+            velocity = message[index]
+            index += 1
+
+            # Decode mute and probability
+            if index >= len(message):
+                break
+            mute_and_probability = message[index]
+            mute = (mute_and_probability & 0x80) != 0
+            probability = (mute_and_probability & 0x7F) / 127.0
+            index += 1
+
+            # Create a MidiNoteSpecification object
+            note_spec = MidiNoteSpecification(
+                pitch=note_pitch,
+                start_time=start_time / 1000.0,
+                duration=duration / 1000.0,
+                velocity=velocity,
+                mute=mute,
+                probability=probability
+            )
+
+            new_notes.append(note_spec)
+            new_note_values.append((
+                note_pitch,
+                start_time / 1000.0,
+                duration / 1000.0,
+                velocity,
+                mute,
+                probability
+            ))
+
+        # Add all decoded notes to the current clip
+        song = self.song()
+        clip_slot = song.view.highlighted_clip_slot
+        if clip_slot is not None and clip_slot.has_clip and len(new_notes) > 0:
+            clip = clip_slot.clip
+            filtered_notes = []
+            filtered_note_values = []
+            for note_spec, note_values in zip(new_notes, new_note_values):
+                if self._mutator_allows_source_note_time(clip, note_values[1]):
+                    filtered_notes.append(note_spec)
+                    filtered_note_values.append(note_values)
+            new_notes = filtered_notes
+            new_note_values = filtered_note_values
+            if not new_notes:
+                return
+            decoupled_info = self._decoupled_automation_info(clip)
+            if decoupled_info:
+                repeated_notes = []
+                for pitch, start_time, duration, velocity, mute, probability in new_note_values:
+                    repeated_notes.extend(self._make_repeated_note_specs_from_values(
+                        pitch,
+                        start_time,
+                        duration,
+                        velocity,
+                        mute,
+                        probability,
+                        decoupled_info
+                    ))
+                if repeated_notes:
+                    clip.add_new_notes(repeated_notes)
+            else:
+                clip.add_new_notes(new_notes)
+
+    def _handle_remove_notes_sysex(self, message):
+        # remove note (also multiple)
+        note_ids = []
+        index = 2
+        while index < (len(message) - 1):
+            note_id = message[index] | (message[index + 1] << 7)
+            note_ids.append(note_id)
+            index += 2
+
+        # Get the selected clip
+        song = self.song()
+        clip_slot = song.view.highlighted_clip_slot
+        if clip_slot is not None and clip_slot.has_clip:
+            clip = clip_slot.clip
+            decoupled_info = self._decoupled_automation_info(clip)
+            if decoupled_info:
+                notes = clip.get_notes_extended(0, 128, decoupled_info["note_start"], decoupled_info["physical_length"])
+                note_ids = [
+                    note_id for note_id in note_ids
+                    if any(note.note_id == note_id and self._mutator_allows_source_note_time(clip, note.start_time) for note in notes)
+                ]
+                if not note_ids:
+                    return
+                remove_ids = set(note_ids)
+                targets = []
+                for note in notes:
+                    if note.note_id in remove_ids:
+                        targets.append((int(note.pitch), self._folded_note_time(note.start_time, decoupled_info)))
+                matching_ids = []
+                for note in notes:
+                    for pitch, folded_time in targets:
+                        if self._note_matches_folded_time(note, folded_time, decoupled_info, pitch=pitch):
+                            matching_ids.append(note.note_id)
+                            break
+                if matching_ids:
+                    clip.remove_notes_by_id(tuple(matching_ids))
+            else:
+                notes = self._fetch_clip_notes(clip)
+                note_ids = [
+                    note_id for note_id in note_ids
+                    if any(note.note_id == note_id and self._mutator_allows_source_note_time(clip, note.start_time) for note in notes)
+                ]
+                if not note_ids:
+                    return
+                # Remove the note by ID
+                clip.remove_notes_by_id(note_ids)
+
+    def _handle_modify_notes_sysex(self, message):
+        # modify MULTIPLE notes
+        index = 2
+
+        # Get the selected clip
+        song = self.song()
+        clip_slot = song.view.highlighted_clip_slot
+        if clip_slot is not None and clip_slot.has_clip:
+            clip = clip_slot.clip
+            decoupled_info = self._decoupled_automation_info(clip)
 
-            # Decode all notes in the message
+            # Fetch existing notes from the clip
+            notes = self._fetch_clip_notes(clip)
+            did_modify_notes = False
+            notes_by_id = {note.note_id: note for note in notes}
+            folded_buckets = self._index_notes_by_folded_time(notes, decoupled_info) if decoupled_info else None
+
+            # Modify the matching notes
             while index < (len(message) - 1):
-                # Decode the pitch of the note
-                note_pitch = message[index]
-                index += 1
+                note_id = message[index] | (message[index + 1] << 7)
+                pitch = message[index + 2]
+                index += 3
 
-                # Decode the start time (3 bytes, 7-bit packed)
-                if index + 3 > len(message):
-                    break
-                start_time = self._from_3_7bit_bytes(message, index)
+                start_time_raw = self._from_3_7bit_bytes(message, index)
+                start_time = start_time_raw / 1000.0
                 index += 3
 
-                # Decode the duration (3 bytes, 7-bit packed)
-                if index + 3 > len(message):
-                    break
-                duration = self._from_3_7bit_bytes(message, index)
+                duration_raw = self._from_3_7bit_bytes(message, index)
+                duration = duration_raw / 1000.0
                 index += 3
 
-                # Decode velocity
-                if index >= len(message):
-                    break
                 velocity = message[index]
                 index += 1
 
-                # Decode mute and probability
-                if index >= len(message):
-                    break
-                mute_and_probability = message[index]
-                mute = (mute_and_probability & 0x80) != 0
-                probability = (mute_and_probability & 0x7F) / 127.0
+                mute = bool(message[index] & 0x80)
+                probability = (message[index] & 0x7F) / 127.0
                 index += 1
 
-                # Create a MidiNoteSpecification object
-                note_spec = MidiNoteSpecification(
-                    pitch=note_pitch,
-                    start_time=start_time / 1000.0,
-                    duration=duration / 1000.0,
-                    velocity=velocity,
-                    mute=mute,
-                    probability=probability
-                )
-
-                new_notes.append(note_spec)
-                new_note_values.append((
-                    note_pitch,
-                    start_time / 1000.0,
-                    duration / 1000.0,
-                    velocity,
-                    mute,
-                    probability
-                ))
+                if decoupled_info:
+                    target_note = notes_by_id.get(note_id)
+                    if target_note is None:
+                        continue
+                    if not self._mutator_allows_source_note_time(clip, target_note.start_time):
+                        continue
+                    if not self._mutator_allows_source_note_time(clip, start_time):
+                        continue
 
-            # Add all decoded notes to the current clip
-            song = self.song()
-            clip_slot = song.view.highlighted_clip_slot
-            if clip_slot is not None and clip_slot.has_clip and len(new_notes) > 0:
-                clip = clip_slot.clip
-                filtered_notes = []
-                filtered_note_values = []
-                for note_spec, note_values in zip(new_notes, new_note_values):
-                    if self._mutator_allows_source_note_time(clip, note_values[1]):
-                        filtered_notes.append(note_spec)
-                        filtered_note_values.append(note_values)
-                new_notes = filtered_notes
-                new_note_values = filtered_note_values
-                if not new_notes:
-                    return
+                    old_pitch = int(target_note.pitch)
+                    old_folded_time = self._folded_note_time(target_note.start_time, decoupled_info)
+                    new_offset = self._positive_mod(start_time - decoupled_info["note_start"], decoupled_info["note_length"])
+                    clipped_duration = self._duration_inside_note_loop(start_time, duration, decoupled_info)
+                    for note in self._notes_matching_folded_time(folded_buckets, old_folded_time, decoupled_info, old_pitch):
+                        old_bucket = self._folded_note_bucket(note.pitch, self._folded_note_time(note.start_time, decoupled_info))
+                        repeat_index = int(math.floor(max(0.0, note.start_time - decoupled_info["note_start"]) / decoupled_info["note_length"]))
+                        note.pitch = pitch
+                        note.start_time = decoupled_info["note_start"] + (float(repeat_index) * decoupled_info["note_length"]) + new_offset
+                        note.duration = clipped_duration
+                        note.velocity = velocity
+                        note.mute = mute
+                        note.probability = probability
+                        did_modify_notes = True
+                        # Keep the index in step so later edits in this batch see the move.
+                        new_bucket = self._folded_note_bucket(note.pitch, self._folded_note_time(note.start_time, decoupled_info))
+                        if new_bucket != old_bucket:
+                            folded_buckets[old_bucket] = [other for other in folded_buckets[old_bucket] if other is not note]
+                            folded_buckets.setdefault(new_bucket, []).append(note)
+                else:
+                    note = notes_by_id.get(note_id)
+                    if note is None:
+                        continue
+                    if not self._mutator_allows_source_note_time(clip, note.start_time):
+                        continue
+                    if not self._mutator_allows_source_note_time(clip, start_time):
+                        continue
+                    note.pitch = pitch
+                    note.start_time = start_time
+                    note.duration = duration
+                    note.velocity = velocity
+                    note.mute = mute
+                    note.probability = probability
+                    did_modify_notes = True
+
+            # Apply the modified notes back to the clip
+            if did_modify_notes:
+                clip.apply_note_modifications(notes)
+
+    def _handle_clip_marker_sysex(self, message):
+        # Decode the note ID and data
+        marker_id = message[2]
+
+        # Decode start time (variable-length value)
+        index = 3
+        marker_time_raw = self._from_3_7bit_bytes(message, index)
+        marker_time = marker_time_raw / 1000.0
+
+        # Get the selected clip
+        song = self.song()
+        clip_slot = song.view.highlighted_clip_slot
+        if clip_slot is not None and clip_slot.has_clip:
+            clip = clip_slot.clip
+            if marker_id == 0:
+                clip.start_marker = marker_time
+            elif marker_id == 1:
+                clip.end_marker = marker_time
+            elif marker_id == 2:
                 decoupled_info = self._decoupled_automation_info(clip)
                 if decoupled_info:
-                    repeated_notes = []
-                    for pitch, start_time, duration, velocity, mute, probability in new_note_values:
-                        repeated_notes.extend(self._make_repeated_note_specs_from_values(
-                            pitch,
-                            start_time,
-                            duration,
-                            velocity,
-                            mute,
-                            probability,
-                            decoupled_info
-                        ))
-                    if repeated_notes:
-                        clip.add_new_notes(repeated_notes)
+                    note_end = decoupled_info["note_start"] + decoupled_info["note_length"]
+                    note_length = max(0.0001, note_end - marker_time)
+                    self._apply_decoupled_note_loop(clip, marker_time, note_length, send_updates=True)
                 else:
-                    clip.add_new_notes(new_notes)
-        
-        # remove note (also multiple)
-        if len(message) >= 2 and message[1] == 15:
-            note_ids = []
-            index = 2
-            while index < (len(message) - 1):
-                note_id = message[index] | (message[index + 1] << 7)
-                note_ids.append(note_id)
-                index += 2
-        
-            # Get the selected clip
-            song = self.song()
-            clip_slot = song.view.highlighted_clip_slot
-            if clip_slot is not None and clip_slot.has_clip:
-                clip = clip_slot.clip
+                    clip.loop_start = marker_time
+            else:
                 decoupled_info = self._decoupled_automation_info(clip)
                 if decoupled_info:
-                    notes = clip.get_notes_extended(0, 128, decoupled_info["note_start"], decoupled_info["physical_length"])
-                    note_ids = [
-                        note_id for note_id in note_ids
-                        if any(note.note_id == note_id and self._mutator_allows_source_note_time(clip, note.start_time) for note in notes)
-                    ]
-                    if not note_ids:
-                        return
-                    remove_ids = set(note_ids)
-                    targets = []
-                    for note in notes:
-                        if note.note_id in remove_ids:
-                            targets.append((int(note.pitch), self._folded_note_time(note.start_time, decoupled_info)))
-                    matching_ids = []
-                    for note in notes:
-                        for pitch, folded_time in targets:
-                            if self._note_matches_folded_time(note, folded_time, decoupled_info, pitch=pitch):
-                                matching_ids.append(note.note_id)
-                                break
-                    if matching_ids:
-                        clip.remove_notes_by_id(tuple(matching_ids))
+                    note_length = max(0.0001, marker_time - decoupled_info["note_start"])
+                    self._apply_decoupled_note_loop(clip, decoupled_info["note_start"], note_length, send_updates=True)
                 else:
-                    clip_start = min(clip.start_time, clip.start_marker, clip.loop_start) - self.clip_length_trick
-                    clip_length = (max(clip.loop_end, clip.end_marker, clip.length) + self.clip_length_trick) - clip_start
-                    notes = clip.get_notes_extended(0, 128, clip_start, clip_length)
-                    note_ids = [
-                        note_id for note_id in note_ids
-                        if any(note.note_id == note_id and self._mutator_allows_source_note_time(clip, note.start_time) for note in notes)
-                    ]
-                    if not note_ids:
-                        return
-                    # Remove the note by ID
-                    clip.remove_notes_by_id(note_ids)
-        
-        # modify MULTIPLE notes
-        if len(message) >= 3 and message[1] == 16:
-            index = 2
-        
-            # Get the selected clip
-            song = self.song()
-            clip_slot = song.view.highlighted_clip_slot
-            if clip_slot is not None and clip_slot.has_clip:
-                clip = clip_slot.clip
-                decoupled_info = self._decoupled_automation_info(clip)
-                
-                # Fetch existing notes from the clip
-                clip_start = min(clip.start_time, clip.start_marker, clip.loop_start) - self.clip_length_trick
-                clip_length = (max(clip.loop_end, clip.end_marker, clip.length) + self.clip_length_trick) - clip_start
-                notes = clip.get_notes_extended(0, 128, clip_start, clip_length)
-                did_modify_notes = False
-        
-                # Modify the matching notes
-                while index < (len(message) - 1):
-                    note_id = message[index] | (message[index + 1] << 7)
-                    pitch = message[index + 2]
-                    index += 3
-        
-                    start_time_raw = self._from_3_7bit_bytes(message, index)
-                    start_time = start_time_raw / 1000.0
-                    index += 3
-        
-                    duration_raw = self._from_3_7bit_bytes(message, index)
-                    duration = duration_raw / 1000.0
-                    index += 3
-        
-                    velocity = message[index]
-                    index += 1
-        
-                    mute = bool(message[index] & 0x80)
-                    probability = (message[index] & 0x7F) / 127.0
-                    index += 1
-
-                    if decoupled_info:
-                        target_note = None
-                        for note in notes:
-                            if note.note_id == note_id:
-                                target_note = note
-                                break
-                        if target_note is None:
-                            continue
-                        if not self._mutator_allows_source_note_time(clip, target_note.start_time):
-                            continue
-                        if not self._mutator_allows_source_note_time(clip, start_time):
-                            continue
+                    clip.loop_end = marker_time
 
-                        old_pitch = int(target_note.pitch)
-                        old_folded_time = self._folded_note_time(target_note.start_time, decoupled_info)
-                        new_offset = self._positive_mod(start_time - decoupled_info["note_start"], decoupled_info["note_length"])
-                        clipped_duration = self._duration_inside_note_loop(start_time, duration, decoupled_info)
-                        for note in notes:
-                            if self._note_matches_folded_time(note, old_folded_time, decoupled_info, pitch=old_pitch):
-                                repeat_index = int(math.floor(max(0.0, note.start_time - decoupled_info["note_start"]) / decoupled_info["note_length"]))
-                                note.pitch = pitch
-                                note.start_time = decoupled_info["note_start"] + (float(repeat_index) * decoupled_info["note_length"]) + new_offset
-                                note.duration = clipped_duration
-                                note.velocity = velocity
-                                note.mute = mute
-                                note.probability = probability
-                                did_modify_notes = True
-                    else:
-                        for note in notes:
-                            if note.note_id == note_id:
-                                if not self._mutator_allows_source_note_time(clip, note.start_time):
-                                    break
-                                if not self._mutator_allows_source_note_time(clip, start_time):
-                                    break
-                                note.pitch = pitch
-                                note.start_time = start_time
-                                note.duration = duration
-                                note.velocity = velocity
-                                note.mute = mute
-                                note.probability = probability
-                                did_modify_notes = True
-                                break
-        
-                # Apply the modified notes back to the clip
-                if did_modify_notes:
-                    clip.apply_note_modifications(notes)
-        
-        # markers
-        if len(message) >= 2 and message[1] == 17:
-            # Decode the note ID and data
-            marker_id = message[2]
-            
-            # Decode start time (variable-length value)
-            index = 3
-            marker_time_raw = self._from_3_7bit_bytes(message, index)
-            marker_time = marker_time_raw / 1000.0
-            
-            # Get the selected clip
-            song = self.song()
-            clip_slot = song.view.highlighted_clip_slot
-            if clip_slot is not None and clip_slot.has_clip:
-                clip = clip_slot.clip
-                if marker_id == 0:
-                    clip.start_marker = marker_time
-                elif marker_id == 1:
-                    clip.end_marker = marker_time
-                elif marker_id == 2:
-                    decoupled_info = self._decoupled_automation_info(clip)
-                    if decoupled_info:
-                        note_end = decoupled_info["note_start"] + decoupled_info["note_length"]
-                        note_length = max(0.0001, note_end - marker_time)
-                        self._apply_decoupled_note_loop(clip, marker_time, note_length, send_updates=True)
-                    else:
-                        clip.loop_start = marker_time
-                else:
-                    decoupled_info = self._decoupled_automation_info(clip)
-                    if decoupled_info:
-                        note_length = max(0.0001, marker_time - decoupled_info["note_start"])
-                        self._apply_decoupled_note_loop(clip, decoupled_info["note_start"], note_length, send_updates=True)
-                    else:
-                        clip.loop_end = marker_time
-        
+    def _handle_visible_channels_sysex(self, message):
         # visible channel and mixer status true
-        if len(message) >= 2 and message[1] == 18:
-            start = message[2]
-            end = message[3]
-            self.visible_channels = (start, end)
-            self.mixer_status = True
-            self._last_clip_position_feedback_time = 0.0
-            self._last_visual_feedback_payload = None
-            self._set_up_mixer_controls()
-            
-        # combine clips
-        if len(message) >= 2 and message[1] == 19:
-            values = self.extract_values_from_sysex_message(message)
-            if len(values) == 4:
-                self._append_and_remove_clip(values[0], values[1], values[2], values[3])
-        
+        start = message[2]
+        end = message[3]
+        self.visible_channels = (start, end)
+        self.mixer_status = True
+        self._last_clip_position_feedback_time = 0.0
+        self._last_visual_feedback_payload = None
+        self._set_up_mixer_controls()
+
+    def _handle_combine_clips_sysex(self, message):
+        values = self.extract_values_from_sysex_message(message)
+        if len(values) == 4:
+            self._append_and_remove_clip(values[0], values[1], values[2], values[3])
+
+    def _handle_toggle_arm_sysex(self, message):
         # toggle arm for audio tracks
-        if len(message) >= 2 and message[1] == 20:
-            track_index = message[2]
-            track = self.song().tracks[track_index]
-            track.arm = not track.arm
-        
-        # select next clip
-        if len(message) >= 2 and message[1] == 21:
-            upValue = message[2]
-            track = self.song().view.selected_track
-            current_clip_slot = self.song().view.highlighted_clip_slot
-            # Find current index
-            current_index = list(track.clip_slots).index(current_clip_slot)
-            
-            if upValue == 0:  # Move down to next clip
-                # Search for next clip slot with a clip
-                for i in range(current_index + 1, len(track.clip_slots)):
-                    if track.clip_slots[i].has_clip:
-                        self.song().view.highlighted_clip_slot = track.clip_slots[i]
-                        break
-                        
-            elif upValue == 1:  # Move up to previous clip
-                # Search for previous clip slot with a clip (in reverse)
-                for i in range(current_index - 1, -1, -1):
-                    if track.clip_slots[i].has_clip:
-                        self.song().view.highlighted_clip_slot = track.clip_slots[i]
-                        break
-        if len(message) >= 2 and message[1] == 22:
-            tempo_bytes = message[2:-1]
-            try:
-                tempo_string = bytes(tempo_bytes).decode('ascii')
-                new_tempo = float(tempo_string)
-                self.song().tempo = new_tempo
-                # Optional: print for debugging
-                # self.canonical_parent.log_message("Tempo set to " + tempo_string)
-            except Exception as e:
-                # Optional: log error
-                # self.canonical_parent.log_message("Tempo decode error: " + str(e))
-                pass
-        if len(message) >= 3 and message[1] == 23:
-            try:
-                self.song().metronome = bool(message[2])
-            except Exception:
-                pass
-        if len(message) >= 2 and message[1] == 43:
-            self._handle_tap_tempo()
-        if len(message) >= 2 and message[1] == 35:
-            self._set_follow_action_rule(message)
-        if len(message) >= 2 and message[1] == 36:
-            self._delete_follow_action_rule(message)
-        if len(message) >= 2 and message[1] == 37:
-            self._send_follow_action_state(force=True)
-        if len(message) >= 2 and message[1] == 38:
-            values = self.extract_values_from_sysex_message(message)
-            if len(values) == 1:
-                self._stop_track_clips(values[0])
-        if len(message) >= 2 and message[1] == 39:
-            self._set_device_control_high_resolution(message)
-        if len(message) >= 3 and message[1] == 44:
-            self._toggle_group_fold(message[2])
-        if len(message) >= 3 and message[1] == 45:
-            self._add_random_effect_after_device(message[2])
-        if len(message) >= 3 and message[1] == 46:
-            self._set_browser_insert_after_device(message[2])
-        if len(message) >= 4 and message[1] == 47:
-            self._move_device_after_index(message[2], message[3])
-        if len(message) >= 4 and message[1] == 48:
-            self._handle_rack_snapshot_command(message)
-        if len(message) >= 2 and message[1] == 49:
-            self._send_automation_envelope(message)
-        if len(message) >= 2 and message[1] == 50:
-            self._set_automation_envelope(message)
-        if len(message) >= 2 and message[1] == 51:
-            self._set_decoupled_automation_length(message)
-        if len(message) >= 2 and message[1] == 52:
-            self._unfold_decoupled_automation_clip()
-        if len(message) >= 2 and message[1] == 53:
-            self._clear_automation_envelope(message)
-        if len(message) >= 2 and message[1] == 54:
-            self._clear_all_automation_envelopes(message)
-        if len(message) >= 2 and message[1] == 55:
-            self._set_mutator_clip(message)
-        if len(message) >= 2 and message[1] == 56:
-            action = message[2] if len(message) >= 3 else 0
-            if action == 1:
-                self._unfold_mutator_clip()
-            else:
-                self._end_mutator_clip()
-        if len(message) >= 2 and message[1] == 57:
-            self._update_mutator_clip_settings(message)
-        if len(message) >= 2 and message[1] == 58:
-            self._replace_rhythm_generator_lane(message)
+        track_index = message[2]
+        track = self.song().tracks[track_index]
+        track.arm = not track.arm
+
+    def _handle_select_next_clip_sysex(self, message):
+        upValue = message[2]
+        track = self.song().view.selected_track
+        current_clip_slot = self.song().view.highlighted_clip_slot
+        # Find current index
+        current_index = list(track.clip_slots).index(current_clip_slot)
+
+        if upValue == 0:  # Move down to next clip
+            # Search for next clip slot with a clip
+            for i in range(current_index + 1, len(track.clip_slots)):
+                if track.clip_slots[i].has_clip:
+                    self.song().view.highlighted_clip_slot = track.clip_slots[i]
+                    break
+
+        elif upValue == 1:  # Move up to previous clip
+            # Search for previous clip slot with a clip (in reverse)
+            for i in range(current_index - 1, -1, -1):
+                if track.clip_slots[i].has_clip:
+                    self.song().view.highlighted_clip_slot = track.clip_slots[i]
+                    break
+
+    def _handle_tempo_sysex(self, message):
+        tempo_bytes = message[2:-1]
+        try:
+            tempo_string = bytes(tempo_bytes).decode('ascii')
+            new_tempo = float(tempo_string)
+            self.song().tempo = new_tempo
+            # Optional: print for debugging
+            # self.canonical_parent.log_message("Tempo set to " + tempo_string)
+        except Exception as e:
+            # Optional: log error
+            # self.canonical_parent.log_message("Tempo decode error: " + str(e))
+            pass
+
+    def _handle_metronome_sysex(self, message):
+        try:
+            self.song().metronome = bool(message[2])
+        except Exception:
+            pass
+
+    def _handle_tap_tempo_sysex(self, message):
+        self._handle_tap_tempo()
+
+    def _handle_follow_action_state_request_sysex(self, message):
+        self._send_follow_action_state(force=True)
+
+    def _handle_stop_track_clips_sysex(self, message):
+        values = self.extract_values_from_sysex_message(message)
+        if len(values) == 1:
+            self._stop_track_clips(values[0])
+
+    def _handle_toggle_group_fold_sysex(self, message):
+        self._toggle_group_fold(message[2])
+
+    def _handle_add_random_effect_sysex(self, message):
+        self._add_random_effect_after_device(message[2])
+
+    def _handle_browser_insert_after_device_sysex(self, message):
+        self._set_browser_insert_after_device(message[2])
+
+    def _handle_move_device_sysex(self, message):
+        self._move_device_after_index(message[2], message[3])
+
+    def _handle_unfold_decoupled_automation_sysex(self, message):
+        self._unfold_decoupled_automation_clip()
+
+    def _handle_end_mutator_clip_sysex(self, message):
+        action = message[2] if len(message) >= 3 else 0
+        if action == 1:
+            self._unfold_mutator_clip()
+        else:
+            self._end_mutator_clip()
+
     def _replace_rhythm_generator_lane(self, message):
         try:
             payload = bytes(message[2:-1]).decode('ascii', errors='ignore')
@@ -12262,6 +13174,10 @@ class Tap(ControlSurface):
         cleaned.sort(key=lambda item: (item["start"], item["pitch"], item["duration"]))
         return cleaned
 
+    def _mutator_signature_numerator(self, settings):
+        # Generation snapshots carry the numerator so worker threads never ask Live.
+        return settings.get("_signature_numerator", 4)
+
     def _mutator_make_algorithm_section_values(self, source_values, role, source_start, loop_length, settings, rnd):
         algorithm = settings.get("algorithm", "mutator")
         kind = self._mutator_algorithm_kind(algorithm)
@@ -12269,7 +13185,7 @@ class Tap(ControlSurface):
             return None
 
         try:
-            bar_beats = float(max(1, int(self.song().signature_numerator)))
+            bar_beats = float(max(1, int(self._mutator_signature_numerator(settings))))
         except Exception:
             bar_beats = 4.0
         bar_beats = min(max(1.0, bar_beats), max(1.0, float(loop_length)))
@@ -12443,16 +13359,16 @@ class Tap(ControlSurface):
         )
 
     def _mutator_place_section_values(self, values, section_start, loop_length):
-        specs = []
+        placed = []
         for value in tuple(values or ()):
             relative_start = max(0.0, min(float(loop_length) - 0.0001, float(value.get("start", 0.0))))
             duration = max(0.0001, min(float(value.get("duration", 0.0001)), float(loop_length) - relative_start))
-            specs.append(self._mutator_specs_from_values(dict(
+            placed.append(dict(
                 value,
                 start=float(section_start) + relative_start,
                 duration=duration
-            )))
-        return specs
+            ))
+        return placed
 
     def _mutator_relative_section_values(self, source_values, source_start, loop_length):
         result = []
@@ -12630,7 +13546,7 @@ class Tap(ControlSurface):
         return max(0.0, min(loop_length - 0.0001, round(float(start) / grid) * grid))
 
     def _mutator_pack_grid(self, values):
-        pack = [dict(value) for value in tuple(values or ())]
+        pack = list(values or ())
         if not pack:
             return 0.25
         starts = []
@@ -12667,8 +13583,8 @@ class Tap(ControlSurface):
         return left_start < right_end - 0.000001 and right_start < left_end - 0.000001
 
     def _mutator_sample_note_traits(self, pool, rnd, fallback=None, minimum_duration=0.03125, maximum_duration=None):
-        pool = [dict(value) for value in tuple(pool or ()) if value]
-        fallback = dict(fallback or (pool[0] if pool else {}))
+        pool = [value for value in tuple(pool or ()) if value]
+        fallback = fallback or (pool[0] if pool else {})
         durations = [max(minimum_duration, float(value.get("duration", fallback.get("duration", 0.125)))) for value in pool]
         velocities = [max(1, min(127, int(value.get("velocity", fallback.get("velocity", 96))))) for value in pool]
         mutes = [bool(value.get("mute", fallback.get("mute", False))) for value in pool]
@@ -12707,12 +13623,12 @@ class Tap(ControlSurface):
                 pass
 
         source = [
-            dict(value)
+            value
             for value in tuple(source_values or ())
             if 0.0 <= float(value.get("start", 0.0)) < loop_length
         ]
         if not source:
-            source = [dict(base)]
+            source = [base]
         source.sort(key=lambda item: (float(item.get("start", 0.0)), int(item.get("pitch", 60))))
         same_pitch = [value for value in source if int(value.get("pitch", 60)) == pitch] or source
         base_start = quantized(float(base.get("start", 0.0)))
@@ -12817,7 +13733,7 @@ class Tap(ControlSurface):
         return ordered
 
     def _mutator_apply_break_role(self, values, loop_length, rhythm=False):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         if not values:
             return []
         values.sort(key=lambda item: (float(item.get("start", 0.0)), int(item.get("pitch", 0))))
@@ -12836,7 +13752,7 @@ class Tap(ControlSurface):
         return result
 
     def _mutator_simplify_values(self, values, depth, rnd):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         remove_count = min(max(0, len(values) - 1), self._mutator_operation_count(len(values), depth, rnd))
         if remove_count <= 0:
             return values
@@ -12852,7 +13768,7 @@ class Tap(ControlSurface):
         return [value for index, value in enumerate(values) if index not in remove_indexes]
 
     def _mutator_shift_starts_by_depth(self, values, probability, strength, loop_length, rnd, rhythm=False):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         indexes = self._mutator_operation_indexes(len(values), probability, rnd)
         if not indexes:
             return values
@@ -12861,7 +13777,7 @@ class Tap(ControlSurface):
         choices = [step * grid for step in range(-max_steps, max_steps + 1) if step != 0]
         for index in indexes:
             start = float(values[index].get("start", 0.0)) + rnd.choice(choices)
-            values[index]["start"] = self._mutator_quantized_time(start, loop_length, grid)
+            values[index] = dict(values[index], start=self._mutator_quantized_time(start, loop_length, grid))
         return values
 
     def _mutator_shift_pitch_groups_by_depth(self, values, probability, strength, loop_length, rnd, rhythm=False, target_pitches=None):
@@ -12919,7 +13835,7 @@ class Tap(ControlSurface):
         return values
 
     def _mutator_add_values_by_depth(self, values, depth, strength, role, loop_length, settings, rnd, rhythm=False, target_pitches=None):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         amount = max(0.0, min(1.0, float(depth)))
         if amount <= 0.0 or not values:
             return values
@@ -13153,7 +14069,6 @@ class Tap(ControlSurface):
         selected_bases = selected_bases[:add_count]
 
         for base in selected_bases:
-            base = dict(base)
             pitch = int(base.get("pitch", 60))
             if pitch not in allowed_pitches:
                 continue
@@ -13190,24 +14105,24 @@ class Tap(ControlSurface):
         return max(0.03125, remaining)
 
     def _mutator_apply_gate_by_depth(self, values, probability, strength, loop_length, rnd):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         for index in self._mutator_operation_indexes(len(values), probability, rnd):
-            values[index]["duration"] = self._mutator_gate_duration(
+            values[index] = dict(values[index], duration=self._mutator_gate_duration(
                 float(values[index].get("duration", 0.125)),
                 self._mutator_gate_remaining_for_index(values, index, loop_length),
                 strength,
                 rnd
-            )
+            ))
         return values
 
     def _mutator_apply_octave_by_depth(self, values, depth, rnd):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         for index in self._mutator_operation_indexes(len(values), depth, rnd):
-            values[index]["pitch"] = max(0, min(127, int(values[index].get("pitch", 60)) + rnd.choice([-12, 12])))
+            values[index] = dict(values[index], pitch=max(0, min(127, int(values[index].get("pitch", 60)) + rnd.choice([-12, 12]))))
         return values
 
     def _mutator_apply_pitch_by_depth(self, values, probability, strength, settings, rnd, rhythm=False, target_pitches=None):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         amount = max(0.0, min(1.0, float(strength)))
         if rhythm:
             targets = sorted(set(int(pitch) for pitch in tuple(target_pitches or ()) if 0 <= int(pitch) <= 127))
@@ -13218,18 +14133,18 @@ class Tap(ControlSurface):
                     continue
                 choices.sort(key=lambda target: abs(target - pitch))
                 window = max(1, min(len(choices), int(math.ceil(1 + amount * min(5, len(choices))))))
-                values[index]["pitch"] = rnd.choice(choices[:window])
+                values[index] = dict(values[index], pitch=rnd.choice(choices[:window]))
             return values
         for index in self._mutator_deterministic_indexes(len(values), probability, rnd):
             pitch = int(values[index].get("pitch", 60))
             max_steps = self._mutator_scale_step_span_for_octave_fraction(pitch, amount, settings)
             step_choices = [step for step in range(-max_steps, max_steps + 1) if step != 0]
             if step_choices:
-                values[index]["pitch"] = self._mutator_transpose_scale_steps(pitch, rnd.choice(step_choices), settings)
+                values[index] = dict(values[index], pitch=self._mutator_transpose_scale_steps(pitch, rnd.choice(step_choices), settings))
         return values
 
     def _mutator_apply_pitch_add_by_depth(self, values, probability, strength, loop_length, settings, rnd, rhythm=False, target_pitches=None):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         if not values:
             return values
         add_count = self._mutator_deterministic_count(len(values), probability)
@@ -13334,11 +14249,11 @@ class Tap(ControlSurface):
         return result
 
     def _mutator_duplicate_by_depth(self, values, probability, loop_length, rnd):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         indexes = self._mutator_deterministic_indexes(len(values), probability, rnd)
         if not indexes:
             return values
-        selected = [dict(values[index]) for index in indexes]
+        selected = [values[index] for index in indexes]
         loop_length = max(0.0001, float(loop_length))
         grid = self._mutator_pack_grid(selected)
         ticks_per_beat = 960
@@ -13410,7 +14325,7 @@ class Tap(ControlSurface):
         return result
 
     def _mutator_phrase_shift_by_depth(self, values, probability, strength, settings, rnd, rhythm=False, target_pitches=None):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         indexes = self._mutator_deterministic_indexes(len(values), probability, rnd)
         if not indexes:
             return values
@@ -13442,7 +14357,7 @@ class Tap(ControlSurface):
                 pitch = int(values[index].get("pitch", 60))
                 if pitch not in targets:
                     continue
-                values[index]["pitch"] = targets[targets.index(pitch) + offset]
+                values[index] = dict(values[index], pitch=targets[targets.index(pitch) + offset])
             return values
 
         selected_pitches = [int(values[index].get("pitch", 60)) for index in indexes]
@@ -13457,12 +14372,12 @@ class Tap(ControlSurface):
             return values
         offset = rnd.choice(step_choices)
         for index in indexes:
-            values[index]["pitch"] = self._mutator_transpose_scale_steps(int(values[index].get("pitch", 60)), offset, settings)
+            values[index] = dict(values[index], pitch=self._mutator_transpose_scale_steps(int(values[index].get("pitch", 60)), offset, settings))
         return values
 
     def _mutator_preserve_original_by_depth(self, values, source_values, probability, loop_length, rnd):
-        values = [dict(value) for value in tuple(values or ())]
-        source = [dict(value) for value in tuple(source_values or ())]
+        values = list(values or ())
+        source = list(source_values or ())
         indexes = self._mutator_deterministic_indexes(len(source), probability, rnd)
         if not indexes:
             return values
@@ -13483,7 +14398,7 @@ class Tap(ControlSurface):
         return result
 
     def _mutator_reverse_timing_by_depth(self, values, probability, loop_length, rnd):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         indexes = self._mutator_deterministic_indexes(len(values), probability, rnd)
         if len(indexes) < 2:
             return values
@@ -13494,11 +14409,11 @@ class Tap(ControlSurface):
         for index in indexes:
             duration = max(0.0001, float(values[index].get("duration", 0.0001)))
             original_end = float(values[index].get("start", 0.0)) + duration
-            values[index]["start"] = max(0.0, min(float(loop_length) - 0.0001, range_start + (range_end - original_end)))
+            values[index] = dict(values[index], start=max(0.0, min(float(loop_length) - 0.0001, range_start + (range_end - original_end))))
         return values
 
     def _mutator_invert_pitch_by_depth(self, values, probability, settings, rnd, rhythm=False, target_pitches=None):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         indexes = self._mutator_deterministic_indexes(len(values), probability, rnd)
         if len(indexes) < 2:
             return values
@@ -13520,12 +14435,12 @@ class Tap(ControlSurface):
                     continue
                 mirrored_index = max_index - max(0, allowed.index(pitch) - min_index)
                 if 0 <= mirrored_index < len(allowed):
-                    values[index]["pitch"] = allowed[mirrored_index]
+                    values[index] = dict(values[index], pitch=allowed[mirrored_index])
             return values
         if settings.get("scale", "Minor") == "Chromatic":
             for index in indexes:
                 pitch = int(values[index].get("pitch", 60))
-                values[index]["pitch"] = max(0, min(127, min_pitch + (max_pitch - pitch)))
+                values[index] = dict(values[index], pitch=max(0, min(127, min_pitch + (max_pitch - pitch))))
             return values
 
         allowed = self._mutator_scale_notes(settings)
@@ -13538,11 +14453,11 @@ class Tap(ControlSurface):
             pitch_index = self._mutator_scale_index(int(values[index].get("pitch", 60)), allowed)
             mirrored_index = max_index - max(0, pitch_index - min_index)
             if 0 <= mirrored_index < len(allowed):
-                values[index]["pitch"] = allowed[mirrored_index]
+                values[index] = dict(values[index], pitch=allowed[mirrored_index])
         return values
 
     def _mutator_remove_by_depth(self, values, depth, strength, rnd):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         if max(0.0, min(1.0, float(depth))) <= 0.0:
             return values
         remove_indexes = set(self._mutator_deterministic_indexes(len(values), depth, rnd))
@@ -13551,11 +14466,11 @@ class Tap(ControlSurface):
         return [value for index, value in enumerate(values) if index not in remove_indexes]
 
     def _mutator_apply_velocity_by_depth(self, values, probability, strength, role, rnd, rhythm=False):
-        values = [dict(value) for value in tuple(values or ())]
+        values = list(values or ())
         span = max(1, int(round(max(0.0, min(1.0, float(strength))) * 127.0)))
         for index in self._mutator_operation_indexes(len(values), probability, rnd):
             velocity = int(values[index].get("velocity", 96))
-            values[index]["velocity"] = max(1, min(127, velocity + rnd.randint(-span, span)))
+            values[index] = dict(values[index], velocity=max(1, min(127, velocity + rnd.randint(-span, span))))
         return values
 
     def _mutator_apply_role_shape(self, values, role, loop_length, settings, rnd, rhythm=False):
@@ -13600,7 +14515,7 @@ class Tap(ControlSurface):
     def _mutator_apply_add_shift_by_depth(self, values, source_values, role, loop_length, settings, rnd, depth, rhythm=False, target_pitches=None):
         depth = max(0.0, min(1.0, float(depth)))
         result = [dict(value) for value in tuple(values or ())]
-        source = [dict(value) for value in tuple(source_values or ())]
+        source = list(source_values or ())
         if depth <= 0.0 or not result:
             return result
 
@@ -13649,7 +14564,7 @@ class Tap(ControlSurface):
         for add_index in range(additions):
             if not motif:
                 break
-            base = dict(motif[add_index % len(motif)])
+            base = motif[add_index % len(motif)]
             if role == 7:
                 start = float(loop_length) * rnd.choice([0.75, 0.8125, 0.875, 0.9375])
                 duration = min(0.25, float(loop_length) - start)
@@ -13696,8 +14611,11 @@ class Tap(ControlSurface):
         return result
 
     def _mutator_apply_depth_pipeline(self, values, role, loop_length, settings, rnd, rhythm=False, target_pitches=None):
-        source_values = [dict(value) for value in tuple(values or ())]
-        result = [dict(value) for value in source_values]
+        # Note dicts are shared between stages and section caches. A stage
+        # that changes a note replaces it with a new dict and never writes to
+        # the one it was given.
+        source_values = list(values or ())
+        result = list(source_values)
         if role == 14:
             return self._mutator_apply_break_role(result, loop_length, rhythm=rhythm)
 
@@ -13761,7 +14679,7 @@ class Tap(ControlSurface):
     def _mutator_add_fill_values(self, result, values, role, loop_length, settings, rnd, target_pitches=None, rhythm=False, fill_depth=None):
         if role not in (4, 5, 6, 7, 13, 14, 15):
             return
-        pool = [dict(value) for value in tuple(values or ())]
+        pool = list(values or ())
         if target_pitches:
             targets = [int(pitch) for pitch in target_pitches if 0 <= int(pitch) <= 127]
             pool = [value for value in pool if int(value.get("pitch", 0)) in targets] or [
@@ -13805,7 +14723,7 @@ class Tap(ControlSurface):
         rnd.shuffle(contour_targets)
 
         for fill_index, offset in enumerate(offsets):
-            base = dict(rnd.choice(pool))
+            base = rnd.choice(pool)
             if rhythm:
                 pitch = rnd.choice(targets)
             elif contour_targets:
@@ -13842,7 +14760,7 @@ class Tap(ControlSurface):
             return []
 
         try:
-            bar_beats = float(max(1, int(self.song().signature_numerator)))
+            bar_beats = float(max(1, int(self._mutator_signature_numerator(settings))))
         except Exception:
             bar_beats = 4.0
         bar_beats = min(max(1.0, bar_beats), max(1.0, float(loop_length)))
@@ -14106,7 +15024,7 @@ class Tap(ControlSurface):
         except Exception:
             pass
 
-    def _generate_mutator_clip(self, clip, settings, previous_info=None, send_updates=True, automatic=False):
+    def _generate_mutator_clip(self, clip, settings, previous_info=None, send_updates=True, automatic=False, failure_work=None):
         generation_key = self._live_object_identity(clip)
         now = time.time()
         with self._mutator_generation_lock:
@@ -14115,211 +15033,394 @@ class Tap(ControlSurface):
             if automatic and now - self._last_mutator_generation_times.get(generation_key, 0.0) < self.MUTATOR_GENERATION_COOLDOWN_SECONDS:
                 return False
             self._mutator_generation_in_progress.add(generation_key)
+        started = False
         try:
             if clip is None or not getattr(clip, "is_midi_clip", False):
                 return False
-
-            previous_info = previous_info or self._mutator_info(clip)
-            companion_was_already_running = previous_info is not None
-            decoupled_info = self._decoupled_automation_info(clip)
-            source_start = decoupled_info["note_start"] if decoupled_info else float(getattr(clip, "loop_start", 0.0))
-            original_loop_length = previous_info.get("original_loop_length") if previous_info else None
-            if original_loop_length is None:
-                if decoupled_info:
-                    original_loop_length = decoupled_info["note_length"]
-                else:
-                    original_loop_length = max(0.0001, float(getattr(clip, "loop_end", source_start + 4.0)) - source_start)
-            original_loop_length = max(0.0001, float(original_loop_length))
-            source_end = source_start + original_loop_length
-            source_notes = clip.get_notes_extended(0, 128, source_start, original_loop_length)
-            source_values = [self._mutator_note_values(note) for note in source_notes if note.start_time >= source_start - 0.000001 and note.start_time < source_end - 0.000001]
-            rhythm_mode = settings.get("companion_mode", "melody") == "rhythm"
-            target_pitches = set(self._mutator_rhythm_target_pitches(settings, source_values)) if rhythm_mode else set()
-            if not source_values and not target_pitches:
+            snapshot = self._mutator_generation_snapshot(clip, settings, previous_info)
+            if snapshot is None:
                 return False
-            settings = self._mutator_resolve_slot_activation(settings)
-            generation_source_values = source_values
-            passthrough_section_values = []
-            if rhythm_mode:
-                generation_source_values, passthrough_section_values = self._mutator_split_rhythm_source_values(
-                    settings,
-                    source_values,
-                    source_start,
-                    original_loop_length
-                )
+            started = self._start_mutator_generation_job(generation_key, clip, snapshot, send_updates, failure_work)
+            return started
+        except Exception as e:
+            self._debug_log("Error generating mutator clip: {}".format(str(e)))
+            return False
+        finally:
+            if not started:
+                self._finish_mutator_generation(generation_key)
 
-            def section_payload(values):
-                return [dict(value) for value in tuple(values or ())] + [dict(value) for value in passthrough_section_values]
+    def _finish_mutator_generation(self, key):
+        with self._mutator_generation_lock:
+            self._mutator_generation_in_progress.discard(key)
+            self._mutator_generation_jobs.pop(key, None)
+        self._flush_queued_mutator_work(key)
 
-            roles = self._mutator_pattern_roles(settings.get("preset", 9))
-            sections = []
-            specs = []
-            generated_section_cache = {}
-            chain_preset = self._mutator_preset_is_chain(settings.get("preset", 9))
-            original_section_values = self._mutator_make_section_values(
-                generation_source_values,
-                0,
-                source_start,
-                original_loop_length,
+    def _mutator_generation_snapshot(self, clip, settings, previous_info=None):
+        """Read everything a generation needs from Live, on the main thread."""
+        previous_info = previous_info or self._mutator_info(clip)
+        decoupled_info = self._decoupled_automation_info(clip)
+        source_start = decoupled_info["note_start"] if decoupled_info else float(getattr(clip, "loop_start", 0.0))
+        original_loop_length = previous_info.get("original_loop_length") if previous_info else None
+        if original_loop_length is None:
+            if decoupled_info:
+                original_loop_length = decoupled_info["note_length"]
+            else:
+                original_loop_length = max(0.0001, float(getattr(clip, "loop_end", source_start + 4.0)) - source_start)
+        original_loop_length = max(0.0001, float(original_loop_length))
+        source_values = self._mutator_source_values(clip, source_start, original_loop_length)
+        rhythm_mode = settings.get("companion_mode", "melody") == "rhythm"
+        target_pitches = set(self._mutator_rhythm_target_pitches(settings, source_values)) if rhythm_mode else set()
+        if not source_values and not target_pitches:
+            return None
+        settings = self._mutator_resolve_slot_activation(settings)
+        try:
+            settings["_signature_numerator"] = int(self.song().signature_numerator)
+        except Exception:
+            settings["_signature_numerator"] = 4
+        generation_source_values = source_values
+        passthrough_section_values = []
+        if rhythm_mode:
+            generation_source_values, passthrough_section_values = self._mutator_split_rhythm_source_values(
                 settings,
-                random.Random(0)
+                source_values,
+                source_start,
+                original_loop_length
             )
-            previous_chain_values = tuple(dict(value) for value in original_section_values)
-            rnd = random.Random(int(settings.get("seed", 1)))
-            for index, role in enumerate(roles):
-                section_start = source_start + (index * original_loop_length)
-                sections.append({"role": role, "start": section_start, "length": original_loop_length})
-                preserve_source_section = index == 0
-
-                if chain_preset:
-                    if role == 0:
-                        section_values = original_section_values
-                        previous_chain_values = tuple(dict(value) for value in section_values)
-                    elif role in generated_section_cache:
-                        section_values = generated_section_cache[role]
-                        previous_chain_values = tuple(dict(value) for value in section_values)
-                    else:
-                        section_values = self._mutator_make_section_values(
-                            previous_chain_values,
-                            role,
-                            0.0,
-                            original_loop_length,
-                            settings,
-                            rnd
-                        )
-                        generated_section_cache[role] = tuple(dict(value) for value in section_values)
-                        previous_chain_values = tuple(dict(value) for value in section_values)
-                    if not preserve_source_section:
-                        specs.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
-                    continue
+        return {
+            "settings": settings,
+            "previous_info": previous_info,
+            "decoupled_info": decoupled_info,
+            "source_start": source_start,
+            "original_loop_length": original_loop_length,
+            "source_values": tuple(source_values),
+            "generation_source_values": tuple(generation_source_values),
+            "passthrough_section_values": tuple(passthrough_section_values),
+            "loop": (float(getattr(clip, "loop_start", 0.0)), float(getattr(clip, "loop_end", 0.0))),
+        }
 
-                if role in (0, 8):
-                    section_values = self._mutator_make_section_values(
-                        generation_source_values,
-                        role,
-                        source_start,
-                        original_loop_length,
-                        settings,
-                        rnd
-                    )
-                    if not preserve_source_section:
-                        specs.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
+    def _mutator_source_values(self, clip, source_start, length):
+        source_end = source_start + length
+        source_notes = clip.get_notes_extended(0, 128, source_start, length)
+        return [self._mutator_note_values(note) for note in source_notes if note.start_time >= source_start - 0.000001 and note.start_time < source_end - 0.000001]
+
+    def _compute_mutator_generation(self, snapshot):
+        """
+        Build the sections and placed note values of a snapshot without
+        touching Live. Results are memoized and shared, so never mutate them.
+        """
+        settings = snapshot["settings"]
+        source_start = snapshot["source_start"]
+        original_loop_length = snapshot["original_loop_length"]
+        generation_source_values = snapshot["generation_source_values"]
+        passthrough_section_values = snapshot["passthrough_section_values"]
+
+        def section_payload(values):
+            return list(values or ()) + list(passthrough_section_values)
+
+        roles = self._mutator_pattern_roles(settings.get("preset", 9))
+        sections = []
+        placed_values = []
+        generated_section_cache = {}
+        chain_preset = self._mutator_preset_is_chain(settings.get("preset", 9))
+        original_section_values = self._mutator_make_section_values(
+            generation_source_values,
+            0,
+            source_start,
+            original_loop_length,
+            settings,
+            random.Random(0)
+        )
+        previous_chain_values = tuple(original_section_values)
+        rnd = random.Random(int(settings.get("seed", 1)))
+        for index, role in enumerate(roles):
+            section_start = source_start + (index * original_loop_length)
+            sections.append({"role": role, "start": section_start, "length": original_loop_length})
+            preserve_source_section = index == 0
+
+            if chain_preset:
+                if role == 0:
+                    section_values = original_section_values
+                    previous_chain_values = tuple(section_values)
                 elif role in generated_section_cache:
-                    specs.extend(self._mutator_place_section_values(section_payload(generated_section_cache[role]), section_start, original_loop_length))
-                elif role == 2 and 1 in generated_section_cache:
-                    section_values = self._mutator_make_section_values(
-                        generated_section_cache[1],
-                        role,
-                        0.0,
-                        original_loop_length,
-                        settings,
-                        rnd
-                    )
-                    generated_section_cache[role] = tuple(dict(value) for value in section_values)
-                    specs.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
-                elif role == 13 and 5 in generated_section_cache:
-                    section_values = self._mutator_make_section_values(
-                        generated_section_cache[5],
-                        role,
-                        0.0,
-                        original_loop_length,
-                        settings,
-                        rnd
-                    )
-                    generated_section_cache[role] = tuple(dict(value) for value in section_values)
-                    specs.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
-                elif role == 12 and 6 in generated_section_cache:
-                    section_values = self._mutator_make_section_values(
-                        generated_section_cache[6],
-                        role,
-                        0.0,
-                        original_loop_length,
-                        settings,
-                        rnd
-                    )
-                    generated_section_cache[role] = tuple(dict(value) for value in section_values)
-                    specs.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
-                elif role == 15 and 6 in generated_section_cache:
+                    section_values = generated_section_cache[role]
+                    previous_chain_values = tuple(section_values)
+                else:
                     section_values = self._mutator_make_section_values(
-                        generated_section_cache[6],
+                        previous_chain_values,
                         role,
                         0.0,
                         original_loop_length,
                         settings,
                         rnd
                     )
-                    generated_section_cache[role] = tuple(dict(value) for value in section_values)
-                    specs.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
-                else:
-                    generation_role = 5 if role == 16 else role
-                    section_values = self._mutator_make_section_values(
-                        generation_source_values,
-                        generation_role,
-                        source_start,
-                        original_loop_length,
-                        settings,
-                        rnd
-                    )
-                    generated_section_cache[role] = tuple(dict(value) for value in section_values)
-                    specs.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
-
-            structure_length = original_loop_length * len(roles)
-            previous_structure_length = max(0.0001, float(previous_info.get("structure_length", original_loop_length))) if previous_info else original_loop_length
-            should_duplicate_automation = (
-                not companion_was_already_running or
-                structure_length > previous_structure_length + 0.000001
-            )
-            automation_source_length = previous_structure_length if companion_was_already_running else original_loop_length
-            remove_start = source_end
-            remove_end = max(
-                source_start + structure_length,
-                float(getattr(clip, "loop_end", 0.0)),
-                float(getattr(clip, "end_marker", 0.0)),
-                float(getattr(clip, "length", 0.0))
-            )
-            self._begin_selected_clip_update_batch()
-            undo_step_started = self._begin_undo_step()
+                    generated_section_cache[role] = tuple(section_values)
+                    previous_chain_values = tuple(section_values)
+                if not preserve_source_section:
+                    placed_values.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
+                continue
+
+            if role in (0, 8):
+                section_values = self._mutator_make_section_values(
+                    generation_source_values,
+                    role,
+                    source_start,
+                    original_loop_length,
+                    settings,
+                    rnd
+                )
+                if not preserve_source_section:
+                    placed_values.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
+            elif role in generated_section_cache:
+                placed_values.extend(self._mutator_place_section_values(section_payload(generated_section_cache[role]), section_start, original_loop_length))
+            elif role == 2 and 1 in generated_section_cache:
+                section_values = self._mutator_make_section_values(
+                    generated_section_cache[1],
+                    role,
+                    0.0,
+                    original_loop_length,
+                    settings,
+                    rnd
+                )
+                generated_section_cache[role] = tuple(section_values)
+                placed_values.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
+            elif role == 13 and 5 in generated_section_cache:
+                section_values = self._mutator_make_section_values(
+                    generated_section_cache[5],
+                    role,
+                    0.0,
+                    original_loop_length,
+                    settings,
+                    rnd
+                )
+                generated_section_cache[role] = tuple(section_values)
+                placed_values.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
+            elif role == 12 and 6 in generated_section_cache:
+                section_values = self._mutator_make_section_values(
+                    generated_section_cache[6],
+                    role,
+                    0.0,
+                    original_loop_length,
+                    settings,
+                    rnd
+                )
+                generated_section_cache[role] = tuple(section_values)
+                placed_values.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
+            elif role == 15 and 6 in generated_section_cache:
+                section_values = self._mutator_make_section_values(
+                    generated_section_cache[6],
+                    role,
+                    0.0,
+                    original_loop_length,
+                    settings,
+                    rnd
+                )
+                generated_section_cache[role] = tuple(section_values)
+                placed_values.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
+            else:
+                generation_role = 5 if role == 16 else role
+                section_values = self._mutator_make_section_values(
+                    generation_source_values,
+                    generation_role,
+                    source_start,
+                    original_loop_length,
+                    settings,
+                    rnd
+                )
+                generated_section_cache[role] = tuple(section_values)
+                placed_values.extend(self._mutator_place_section_values(section_payload(section_values), section_start, original_loop_length))
+
+        return {
+            "sections": sections,
+            "values": placed_values,
+            "structure_length": original_loop_length * len(roles),
+        }
+
+    def _start_mutator_generation_job(self, key, clip, snapshot, send_updates=True, failure_work=None):
+        job = {
+            "clip": clip,
+            "snapshot": snapshot,
+            "send_updates": bool(send_updates),
+            "failure_work": failure_work,
+            "done": False,
+            "result": None,
+            "error": None,
+        }
+        with self._mutator_generation_lock:
+            self._mutator_generation_jobs[key] = job
+        self._start_mutator_generation_worker(job)
+        self._schedule_task(('mutator_generation', key), 0.0, self._poll_mutator_generation_job, key, job)
+        return True
+
+    def _start_mutator_generation_worker(self, job, use_memo=True):
+        job["memo_key"] = None
+        if use_memo:
             try:
-                if hasattr(clip, "remove_notes_extended"):
-                    clip.remove_notes_extended(0, 128, remove_start, max(0.0001, remove_end - remove_start))
-                if specs:
-                    clip.add_new_notes(tuple(specs))
-
-                clip.loop_start = source_start
-                clip.start_marker = min(float(getattr(clip, "start_marker", source_start)), source_start)
-                clip.loop_end = source_start + structure_length
-                clip.end_marker = source_start + structure_length
-                if should_duplicate_automation:
-                    if decoupled_info:
-                        self._couple_decoupled_automation_to_loop_length(clip, structure_length)
-                    else:
-                        self._duplicate_loop_automation_to_loop_length(
-                            clip,
-                            source_start,
-                            automation_source_length,
-                            structure_length
-                        )
-                info = self._mutator_info_from_settings(settings, {
-                    "original_loop_length": original_loop_length,
-                    "structure_length": structure_length,
-                    "seed": settings.get("seed", 1),
-                    "sections": sections,
-                }, clip, commit_structure=True)
-                self._save_mutator_info_to_name(clip, info)
-            finally:
-                self._end_undo_step(undo_step_started)
-                self._end_selected_clip_update_batch()
-            if send_updates:
-                self._refresh_visible_mutator_clip(clip)
-            self._last_mutator_generation_times[generation_key] = time.time()
-            return True
+                job["memo_key"] = self._mutator_generation_memo_key(job["snapshot"])
+            except Exception:
+                pass
+        if job["memo_key"] is not None:
+            with self._mutator_generation_lock:
+                result = self._mutator_generation_memo.get(job["memo_key"])
+                if result is not None:
+                    job["result"] = result
+                    job["done"] = True
+                    return
+        worker = threading.Thread(
+            target=self._run_mutator_generation_job,
+            args=(job,),
+            name='TapMutatorGeneration',
+        )
+        worker.daemon = True
+        worker.start()
+
+    def _run_mutator_generation_job(self, job):
+        # Worker thread: only the snapshot is read, results are applied by the poll.
+        result = None
+        error = None
+        try:
+            result = self._compute_mutator_generation(job["snapshot"])
+        except Exception as e:
+            error = str(e)
+        with self._mutator_generation_lock:
+            memo_key = job.get("memo_key")
+            if result is not None and memo_key is not None:
+                while len(self._mutator_generation_memo) >= self.MUTATOR_GENERATION_MEMO_SIZE:
+                    self._mutator_generation_memo.pop(next(iter(self._mutator_generation_memo)))
+                self._mutator_generation_memo[memo_key] = result
+            job["result"] = result
+            job["error"] = error
+            job["done"] = True
+
+    def _mutator_generation_memo_key(self, snapshot):
+        """
+        Stable hash of everything a generation result depends on: the source
+        notes, the generative settings (seed included) and the loop window.
+        """
+        settings = snapshot["settings"]
+        fields = tuple(
+            (key, settings.get(key))
+            for key in self.MUTATOR_GENERATIVE_SETTINGS + tuple(self._mutator_operation_depth_keys())
+        )
+        payload = repr(self._mutator_memo_canonical((
+            fields,
+            snapshot["source_start"],
+            snapshot["original_loop_length"],
+            snapshot["generation_source_values"],
+            snapshot["passthrough_section_values"],
+        )))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _mutator_memo_canonical(self, value):
+        if isinstance(value, dict):
+            return tuple(sorted((str(key), self._mutator_memo_canonical(item)) for key, item in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(self._mutator_memo_canonical(item) for item in value)
+        return value
+
+    def _poll_mutator_generation_job(self, key, job):
+        with self._mutator_generation_lock:
+            if self._mutator_generation_jobs.get(key) is not job:
+                return
+            done = job["done"]
+            queued_work = self._queued_mutator_work.get(key)
+        if not done:
+            self._schedule_task(('mutator_generation', key), 0.0, self._poll_mutator_generation_job, key, job)
+            return
+
+        applied = False
+        superseded = bool(queued_work) and queued_work.get("type") == "generate"
+        try:
+            if job["error"] is not None:
+                self._debug_log("Error generating mutator clip: {}".format(job["error"]))
+            elif superseded:
+                # A newer generation was queued meanwhile; it runs on flush instead.
+                self._debug_log("Dropped stale mutator generation")
+            elif self._mutator_generation_job_is_current(job):
+                applied = self._apply_mutator_generation(job["clip"], job["snapshot"], job["result"], job["send_updates"])
+                if applied:
+                    self._last_mutator_generation_times[key] = time.time()
         except Exception as e:
             self._debug_log("Error generating mutator clip: {}".format(str(e)))
+        try:
+            if not applied and not superseded:
+                failure_work = job.get("failure_work")
+                if failure_work:
+                    self._apply_mutator_clip_settings(
+                        failure_work.get("clip"),
+                        failure_work.get("settings", {}),
+                        send_updates=bool(failure_work.get("send_updates", True)),
+                        request_generation=False
+                    )
+                self._mark_mutator_generation_unscheduled(key)
+        finally:
+            self._finish_mutator_generation(key)
+
+    def _mutator_generation_job_is_current(self, job):
+        clip = job["clip"]
+        if job["result"] is None or not liveobj_valid(clip):
             return False
+        loop = (float(getattr(clip, "loop_start", 0.0)), float(getattr(clip, "loop_end", 0.0)))
+        return loop == job["snapshot"]["loop"]
+
+    def _apply_mutator_generation(self, clip, snapshot, result, send_updates=True):
+        settings = snapshot["settings"]
+        previous_info = snapshot["previous_info"]
+        decoupled_info = snapshot["decoupled_info"]
+        source_start = snapshot["source_start"]
+        original_loop_length = snapshot["original_loop_length"]
+        source_end = source_start + original_loop_length
+        companion_was_already_running = previous_info is not None
+        sections = result["sections"]
+        structure_length = result["structure_length"]
+        specs = [self._mutator_specs_from_values(value) for value in result["values"]]
+        previous_structure_length = max(0.0001, float(previous_info.get("structure_length", original_loop_length))) if previous_info else original_loop_length
+        should_duplicate_automation = (
+            not companion_was_already_running or
+            structure_length > previous_structure_length + 0.000001
+        )
+        automation_source_length = previous_structure_length if companion_was_already_running else original_loop_length
+        remove_start = source_end
+        remove_end = max(
+            source_start + structure_length,
+            float(getattr(clip, "loop_end", 0.0)),
+            float(getattr(clip, "end_marker", 0.0)),
+            float(getattr(clip, "length", 0.0))
+        )
+        self._begin_selected_clip_update_batch()
+        undo_step_started = self._begin_undo_step()
+        try:
+            if hasattr(clip, "remove_notes_extended"):
+                clip.remove_notes_extended(0, 128, remove_start, max(0.0001, remove_end - remove_start))
+            if specs:
+                clip.add_new_notes(tuple(specs))
+
+            clip.loop_start = source_start
+            clip.start_marker = min(float(getattr(clip, "start_marker", source_start)), source_start)
+            clip.loop_end = source_start + structure_length
+            clip.end_marker = source_start + structure_length
+            if should_duplicate_automation:
+                if decoupled_info:
+                    self._couple_decoupled_automation_to_loop_length(clip, structure_length)
+                else:
+                    self._duplicate_loop_automation_to_loop_length(
+                        clip,
+                        source_start,
+                        automation_source_length,
+                        structure_length
+                    )
+            info = self._mutator_info_from_settings(settings, {
+                "original_loop_length": original_loop_length,
+                "structure_length": structure_length,
+                "seed": settings.get("seed", 1),
+                "sections": sections,
+            }, clip, commit_structure=True)
+            self._save_mutator_info_to_name(clip, info)
         finally:
-            with self._mutator_generation_lock:
-                self._mutator_generation_in_progress.discard(generation_key)
-            self._flush_queued_mutator_work(generation_key)
+            self._end_undo_step(undo_step_started)
+            self._end_selected_clip_update_batch()
+        if send_updates:
+            self._refresh_visible_mutator_clip(clip)
+        return True
 
     def _schedule_mutator_generation(self, key, clip, settings, previous_info=None, send_updates=True, respect_cooldown=True, automatic=True):
         with self._mutator_generation_lock:
@@ -14360,7 +15461,8 @@ class Tap(ControlSurface):
                     generation_settings,
                     previous_info=generation_previous_info,
                     send_updates=generation_send_updates,
-                    automatic=generation_automatic
+                    automatic=generation_automatic,
+                    failure_work=apply_settings_if_generation_fails
                 )
                 if apply_settings_if_generation_fails and not generation_succeeded:
                     self._apply_mutator_clip_settings(
@@ -14377,12 +15479,81 @@ class Tap(ControlSurface):
                 self._flush_queued_mutator_work(key)
 
         try:
-            self.schedule_message(1, generate_later)
-            return True
+            self.schedule_message(1, generate_later)
+            return True
+        except Exception:
+            with self._mutator_generation_lock:
+                self._mutator_generation_scheduled.discard(key)
+            return False
+
+    def _prepare_mutator_generation(self, key, clip, info):
+        """
+        Compute the next regeneration of a playing clip in the background, so
+        the boundary only has to write notes that are already built.
+        """
+        with self._mutator_generation_lock:
+            if key in self._mutator_prepared_generations:
+                return False
+        try:
+            settings = self._mutator_settings_from_info(info, seed=random.randint(1, 2000000000))
+            snapshot = self._mutator_generation_snapshot(clip, settings, info)
+            if snapshot is None:
+                return False
+            job = {
+                "clip": clip,
+                "snapshot": snapshot,
+                "name": str(getattr(clip, "name", "")),
+                "done": False,
+                "result": None,
+                "error": None,
+            }
+            with self._mutator_generation_lock:
+                self._mutator_prepared_generations[key] = job
+            # Every look-ahead uses a fresh seed, so its result would never be
+            # looked up again and would only evict re-apply and undo entries.
+            self._start_mutator_generation_worker(job, use_memo=False)
+            return True
+        except Exception as e:
+            with self._mutator_generation_lock:
+                self._mutator_prepared_generations.pop(key, None)
+            self._debug_log("Error preparing mutator generation: {}".format(str(e)))
+            return False
+
+    def _commit_prepared_mutator_generation(self, key, clip):
+        with self._mutator_generation_lock:
+            job = self._mutator_prepared_generations.pop(key, None)
+            if job is None or not job["done"]:
+                return False
+            if key in self._mutator_generation_in_progress or key in self._mutator_generation_scheduled:
+                return False
+        # Any edit to the settings, loop, time signature or source notes since
+        # the snapshot makes it stale.
+        if job["error"] is not None or not self._mutator_generation_job_is_current(job):
+            return False
+        if str(getattr(clip, "name", "")) != job["name"]:
+            return False
+        snapshot = job["snapshot"]
+        try:
+            signature_numerator = int(self.song().signature_numerator)
         except Exception:
-            with self._mutator_generation_lock:
-                self._mutator_generation_scheduled.discard(key)
+            signature_numerator = 4
+        if signature_numerator != snapshot["settings"].get("_signature_numerator"):
+            return False
+        if tuple(self._mutator_source_values(clip, snapshot["source_start"], snapshot["original_loop_length"])) != snapshot["source_values"]:
+            return False
+
+        with self._mutator_generation_lock:
+            self._mutator_generation_in_progress.add(key)
+        try:
+            applied = self._apply_mutator_generation(clip, snapshot, job["result"], send_updates=True)
+            if applied:
+                self._last_mutator_generation_times[key] = time.time()
+            return applied
+        except Exception as e:
+            self._debug_log("Error committing prepared mutator generation: {}".format(str(e)))
             return False
+        finally:
+            self._finish_mutator_generation(key)
 
     def _mark_mutator_generation_unscheduled(self, key):
         with self._mutator_generation_lock:
@@ -14400,7 +15571,9 @@ class Tap(ControlSurface):
             if not self._mutator_generation_settings_changed(info, previous_info):
                 return False
             self._mark_mutator_generation_unscheduled(key)
-            settings = self._mutator_settings_from_info(info, seed=random.randint(1, 2000000000))
+            # Keep the clip's seed: re-applying earlier settings then reuses
+            # the memoized generation instead of computing a new variation.
+            settings = self._mutator_settings_from_info(info)
             if self._mutator_generation_is_busy(key):
                 return self._queue_mutator_generation(key, clip, settings, previous_info=info, send_updates=send_updates)
             if self._schedule_mutator_generation(key, clip, settings, previous_info=info, send_updates=send_updates):
@@ -14543,6 +15716,7 @@ class Tap(ControlSurface):
         try:
             if not self._song_is_playing():
                 self._mutator_regeneration_states.clear()
+                self._mutator_prepared_generations.clear()
                 self._last_mutator_generation_signatures.clear()
                 self._mutator_playing_clip_keys.clear()
                 self._mutator_triggered_clip_keys.clear()
@@ -14572,11 +15746,14 @@ class Tap(ControlSurface):
 
                     known_keys.add(key)
                     scoped_keys.add(key)
-                    info = self._mutator_info(clip)
-                    if not info or int(info.get("regenerate_mode", 0)) == 0:
+                    marker = self._clip_name_marker(clip, "mutator")
+                    if not marker or int(marker.get("regenerate_mode", 0)) == 0:
                         self._mutator_playing_clip_keys.discard(key)
                         self._mutator_triggered_clip_keys.discard(key)
                         continue
+                    info = self._mutator_info(clip)
+                    if not info:
+                        continue
 
                     raw_position = float(getattr(clip, "playing_position", 0.0))
 
@@ -14598,9 +15775,13 @@ class Tap(ControlSurface):
                         continue
 
                     if self._should_regenerate_mutator_clip(key, clip, info, raw_position):
+                        if self._commit_prepared_mutator_generation(key, clip):
+                            continue
                         settings = self._mutator_settings_from_info(info, seed=random.randint(1, 2000000000))
                         if not self._schedule_mutator_generation(key, clip, settings, previous_info=info, send_updates=True):
                             self._mark_mutator_generation_unscheduled(key)
+                    elif not self._mutator_generation_is_busy(key):
+                        self._prepare_mutator_generation(key, clip, info)
 
             if only_track_index is None:
                 self._mutator_playing_clip_keys.intersection_update(active_keys)
@@ -14609,6 +15790,9 @@ class Tap(ControlSurface):
                     if key not in active_keys:
                         self._mutator_regeneration_states.pop(key, None)
                         self._last_mutator_generation_signatures.pop(key, None)
+                for key in list(self._mutator_prepared_generations.keys()):
+                    if key not in active_keys:
+                        self._mutator_prepared_generations.pop(key, None)
             else:
                 for key in list(self._mutator_playing_clip_keys):
                     if key in scoped_keys and key not in active_keys:
@@ -14799,6 +15983,7 @@ class Tap(ControlSurface):
             self._debug_log("Error applying decoupled note loop: {}".format(str(e)))
 
     def _set_decoupled_automation_length(self, message):
+        self._automation_page_cache = None
         try:
             payload = bytes(message[2:-1]).decode('ascii', errors='ignore')
             fields = self._split_escaped_sysex_fields(payload, "|")
@@ -14893,6 +16078,7 @@ class Tap(ControlSurface):
             self._debug_log("Error applying decoupled automation length: {}".format(str(e)))
 
     def _unfold_decoupled_automation_clip(self):
+        self._automation_page_cache = None
         try:
             clip_slot = self.song().view.highlighted_clip_slot
             if clip_slot is None or not clip_slot.has_clip:
@@ -14914,14 +16100,120 @@ class Tap(ControlSurface):
             self._debug_log("Error unfolding decoupled automation clip: {}".format(str(e)))
 
     def _automation_clear_response(self, control_index, current_value):
-        response = "{}|{}|{:.6f}|{}|{}".format(
-            control_index,
-            0,
-            current_value,
-            "",
-            ""
-        )
-        self._send_sys_ex_message(response, 0x31)
+        self._send_automation_envelope_response(control_index, 0, current_value)
+
+    def _set_automation_envelope_format(self, message):
+        self._automation_binary_envelopes_enabled = message[2] == 1
+
+    def _send_automation_envelope_response(self, control_index, has_envelope, current_value, steps=(), points=(), render_samples=(), step_duration=0.0, decoupled_fields=None, token_fields=()):
+        """
+        Sends an envelope page as 0x31 text, or as 0x32 binary when the app
+        opted in. Steps are authored step tuples; points and render samples
+        are (time, normalized) pairs spaced by step_duration.
+        """
+        if self._automation_binary_envelopes_enabled:
+            self._send_binary_automation_envelope_response(
+                control_index,
+                has_envelope,
+                current_value,
+                steps,
+                points,
+                render_samples,
+                step_duration,
+                decoupled_fields,
+                token_fields
+            )
+            return
+
+        entries = [self._automation_step_entry(step) for step in steps]
+        for time_value, normalized in points:
+            entries.append("{:.6f}:{:.6f}:{:.6f}:{:.6f}".format(time_value, step_duration, normalized, 0.0))
+        render_entries = []
+        for time_value, normalized in render_samples:
+            render_entries.append("{:.6f}:{:.6f}:{:.6f}:{:.6f}".format(time_value, step_duration, normalized, 0.0))
+        fields = [str(control_index), str(has_envelope), "{:.6f}".format(current_value), ",".join(entries), ",".join(render_entries)]
+        if decoupled_fields is not None:
+            fields.extend(decoupled_fields)
+        fields.extend(token_fields)
+        self._send_sys_ex_message("|".join(fields), 0x31)
+
+    def _automation_binary_ticks(self, time_value):
+        return int(round(float(time_value) * self.AUTOMATION_BINARY_TICKS_PER_BEAT))
+
+    def _automation_binary_value(self, normalized):
+        return self._to_2_7bit_bytes(int(round(max(0.0, min(1.0, float(normalized))) * self.AUTOMATION_BINARY_VALUE_MAX)))
+
+    def _automation_binary_varint(self, value, signed=False):
+        """
+        Variable-length 7-bit integer: six data bits per byte, low group first,
+        0x40 set on every byte but the last. Signed values are zigzag coded.
+        """
+        value = int(value)
+        if signed:
+            value = value * 2 if value >= 0 else -value * 2 - 1
+        value = max(0, value)
+        result = []
+        while value > 0x3F:
+            result.append(0x40 | (value & 0x3F))
+            value >>= 6
+        result.append(value)
+        return result
+
+    def _send_binary_automation_envelope_response(self, control_index, has_envelope, current_value, steps, points, render_samples, step_duration, decoupled_fields, token_fields):
+        """
+        0x32 layout, all 7-bit bytes, chunked like note data:
+        version, control, flags (1 has envelope, 2 authored steps, 4 has
+        parameter length), current value (14-bit), step duration ticks,
+        automation length ticks, physical end ticks, entry count, entries,
+        render count, render start ticks, render values, token length, token.
+        Times are 1/3840 beat ticks; entry times are deltas from the previous
+        entry. Entries are time delta + 14-bit value, and authored steps add
+        duration ticks, 14-bit curve, id and order. Render samples are spaced
+        by the step duration, so they only carry their 14-bit values.
+        """
+        ticks = self._automation_binary_ticks
+        value_bytes = self._automation_binary_value
+        varint = self._automation_binary_varint
+        decoupled_fields = decoupled_fields or ("0", "0", "0")
+        flags = 0x01 if has_envelope else 0x00
+        if steps:
+            flags |= 0x02
+        if decoupled_fields[0] == "1":
+            flags |= 0x04
+
+        payload = [self.AUTOMATION_BINARY_ENVELOPE_VERSION, int(control_index) & 0x7F, flags]
+        payload.extend(value_bytes(current_value))
+        payload.extend(varint(ticks(step_duration)))
+        payload.extend(varint(ticks(decoupled_fields[1]), signed=True))
+        payload.extend(varint(ticks(decoupled_fields[2]), signed=True))
+
+        payload.extend(varint(len(steps) + len(points)))
+        previous_ticks = 0
+        for step in steps:
+            time_value, duration, normalized, curve, step_id, step_order = self._automation_step_tuple(step)
+            time_ticks = ticks(time_value)
+            payload.extend(varint(time_ticks - previous_ticks, signed=True))
+            payload.extend(value_bytes(normalized))
+            payload.extend(varint(ticks(duration)))
+            payload.extend(value_bytes((curve + 1.0) * 0.5))
+            payload.extend(varint(step_id))
+            payload.extend(varint(step_order))
+            previous_ticks = time_ticks
+        for time_value, normalized in points:
+            time_ticks = ticks(time_value)
+            payload.extend(varint(time_ticks - previous_ticks, signed=True))
+            payload.extend(value_bytes(normalized))
+            previous_ticks = time_ticks
+
+        payload.extend(varint(len(render_samples)))
+        payload.extend(varint(ticks(render_samples[0][0]) if render_samples else 0, signed=True))
+        for _, normalized in render_samples:
+            payload.extend(value_bytes(normalized))
+
+        token = "|".join(token_fields).encode('ascii', errors='ignore')
+        payload.extend(varint(len(token)))
+        payload.extend(byte & 0x7F for byte in token)
+        self._send_chunked_note_data(bytes(payload), 0x32)
 
     def _automation_response_decoupled_fields(self, clip, device_param):
         info = self._decoupled_automation_info(clip, device_param)
@@ -14934,6 +16226,7 @@ class Tap(ControlSurface):
         ]
 
     def _clear_automation_envelope(self, message):
+        self._automation_page_cache = None
         try:
             control_index = max(0, min(7, int(message[2]) if len(message) >= 4 else 0))
             device_param = self._current_connected_parameter_for_control(control_index)
@@ -14959,6 +16252,7 @@ class Tap(ControlSurface):
             self._debug_log("Error clearing automation envelope: {}".format(str(e)))
 
     def _clear_all_automation_envelopes(self, message):
+        self._automation_page_cache = None
         try:
             control_index = max(0, min(7, int(message[2]) if len(message) >= 4 else 0))
             device_param = self._current_connected_parameter_for_control(control_index)
@@ -15013,20 +16307,20 @@ class Tap(ControlSurface):
                     except Exception:
                         envelope = None
 
-            samples = []
             has_envelope = 1 if envelope is not None else 0
-            for index in range(count):
-                time_value = start + (float(index) * step_duration)
-                normalized = current_value
-                if envelope is not None:
-                    try:
-                        raw_value = envelope.value_at_time(time_value)
-                        if device_param.max != device_param.min:
-                            normalized = (raw_value - device_param.min) / (device_param.max - device_param.min)
-                    except Exception:
-                        normalized = current_value
-                normalized = max(0.0, min(1.0, normalized))
-                samples.append((time_value, normalized))
+            page_key = (clip, device_param, start, step_duration, count)
+            cached_page = self._automation_page_cache
+            now = time.time()
+            if (
+                envelope is not None
+                and cached_page is not None
+                and cached_page[0] == page_key
+                and now - cached_page[1] <= self.AUTOMATION_PAGE_CACHE_SECONDS
+            ):
+                samples = list(cached_page[2])
+            else:
+                samples = self._sample_automation_envelope(envelope, device_param, start, step_duration, count, current_value)
+                self._automation_page_cache = (page_key, now, tuple(samples)) if envelope is not None else None
 
             authored_steps = self._authored_automation_steps(clip, device_param, control_index)
             request_end = start + (float(count - 1) * step_duration)
@@ -15053,37 +16347,29 @@ class Tap(ControlSurface):
                     + replacement_steps
                 )
                 self._store_authored_automation_steps(clip, device_param, control_index, authored_steps)
-            points = [] if authored_steps is not None else self._compress_automation_samples(samples)
-            entries = []
-            if authored_steps is not None:
-                for step in authored_steps:
-                    entries.append(self._automation_step_entry(step))
-            else:
-                for sample in points:
-                    time_value, normalized = sample
-                    if decoupled_info is not None and abs(time_value - request_end) <= 0.000001:
-                        continue
-                    entries.append("{:.6f}:{:.6f}:{:.6f}:{:.6f}".format(time_value, step_duration, normalized, 0.0))
-            render_entries = []
-            for sample in samples:
-                time_value, normalized = sample
-                if authored_render_steps:
-                    normalized = self._automation_value_from_steps(time_value, authored_render_steps)
-                render_entries.append("{:.6f}:{:.6f}:{:.6f}:{:.6f}".format(time_value, step_duration, normalized, 0.0))
-
-            response = "{}|{}|{:.6f}|{}|{}|{}".format(
+            points = [] if authored_steps is not None else self._compress_automation_samples(samples, self.AUTOMATION_ENVELOPE_MAX_POINTS)
+            if decoupled_info is not None:
+                points = [sample for sample in points if abs(sample[0] - request_end) > 0.000001]
+            render_samples = samples
+            if authored_render_steps:
+                times = [time_value for time_value, _ in samples]
+                render_samples = list(zip(times, self._automation_values_from_steps(times, authored_render_steps)))
+
+            self._send_automation_envelope_response(
                 control_index,
                 has_envelope,
                 current_value,
-                ",".join(entries),
-                ",".join(render_entries),
-                "|".join(self._automation_response_decoupled_fields(clip, device_param))
+                authored_steps or (),
+                points,
+                render_samples,
+                step_duration,
+                self._automation_response_decoupled_fields(clip, device_param)
             )
-            self._send_sys_ex_message(response, 0x31)
         except Exception as e:
             self._debug_log("Error sending automation envelope: {}".format(str(e)))
 
     def _set_automation_envelope(self, message):
+        self._automation_page_cache = None
         try:
             payload = bytes(message[2:-1]).decode('ascii', errors='ignore')
             fields = self._split_escaped_sysex_fields(payload, "|")
@@ -15287,15 +16573,13 @@ class Tap(ControlSurface):
                     except Exception:
                         pass
                 self._clear_authored_automation_steps(clip, device_param, control_index)
-                response = "{}|{}|{:.6f}|{}|{}|{}".format(
+                self._send_automation_envelope_response(
                     control_index,
                     0,
                     current_normalized,
-                    "",
-                    "",
-                    "|".join(self._automation_response_decoupled_fields(clip, device_param) + response_token_fields)
+                    decoupled_fields=self._automation_response_decoupled_fields(clip, device_param),
+                    token_fields=response_token_fields
                 )
-                self._send_sys_ex_message(response, 0x31)
                 self._refresh_parameter_metadata_on_automation_change()
                 return
 
@@ -15308,15 +16592,13 @@ class Tap(ControlSurface):
                     envelope = None
 
             if envelope is None:
-                response = "{}|{}|{:.6f}|{}|{}|{}".format(
+                self._send_automation_envelope_response(
                     control_index,
                     0,
                     current_normalized,
-                    "",
-                    "",
-                    "|".join(self._automation_response_decoupled_fields(clip, device_param) + response_token_fields)
+                    decoupled_fields=self._automation_response_decoupled_fields(clip, device_param),
+                    token_fields=response_token_fields
                 )
-                self._send_sys_ex_message(response, 0x31)
                 self._refresh_parameter_metadata_on_automation_change()
                 return
 
@@ -15382,40 +16664,24 @@ class Tap(ControlSurface):
 
             self._store_authored_automation_steps(clip, device_param, control_index, logical_steps)
 
-            response_samples = []
             count = max(2, min(self.AUTOMATION_ENVELOPE_MAX_SAMPLES, int((page_end - page_start) / sample_duration) + 1))
-            for index in range(count):
-                time_value = page_start + (float(index) * sample_duration)
-                normalized = current_normalized
-                if response_source_steps:
-                    normalized = self._automation_value_from_steps(time_value, response_source_steps)
-                else:
-                    try:
-                        raw_value = envelope.value_at_time(time_value)
-                        if device_param.max != device_param.min:
-                            normalized = (raw_value - device_param.min) / (device_param.max - device_param.min)
-                    except Exception:
-                        normalized = current_normalized
-                response_samples.append((time_value, max(0.0, min(1.0, normalized))))
-
-            point_entries = []
-            for step in logical_steps:
-                point_entries.append(self._automation_step_entry(step))
-
-            render_entries = []
-            for sample in response_samples:
-                time_value, normalized = sample
-                render_entries.append("{:.6f}:{:.6f}:{:.6f}:{:.6f}".format(time_value, sample_duration, normalized, 0.0))
+            if response_source_steps:
+                times = [page_start + (float(index) * sample_duration) for index in range(count)]
+                response_samples = list(zip(times, self._automation_values_from_steps(times, response_source_steps)))
+            else:
+                response_samples = self._sample_automation_envelope(envelope, device_param, page_start, sample_duration, count, current_normalized)
 
-            response = "{}|{}|{:.6f}|{}|{}|{}".format(
+            self._send_automation_envelope_response(
                 control_index,
                 1,
                 current_normalized,
-                ",".join(point_entries),
-                ",".join(render_entries),
-                "|".join(self._automation_response_decoupled_fields(clip, device_param) + response_token_fields)
+                logical_steps,
+                (),
+                response_samples,
+                sample_duration,
+                self._automation_response_decoupled_fields(clip, device_param),
+                response_token_fields
             )
-            self._send_sys_ex_message(response, 0x31)
             self._re_enable_after_automation_write(device_param, automation_should_re_enable)
             self._refresh_parameter_metadata_on_automation_change()
         except Exception as e:
@@ -15462,8 +16728,9 @@ class Tap(ControlSurface):
         required_close_ratio = 0.995
         max_difference = 0.0
         close_samples = 0
-        for time_value, normalized in samples:
-            difference = abs(self._automation_value_from_steps(time_value, steps) - normalized)
+        step_values = self._automation_values_from_steps([time_value for time_value, _ in samples], steps)
+        for step_value, (_, normalized) in zip(step_values, samples):
+            difference = abs(step_value - normalized)
             max_difference = max(max_difference, difference)
             if difference <= close_threshold:
                 close_samples += 1
@@ -15471,101 +16738,255 @@ class Tap(ControlSurface):
         close_ratio = float(close_samples) / float(len(samples))
         return close_ratio >= required_close_ratio and max_difference <= maximum_difference_threshold
 
+    def _sample_automation_envelope(self, envelope, device_param, start, step_duration, count, fallback):
+        """
+        Samples count normalized envelope values from start, step_duration
+        apart. Parameter range lookups are done once for the whole page.
+        """
+        times = [start + (float(index) * step_duration) for index in range(count)]
+        fallback = max(0.0, min(1.0, fallback))
+        if envelope is None:
+            return [(time_value, fallback) for time_value in times]
+
+        minimum = device_param.min
+        span = device_param.max - minimum
+        value_at_time = envelope.value_at_time
+        samples = []
+        for time_value in times:
+            normalized = fallback
+            try:
+                raw_value = value_at_time(time_value)
+                if span != 0:
+                    normalized = max(0.0, min(1.0, (raw_value - minimum) / span))
+            except Exception:
+                pass
+            samples.append((time_value, normalized))
+        return samples
+
     def _automation_value_from_steps(self, time_value, steps):
+        return self._automation_values_from_steps((time_value,), steps)[0]
+
+    def _automation_values_from_steps(self, times, steps):
+        """
+        Evaluates the step envelope at every time. Steps are sorted once and
+        ascending times advance a single step pointer; runs of times inside the
+        same segment are shaped together.
+        """
         if not steps:
-            return 0.0
+            return [0.0] * len(times)
 
         sorted_steps = self._automation_sorted_steps(steps)
+        step_count = len(sorted_steps)
         first_step = sorted_steps[0]
-        if time_value <= first_step[0]:
-            return max(0.0, min(1.0, first_step[2]))
-
+        first_value = max(0.0, min(1.0, first_step[2]))
+        values = []
+        run_segment = None
+        run_progresses = []
         previous_step = first_step
-        for next_step in sorted_steps[1:]:
-            if abs(next_step[0] - previous_step[0]) <= 0.000001:
-                if time_value >= next_step[0]:
-                    previous_step = next_step
+        position = 1
+        last_time = None
+
+        def flush_run():
+            if run_progresses:
+                start_step, end_step = run_segment
+                values.extend(self._automation_curve_segment_values(start_step[2], end_step[2], run_progresses, start_step[3]))
+                del run_progresses[:]
+
+        for time_value in times:
+            if last_time is not None and time_value < last_time:
+                previous_step = first_step
+                position = 1
+            last_time = time_value
+
+            if time_value <= first_step[0]:
+                flush_run()
+                values.append(first_value)
                 continue
 
-            if time_value <= next_step[0]:
-                progress = max(0.0, min(1.0, (time_value - previous_step[0]) / (next_step[0] - previous_step[0])))
-                return self._automation_curve_segment_value(previous_step[2], next_step[2], progress, previous_step[3] if len(previous_step) >= 4 else 0.0)
+            # Commit the steps every later time has passed as well.
+            while position < step_count:
+                next_step = sorted_steps[position]
+                if abs(next_step[0] - previous_step[0]) <= 0.000001:
+                    if time_value < next_step[0]:
+                        break
+                elif time_value <= next_step[0]:
+                    break
+                previous_step = next_step
+                position += 1
+
+            segment_start = previous_step
+            segment = None
+            for next_index in range(position, step_count):
+                next_step = sorted_steps[next_index]
+                if abs(next_step[0] - segment_start[0]) <= 0.000001:
+                    if time_value >= next_step[0]:
+                        segment_start = next_step
+                    continue
+                if time_value <= next_step[0]:
+                    segment = (segment_start, next_step)
+                    break
+                segment_start = next_step
+
+            if segment is None:
+                flush_run()
+                values.append(max(0.0, min(1.0, segment_start[2])))
+                continue
 
-            previous_step = next_step
+            if segment != run_segment:
+                flush_run()
+                run_segment = segment
+            start_step, end_step = segment
+            run_progresses.append(max(0.0, min(1.0, (time_value - start_step[0]) / (end_step[0] - start_step[0]))))
 
-        return max(0.0, min(1.0, previous_step[2]))
+        flush_run()
+        return values
 
     def _automation_curve_segment_value(self, start_value, end_value, progress, curve):
-        progress = max(0.0, min(1.0, progress))
+        return self._automation_curve_segment_values(start_value, end_value, (progress,), curve)[0]
+
+    def _automation_curve_segment_values(self, start_value, end_value, progresses, curve):
         curve = max(-1.0, min(1.0, curve))
+        difference = end_value - start_value
         if abs(curve) <= 0.000001:
-            return max(0.0, min(1.0, start_value + ((end_value - start_value) * progress)))
+            return [
+                max(0.0, min(1.0, start_value + (difference * max(0.0, min(1.0, progress)))))
+                for progress in progresses
+            ]
 
         exponent = 1.0 + (abs(curve) * 14.0)
-        rises = end_value >= start_value
-        bows_up = curve > 0.0
-        if bows_up == rises:
-            shaped_progress = 1.0 - pow(1.0 - progress, exponent)
-        else:
-            shaped_progress = pow(progress, exponent)
-
-        blended_progress = progress + ((shaped_progress - progress) * abs(curve))
-        return max(0.0, min(1.0, start_value + ((end_value - start_value) * blended_progress)))
+        strength = abs(curve)
+        eases_out = (curve > 0.0) == (end_value >= start_value)
+        values = []
+        for progress in progresses:
+            progress = max(0.0, min(1.0, progress))
+            if eases_out:
+                shaped_progress = 1.0 - pow(1.0 - progress, exponent)
+            else:
+                shaped_progress = pow(progress, exponent)
+            blended_progress = progress + ((shaped_progress - progress) * strength)
+            values.append(max(0.0, min(1.0, start_value + (difference * blended_progress))))
+        return values
 
-    def _compress_automation_samples(self, samples):
+    def _compress_automation_samples(self, samples, max_points=None):
+        """
+        Reduces samples to jumps plus simplified segments between them. With
+        max_points, jumps are thinned to fit the budget, each segment gets
+        its share of the rest by length, and the result is capped.
+        """
         if len(samples) <= 2:
             return samples
 
-        result = []
-        segment = [samples[0]]
+        jump_indexes = []
         for index in range(1, len(samples)):
             previous_sample = samples[index - 1]
             current_sample = samples[index]
             previous_flat = index >= 2 and abs(previous_sample[1] - samples[index - 2][1]) <= self.AUTOMATION_ENVELOPE_LINEAR_EPSILON
             next_flat = index + 1 < len(samples) and abs(current_sample[1] - samples[index + 1][1]) <= self.AUTOMATION_ENVELOPE_LINEAR_EPSILON
-            is_jump = (
+            if (
                 abs(current_sample[1] - previous_sample[1]) >= self.AUTOMATION_ENVELOPE_JUMP_THRESHOLD
                 and (previous_flat or next_flat)
-            )
+            ):
+                jump_indexes.append(index)
+
+        segment_points = None
+        if max_points is not None:
+            max_points = max(2, int(max_points))
+            # Each jump costs a hold point and the jump itself; dense LFOs
+            # keep every k-th jump and the rest fall into the segments.
+            jump_budget = (max_points - 2) // 2
+            if len(jump_indexes) > jump_budget:
+                if jump_budget:
+                    stride = -(-len(jump_indexes) // jump_budget)
+                    jump_indexes = jump_indexes[::stride]
+                else:
+                    jump_indexes = []
+            segment_points = max_points - 2 * len(jump_indexes)
 
-            if is_jump:
-                self._append_automation_samples(result, self._simplify_automation_segment(segment))
-                self._append_automation_sample(result, (current_sample[0], previous_sample[1]))
-                self._append_automation_sample(result, current_sample)
-                segment = [current_sample]
-            else:
-                segment.append(current_sample)
+        def segment_budget(start, end):
+            if segment_points is None:
+                return None
+            return max(2, (segment_points * (end - start)) // len(samples))
 
-        self._append_automation_samples(result, self._simplify_automation_segment(segment))
+        result = []
+        start = 0
+        for index in jump_indexes:
+            self._append_automation_samples(result, self._simplify_automation_segment(samples[start:index], segment_budget(start, index)))
+            self._append_automation_sample(result, (samples[index][0], samples[index - 1][1]))
+            self._append_automation_sample(result, samples[index])
+            start = index
+        self._append_automation_samples(result, self._simplify_automation_segment(samples[start:], segment_budget(start, len(samples))))
+        if max_points is not None and len(result) > max_points:
+            result = self._simplify_automation_segment(result, max_points)
         return result
 
-    def _simplify_automation_segment(self, samples):
-        if len(samples) <= 2:
+    def _simplify_automation_segment(self, samples, max_points=None):
+        """
+        Ramer-Douglas-Peucker over index ranges with an explicit stack. With
+        max_points the ranges with the largest deviation are split first, and
+        splitting stops once the budget is reached.
+        """
+        count = len(samples)
+        if count <= 2:
             return samples
 
-        first_time, first_value = samples[0]
-        last_time, last_value = samples[-1]
+        keep = [False] * count
+        keep[0] = keep[-1] = True
+        kept = 2
+        pending = []
+        segment = self._automation_segment_split(samples, 0, count - 1)
+        if segment is not None:
+            pending.append(segment)
+
+        while pending:
+            if max_points is None:
+                _, start, split_index, end = pending.pop()
+            elif kept >= max_points:
+                break
+            else:
+                _, start, split_index, end = heapq.heappop(pending)
+
+            keep[split_index] = True
+            kept += 1
+            for segment in (
+                self._automation_segment_split(samples, start, split_index),
+                self._automation_segment_split(samples, split_index, end),
+            ):
+                if segment is None:
+                    continue
+                if max_points is None:
+                    pending.append(segment)
+                else:
+                    heapq.heappush(pending, segment)
+
+        return [sample for index, sample in enumerate(samples) if keep[index]]
+
+    def _automation_segment_split(self, samples, start, end):
+        """
+        Returns (-deviation, start, split_index, end) for the sample furthest
+        from the start-end line, or None when the range is already linear.
+        """
+        if end - start < 2:
+            return None
+
+        first_time, first_value = samples[start]
+        last_time, last_value = samples[end]
         time_span = last_time - first_time
         if abs(time_span) <= 0.000001:
-            return [samples[0], samples[-1]]
+            return None
 
+        value_span = last_value - first_value
         max_deviation = 0.0
-        split_index = 0
-        for index in range(1, len(samples) - 1):
+        split_index = start
+        for index in range(start + 1, end):
             time_value, normalized = samples[index]
-            progress = (time_value - first_time) / time_span
-            linear_value = first_value + ((last_value - first_value) * progress)
-            deviation = abs(normalized - linear_value)
+            deviation = abs(normalized - (first_value + (value_span * ((time_value - first_time) / time_span))))
             if deviation > max_deviation:
                 max_deviation = deviation
                 split_index = index
 
         if max_deviation <= self.AUTOMATION_ENVELOPE_LINEAR_EPSILON:
-            return [samples[0], samples[-1]]
-
-        left = self._simplify_automation_segment(samples[:split_index + 1])
-        right = self._simplify_automation_segment(samples[split_index:])
-        return left[:-1] + right
+            return None
+        return (-max_deviation, start, split_index, end)
 
     def _append_automation_samples(self, result, samples):
         for sample in samples:
@@ -16389,9 +17810,7 @@ class Tap(ControlSurface):
         if value:
             self._disconnect_device_controls()
         else:
-            if hasattr(self, '_mixer_disconnect_timer') and self._mixer_disconnect_timer:
-                self._mixer_disconnect_timer.cancel()
-                self._mixer_disconnect_timer = None
+            self._cancel_task('mixer_disconnect')
             self.mixer_status = False
             self._last_visual_feedback_payload = None
             self._set_up_mixer_controls()
@@ -16420,7 +17839,7 @@ class Tap(ControlSurface):
         song = self.song()
         selected_clip_slot = song.view.highlighted_clip_slot
         self.send_selected_clip_metadata()
-        self.send_selected_clip_notes()
+        self.send_selected_clip_notes(force_full=True)
         self._check_clip_playing_status(force=True)
         # self.log_message("Starting step seq")
         if self.last_selected_clip_slot is not selected_clip_slot:
@@ -16492,7 +17911,7 @@ class Tap(ControlSurface):
         selected_clip_slot = song.view.highlighted_clip_slot
         if selected_clip_slot.has_clip:
             self.send_selected_clip_metadata()
-            self.send_selected_clip_notes()
+            self.send_selected_clip_notes(force_full=True)
             # add notes listener
             # self.log_message("slot now has a clip adding notes listener")
             selected_clip_slot.clip.add_notes_listener(self.send_selected_clip_notes)
@@ -16514,6 +17933,7 @@ class Tap(ControlSurface):
             
         # reseting last selected clip
         self.last_selected_clip_slot = None
+        self._invalidate_selected_clip_note_cache()
     
     # Use 7-bit encoding for multi-byte values below 1000
     def _to_2_7bit_bytes(self, value):
@@ -16672,19 +18092,126 @@ class Tap(ControlSurface):
                     sys_ex_message = (status_byte, manufacturer_id, device_id) + tuple(note_data) + (end_byte,)
                     self._send_midi(sys_ex_message)
     
-    def send_selected_clip_notes(self):
+    def _fetch_clip_notes(self, clip, window=None):
+        """
+        Fetch a clip's notes. With a (start, end) beat window only that range
+        is read. Otherwise the marker/loop range is read on its own when the
+        playhead clip's notes listener says nothing has changed since a read
+        found no note outside it; any other read is widened by
+        clip_length_trick and, for the playhead clip, records whether the
+        margins were empty.
+        """
+        if window is not None:
+            start, end = window
+            return clip.get_notes_extended(0, 128, start, max(0.0001, end - start))
+        start = min(clip.start_time, clip.start_marker, clip.loop_start)
+        end = max(clip.loop_end, clip.end_marker, clip.length)
+        is_playhead_clip = clip == self._playhead_note_index_clip
+        if is_playhead_clip and self._playhead_clip_notes_inside_range == (start, end):
+            return clip.get_notes_extended(0, 128, start, max(0.0001, end - start))
+        wide_start = start - self.clip_length_trick
+        wide_end = end + self.clip_length_trick
+        notes = clip.get_notes_extended(0, 128, wide_start, wide_end - wide_start)
+        if is_playhead_clip:
+            inside = all(start <= note.start_time < end for note in notes)
+            self._playhead_clip_notes_inside_range = (start, end) if inside else None
+        return notes
+
+    def _set_selected_clip_note_window(self, message):
+        """
+        0x4A: start and end beat as 3-byte 7-bit values in 1/1000 beats, like
+        note times. Following note sends for the highlighted clip only cover
+        that range, so long clips can be paged. End <= start clears the window.
+        """
+        start = self._from_3_7bit_bytes(message, 2) / 1000.0
+        end = self._from_3_7bit_bytes(message, 5) / 1000.0
+        clip_slot = self.song().view.highlighted_clip_slot
+        if end <= start or clip_slot is None or not clip_slot.has_clip:
+            self._selected_clip_note_window = None
+            self._selected_clip_note_window_clip = None
+        else:
+            self._selected_clip_note_window = (start, end)
+            self._selected_clip_note_window_clip = clip_slot.clip
+        self.send_selected_clip_notes(force_full=True)
+
+    def _selected_clip_note_records(self, selected_clip):
+        """
+        Returns the highlighted clip's notes as note_id -> 11-byte record, in
+        the same encoding the full 0x0D payload uses.
+        """
+        window = None
+        if self._selected_clip_note_window_clip == selected_clip:
+            window = self._selected_clip_note_window
+        notes = self._fetch_clip_notes(selected_clip, window)
+        decoupled_info = self._decoupled_automation_info(selected_clip)
+        if decoupled_info:
+            notes = [
+                note for note in notes
+                if note.start_time >= decoupled_info["note_start"] - 0.000001
+                and note.start_time < decoupled_info["note_end"] - 0.000001
+            ]
+        records = {}
+        for note in notes:
+            note_id = int(note.note_id)
+            pitch = int(note.pitch)
+            start_time = int(note.start_time * 1000)
+            duration = int(note.duration * 1000)
+            velocity = int(note.velocity)
+            mute = 1 if note.mute else 0
+            probability = int(note.probability * 127)
+        
+            records[note_id] = (
+                *self._to_2_7bit_bytes(note_id),   # 2 bytes, 7-bit encoded
+                pitch,                      # 1 byte
+                *self._to_3_7bit_bytes(start_time),# 3 bytes, 7-bit encoded
+                *self._to_3_7bit_bytes(duration),  # 3 bytes, 7-bit encoded
+                velocity,  
+                (mute << 7) | probability
+            )
+        return records
+
+    def _send_chunked_note_data(self, data, manufacturer_id):
+        status_byte = 0xF0
+        end_byte = 0xF7
+        device_id = 0x01
+        max_chunk_length = 240
+
+        # Split data if it's too large for a single SysEx message
+        num_of_chunks = max(1, (len(data) + max_chunk_length - 1) // max_chunk_length)
+                
+        for chunk_index in range(num_of_chunks):
+            start_index = chunk_index * max_chunk_length
+            end_index = start_index + max_chunk_length
+            chunk_data = data[start_index:end_index]
+            
+            # Add prefix and suffix to chunks
+            prefix = "_" if chunk_index == num_of_chunks - 1 else "$"
+            chunk_data = prefix.encode('ascii') + chunk_data
+        
+            # Send the SysEx message
+            sys_ex_message = (status_byte, manufacturer_id, device_id) + tuple(chunk_data) + (end_byte,)
+            # self.log_message("Sending SysEx chunk")
+            self._send_midi(sys_ex_message)
+
+    def _invalidate_selected_clip_note_cache(self):
+        self._selected_clip_note_cache = None
+        self._selected_clip_note_cache_clip = None
+
+    def _request_selected_clip_notes_resync(self, message):
+        # Apps that ask for an explicit resync understand 0x4C note deltas.
+        self._selected_clip_note_deltas_enabled = True
+        self.send_selected_clip_notes(force_full=True)
+
+    def send_selected_clip_notes(self, force_full=False):
         """
-        Encode a full clip with all notes into a compact SysEx message and send it out.
+        Send the highlighted clip's notes. The first send for a clip is the full
+        0x0D payload; later edits of the same clip only send the notes that were
+        added, modified or removed since the cached state.
         """
         if self._selected_clip_updates_are_suppressed():
             self._selected_clip_update_pending_notes = True
             return
         if self.seq_status:
-            status_byte = 0xF0
-            end_byte = 0xF7
-            manufacturer_id = 0x0D
-            device_id = 0x01
-            max_chunk_length = 240
             data = bytearray()
                 
             song = self.song()
@@ -16693,62 +18220,51 @@ class Tap(ControlSurface):
             if clip_slot is not None:
                 if clip_slot.has_clip:
                     selected_clip = clip_slot.clip
-                
-                    # Extract clip metadata
-                    clip_start = min(selected_clip.start_time, selected_clip.start_marker, selected_clip.loop_start) - self.clip_length_trick
-                    clip_length = (max(selected_clip.loop_end, selected_clip.end_marker, selected_clip.length) + self.clip_length_trick) - clip_start
-                    
-                    # Get notes
-                    notes = selected_clip.get_notes_extended(0, 128, clip_start, clip_length)
-                    decoupled_info = self._decoupled_automation_info(selected_clip)
-                    if decoupled_info:
-                        notes = [
-                            note for note in notes
-                            if note.start_time >= decoupled_info["note_start"] - 0.000001
-                            and note.start_time < decoupled_info["note_end"] - 0.000001
-                        ]
-                    # self.log_message(f"Number of notes found: {len(notes)}")
-                    for note in notes:
-                        note_id = int(note.note_id)
-                        pitch = int(note.pitch)
-                        start_time = int(note.start_time * 1000)
-                        duration = int(note.duration * 1000)
-                        velocity = int(note.velocity)
-                        mute = 1 if note.mute else 0
-                        probability = int(note.probability * 127)
-                    
-                        note_data = [
-                            *self._to_2_7bit_bytes(note_id),   # 2 bytes, 7-bit encoded
-                            pitch,                      # 1 byte
-                            *self._to_3_7bit_bytes(start_time),# 3 bytes, 7-bit encoded
-                            *self._to_3_7bit_bytes(duration),  # 3 bytes, 7-bit encoded
-                            velocity,  
-                            (mute << 7) | probability
-                        ]
-                    
-                        data.extend(note_data)
+                    records = self._selected_clip_note_records(selected_clip)
+                    previous_records = self._selected_clip_note_cache
+                    can_send_delta = (
+                        not force_full
+                        and self._selected_clip_note_deltas_enabled
+                        and previous_records is not None
+                        and self._selected_clip_note_cache_clip == selected_clip
+                    )
+                    self._selected_clip_note_cache = records
+                    self._selected_clip_note_cache_clip = selected_clip
+                    if can_send_delta:
+                        self._send_selected_clip_note_delta(previous_records, records)
+                        return
+                    # self.log_message(f"Number of notes found: {len(records)}")
+                    for record in records.values():
+                        data.extend(record)
                 else:
+                    self._invalidate_selected_clip_note_cache()
                     # Indicate no clip selected by adding a recognizable marker
                     data.extend([0x7F, 0x7F, 0x7F])
                     if not clip_slot.has_clip_has_listener(self.on_highlighted_slot_changed):
                         clip_slot.add_has_clip_listener(self.on_highlighted_slot_changed)
-                
-            # Split data if it's too large for a single SysEx message
-            num_of_chunks = max(1, (len(data) + max_chunk_length - 1) // max_chunk_length)
-                    
-            for chunk_index in range(num_of_chunks):
-                start_index = chunk_index * max_chunk_length
-                end_index = start_index + max_chunk_length
-                chunk_data = data[start_index:end_index]
-                
-                # Add prefix and suffix to chunks
-                prefix = "_" if chunk_index == num_of_chunks - 1 else "$"
-                chunk_data = prefix.encode('ascii') + chunk_data
-            
-                # Send the SysEx message
-                sys_ex_message = (status_byte, manufacturer_id, device_id) + tuple(chunk_data) + (end_byte,)
-                # self.log_message("Sending SysEx chunk")
-                self._send_midi(sys_ex_message)
+            else:
+                self._invalidate_selected_clip_note_cache()
+
+            self._send_chunked_note_data(data, 0x0D)
+
+    def _send_selected_clip_note_delta(self, previous_records, records):
+        """
+        0x4C payload: removed note count (2 bytes), removed note ids (2 bytes
+        each), then one 11-byte note record per added or modified note.
+        """
+        removed_ids = [note_id for note_id in previous_records if note_id not in records]
+        changed_records = [
+            record for note_id, record in records.items()
+            if previous_records.get(note_id) != record
+        ]
+        if not removed_ids and not changed_records:
+            return
+        data = bytearray(self._to_2_7bit_bytes(len(removed_ids)))
+        for note_id in removed_ids:
+            data.extend(self._to_2_7bit_bytes(note_id))
+        for record in changed_records:
+            data.extend(record)
+        self._send_chunked_note_data(data, 0x4C)
     
     def send_out_playing_pos(self, value, beats_per_bar, force=False, hidden=False):
         if hidden:
@@ -16949,6 +18465,8 @@ class Tap(ControlSurface):
             self.browser_current_page = 0
             self.browser_pages_count = (len(self.browser_current_items) + self.browser_items_per_page - 1) // self.browser_items_per_page
             self._send_browser_page(self.browser_current_page)
+            # Warm the search index while the user is browsing.
+            self._ensure_browser_search_index(self._browser_search_index_categories([]))
 
         except Exception as e:
             self._debug_log(f"Error starting browser: {str(e)}")
@@ -17255,6 +18773,294 @@ class Tap(ControlSurface):
         root = str(item_path[0]).casefold() if item_path else ''
         return root in ('sounds', 'drums', 'instruments', 'samples')
 
+    def _browser_search_index_categories(self, tag_indices, search_scope=''):
+        if search_scope == 'samples':
+            return [10, 11, 12]
+        if tag_indices:
+            return list(tag_indices)
+        return list(self.browser_searchable_tag_indices)
+
+    def _ensure_browser_search_index(self, category_indexes):
+        """Queue missing categories for a build and stale ones for a refresh."""
+        now = time.time()
+        building = self.browser_search_index_work
+        for category_index in category_indexes:
+            if building is not None and building['category_index'] == category_index:
+                continue
+            if category_index in self.browser_search_index_queue:
+                continue
+            index = self.browser_search_index.get(category_index)
+            if index is None or now - index['built_at'] >= self.browser_search_index_max_age:
+                self.browser_search_index_queue.append(category_index)
+        if building is None:
+            self._start_next_browser_search_index()
+
+    def _start_next_browser_search_index(self):
+        self.browser_search_index_work = None
+        if not self.browser_search_index_queue:
+            return
+        category_index = self.browser_search_index_queue.pop(0)
+        label = self.browser_folder_labels.get(category_index, '')
+        roots = self._browser_items_for_category(category_index)
+        previous_index = self.browser_search_index.get(category_index)
+        self.browser_search_index_generation += 1
+        generation = self.browser_search_index_generation
+        self.browser_search_index_work = {
+            'category_index': category_index,
+            # (item, parent path, parent folder key, position, reused entry)
+            'stack': [(item, (label,), None, position, None) for position, item in reversed(list(enumerate(roots)))],
+            'visited': set(),
+            'traversed': 0,
+            'entries': [],
+            'tokens': {},
+            'folders': {},
+            'previous_folders': previous_index['folders'] if previous_index else {},
+        }
+        self.schedule_message(1, lambda: self._continue_browser_search_index(generation))
+
+    def _add_browser_search_index_entry(self, work, entry):
+        entry_index = len(work['entries'])
+        work['entries'].append(entry)
+        for token in entry['tokens']:
+            work['tokens'].setdefault(token, []).append(entry_index)
+
+    def _continue_browser_search_index(self, generation):
+        """
+        Walks one batch of a category. A folder whose child names match the
+        previous index reuses its leaf entries and only descends into its
+        subfolders, so a refresh re-reads only the folders that changed.
+        Folders are re-listed even when they were empty, since only their
+        own listing shows what was added to them.
+        """
+        work = self.browser_search_index_work
+        if work is None or generation != self.browser_search_index_generation:
+            return
+
+        processed = 0
+        while (
+            work['stack'] and
+            work['traversed'] < self.browser_search_index_max_items and
+            processed < self.browser_search_index_batch_size
+        ):
+            item, parent_path, parent_key, position, reused_entry = work['stack'].pop()
+            processed += 1
+            parent_folder = work['folders'].get(parent_key)
+            if reused_entry is not None:
+                if reused_entry['key'] in work['visited']:
+                    continue
+                work['visited'].add(reused_entry['key'])
+                work['traversed'] += 1
+                self._add_browser_search_index_entry(work, reused_entry)
+                parent_folder['leaves'].append((position, reused_entry))
+                continue
+
+            key = self._browser_item_search_key(item)
+            if key in work['visited']:
+                continue
+            work['visited'].add(key)
+            work['traversed'] += 1
+
+            name = str(getattr(item, 'name', ''))
+            path = parent_path + ((name,) if name else tuple())
+            entry = None
+            if self._browser_item_is_loadable(item):
+                try:
+                    source = str(item.source)
+                except Exception:
+                    source = ''
+                haystack = ' '.join(path + ((source,) if source else tuple())).casefold()
+                entry = {
+                    'item': item,
+                    'key': key,
+                    'normalized_name': name.casefold(),
+                    'path': path,
+                    'tokens': tuple(set(haystack.split())),
+                    'is_sample': self._browser_item_is_sample(item),
+                    'can_preview': None,
+                }
+                self._add_browser_search_index_entry(work, entry)
+
+            try:
+                children = list(item.children)
+            except Exception:
+                children = []
+            try:
+                is_folder = bool(children) or bool(item.is_folder)
+            except Exception:
+                is_folder = False
+            if not is_folder:
+                if parent_folder is not None:
+                    parent_folder['leaves'].append((position, entry))
+                continue
+            if parent_folder is not None:
+                parent_folder['branches'].append(position)
+
+            names = tuple(str(getattr(child, 'name', '')) for child in children)
+            folder = {'names': names, 'path': path, 'leaves': [], 'branches': []}
+            work['folders'][key] = folder
+            previous = work['previous_folders'].get(key)
+            if previous is not None and previous['names'] == names and previous['path'] == path:
+                reused = dict(previous['leaves'])
+                branches = set(previous['branches'])
+                for child_position in range(len(children) - 1, -1, -1):
+                    if child_position in branches:
+                        work['stack'].append((children[child_position], path, key, child_position, None))
+                    elif reused.get(child_position) is not None:
+                        work['stack'].append((None, path, key, child_position, reused[child_position]))
+                    elif child_position in reused:
+                        work['traversed'] += 1
+                        folder['leaves'].append((child_position, None))
+                    else:
+                        work['stack'].append((children[child_position], path, key, child_position, None))
+                continue
+            for child_position in range(len(children) - 1, -1, -1):
+                work['stack'].append((children[child_position], path, key, child_position, None))
+
+        if work['stack'] and work['traversed'] < self.browser_search_index_max_items:
+            self.schedule_message(1, lambda: self._continue_browser_search_index(generation))
+            return
+
+        work['token_list'] = list(work['tokens'])
+        work['token_position'] = 0
+        work['suffix_runs'] = []
+        work['suffix_merge'] = None
+        work['suffixes'] = []
+        work['suffix_tokens'] = []
+        self.schedule_message(1, lambda: self._continue_browser_search_index_suffixes(generation))
+
+    def _continue_browser_search_index_suffixes(self, generation):
+        """
+        Lists every suffix of every token, sorted, so a substring term is a
+        bisected prefix range instead of a scan of the vocabulary. Sorted runs
+        are built one batch per tick and then merged one batch per tick.
+        """
+        work = self.browser_search_index_work
+        if work is None or generation != self.browser_search_index_generation:
+            return
+
+        batch_size = self.browser_search_index_suffix_batch_size
+        if work['suffix_merge'] is None:
+            tokens = work['token_list']
+            position = work['token_position']
+            run = []
+            while position < len(tokens) and len(run) < batch_size:
+                token = tokens[position]
+                run.extend((token[offset:], token) for offset in range(len(token)))
+                position += 1
+            work['token_position'] = position
+            if run:
+                run.sort()
+                work['suffix_runs'].append(run)
+            if position >= len(tokens):
+                work['suffix_merge'] = heapq.merge(*work['suffix_runs'])
+            self.schedule_message(1, lambda: self._continue_browser_search_index_suffixes(generation))
+            return
+
+        suffixes = work['suffixes']
+        suffix_tokens = work['suffix_tokens']
+        merged_count = len(suffixes)
+        for suffix, token in islice(work['suffix_merge'], batch_size):
+            suffixes.append(suffix)
+            suffix_tokens.append(token)
+        if len(suffixes) - merged_count == batch_size:
+            self.schedule_message(1, lambda: self._continue_browser_search_index_suffixes(generation))
+            return
+
+        self.browser_search_index[work['category_index']] = {
+            'entries': work['entries'],
+            'tokens': work['tokens'],
+            'suffixes': suffixes,
+            'suffix_tokens': suffix_tokens,
+            'folders': work['folders'],
+            'traversed': work['traversed'],
+            'built_at': time.time(),
+        }
+        self._start_next_browser_search_index()
+
+    def _browser_search_index_entry_ids(self, index, terms):
+        # Terms never contain whitespace, so "term in haystack" is the same as
+        # "term is a prefix of a suffix of one of the haystack's tokens".
+        if not terms:
+            return range(len(index['entries']))
+        suffixes = index['suffixes']
+        suffix_tokens = index['suffix_tokens']
+        entry_ids = None
+        for term in sorted(set(terms), key=len, reverse=True):
+            term_ids = set()
+            matched_tokens = set()
+            position = bisect.bisect_left(suffixes, term)
+            while position < len(suffixes) and suffixes[position].startswith(term):
+                token = suffix_tokens[position]
+                if token not in matched_tokens:
+                    matched_tokens.add(token)
+                    term_ids.update(index['tokens'][token])
+                position += 1
+            entry_ids = term_ids if entry_ids is None else entry_ids & term_ids
+            if not entry_ids:
+                return []
+        return sorted(entry_ids)
+
+    def _browser_search_from_index(self, normalized_query, tag_indices, search_scope):
+        """
+        Answer a search from the index, or return None when the index cannot
+        cover the requested scope yet.
+        """
+        base_path = tuple()
+        if not tag_indices and search_scope != 'samples':
+            state = self.browser_search_restore_state
+            if state and state['items']:
+                base_path = tuple(state.get('path', ()))
+                label_categories = dict((label, index) for index, label in self.browser_folder_labels.items())
+                category_index = label_categories.get(base_path[0]) if base_path else None
+                if category_index is None:
+                    return None
+                category_indexes = [category_index]
+            else:
+                category_indexes = self._browser_search_index_categories(tag_indices, search_scope)
+        else:
+            category_indexes = self._browser_search_index_categories(tag_indices, search_scope)
+
+        self._ensure_browser_search_index(category_indexes)
+        if any(category_index not in self.browser_search_index for category_index in category_indexes):
+            return None
+
+        terms = [term for term in normalized_query.split() if term]
+        base_length = len(base_path)
+        seen_keys = set()
+        matches = []
+        traversed = 0
+        for category_index in category_indexes:
+            index = self.browser_search_index[category_index]
+            traversed += index['traversed']
+            entries = index['entries']
+            for entry_id in self._browser_search_index_entry_ids(index, terms):
+                entry = entries[entry_id]
+                path = entry['path']
+                if base_length and (len(path) <= base_length or path[:base_length] != base_path):
+                    continue
+                if search_scope == 'samples' and not entry['is_sample']:
+                    continue
+                if entry['key'] in seen_keys:
+                    continue
+                seen_keys.add(entry['key'])
+                normalized_name = entry['normalized_name']
+                if normalized_query and normalized_name == normalized_query:
+                    rank = 0
+                elif normalized_query and normalized_name.startswith(normalized_query):
+                    rank = 1
+                elif normalized_query and normalized_query in normalized_name:
+                    rank = 2
+                else:
+                    rank = 3
+                if entry['can_preview'] is None:
+                    entry['can_preview'] = self._browser_item_can_preview(entry['item'], path)
+                group_label = str(path[1]) if len(path) > 1 else (str(path[0]) if path else '')
+                matches.append((rank, normalized_name, entry['item'], entry['can_preview'], group_label))
+        # The whole result set is known up front, so rank order cannot make
+        # visible rows jump around; discovery order breaks ties.
+        matches.sort(key=lambda match: match[0])
+        return matches, traversed
+
     def _publish_browser_search_matches(self, work):
         # Search walks one root folder at a time. Keeping discovery order makes
         # every partial update append-only, so visible rows never jump around.
@@ -17395,6 +19201,17 @@ class Tap(ControlSurface):
             return
 
         normalized_query = query.casefold()
+        indexed_result = self._browser_search_from_index(normalized_query, tag_indices, search_scope)
+        if indexed_result is not None:
+            matches, traversed = indexed_result
+            self.browser_search_work = None
+            self.browser_current_items = []
+            self.browser_current_page = 0
+            self.browser_pages_count = 0
+            self._publish_browser_search_matches({'matches': matches})
+            self._send_browser_search_progress(2, traversed, len(matches), '')
+            return
+
         roots = self._browser_search_roots(tag_indices, search_scope)
         initial_location = str(roots[0][1][0]) if roots and roots[0][1] else ''
         self.browser_current_items = []
@@ -17627,26 +19444,19 @@ class Tap(ControlSurface):
         self._simpler_device = None
         self._simpler_sample = None
         self._remove_meld_engine_listener()
-        if self._metadata_recheck_timer:
-            self._metadata_recheck_timer.cancel()
-            self._metadata_recheck_timer = None
-        if self._automation_metadata_update_timer:
-            self._automation_metadata_update_timer.cancel()
-            self._automation_metadata_update_timer = None
-        if hasattr(self, '_mixer_disconnect_timer') and self._mixer_disconnect_timer:
-            self._mixer_disconnect_timer.cancel()
-            self._mixer_disconnect_timer = None
-        self._cancel_bank_metadata_refreshes()
+        self._scheduled_tasks.clear()
         self._cancel_smooth_macro_randomize()
-        if hasattr(self, '_periodic_timer_ref') and self._periodic_timer_ref:
-            self._periodic_timer_ref.cancel()
-            self._periodic_timer_ref = None
         self._remove_follow_action_runtime_listeners()
         self._remove_follow_action_name_listeners()
         self._remove_follow_action_song_listeners()
+        self._set_playhead_note_index_clip(None)
+        self._clip_name_marker_cache.clear()
         self._mutator_regeneration_states.clear()
         self._mutator_generation_in_progress.clear()
         self._mutator_generation_scheduled.clear()
+        self._mutator_generation_jobs.clear()
+        self._mutator_prepared_generations.clear()
+        self._mutator_generation_memo.clear()
         self._queued_mutator_work.clear()
         self._last_mutator_generation_times.clear()
         self._last_mutator_generation_request_times.clear()
@@ -17657,6 +19467,7 @@ class Tap(ControlSurface):
         
         # Clear caches
         self._metadata_cache.clear()
+        self._parameter_metadata_fragment_cache.clear()
         self._metadata_send_seq_by_device.clear()
         for control_index in list(getattr(self, '_active_high_resolution_gestures', set())):
             mapped_parameter = self._mapped_parameter_for_device_control(control_index)
@@ -17711,6 +19522,7 @@ class Tap(ControlSurface):
         song = self.song()
         # periodic_check_button.remove_value_listener(self._periodic_check)
         self._remove_song_listener(song, "tracks", self._on_tracks_changed)
+        self._remove_song_listener(song, "scenes", self._on_clip_grid_scenes_changed)
         # self.song().view.remove_selected_track_listener(self._on_selected_track_changed)
         # self._unregister_clip_and_audio_listeners()
         # self.remove_midi_listener(self._midi_listener)
@@ -17739,5 +19551,7 @@ class Tap(ControlSurface):
             master_track = self.song().master_track
             left_listener, right_listener = self._master_level_listeners.get(master_track, (None, None))
             self._remove_output_meter_listener_pair(master_track, left_listener, right_listener)
-        
+
+        self._flush_outbound_midi_frame()
+        self._outbound_midi_frame = None
         super(Tap, self).disconnect()
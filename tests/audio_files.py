@@ -0,0 +1,96 @@
+"""
+Writers for small uncompressed WAV and AIFF(-C) files with known samples.
+"""
+
+import math
+import struct
+
+
+def sample_signal(frame_count, channels, peak, seed=1):
+    """Interleaved integer samples: a sine per channel plus a few spikes."""
+    samples = []
+    for frame in range(frame_count):
+        for channel in range(channels):
+            value = peak * 0.8 * math.sin(2.0 * math.pi * (frame + 37 * channel) / (97.0 + 13 * seed))
+            if (frame * 7 + channel) % 1013 == 0:
+                value = -peak if channel % 2 else peak - 1
+            samples.append(int(value))
+    return samples
+
+
+def _pack_integers(samples, sample_width, little_endian):
+    if sample_width == 1:
+        return bytes(value & 0xFF for value in samples)
+    if sample_width == 3:
+        data = bytearray()
+        for value in samples:
+            packed = (value & 0xFFFFFF).to_bytes(3, 'little' if little_endian else 'big')
+            data += packed
+        return bytes(data)
+    code = {2: 'h', 4: 'i'}[sample_width]
+    return struct.pack(('<' if little_endian else '>') + code * len(samples), *samples)
+
+
+def _pack_floats(samples, sample_width, little_endian, peak):
+    code = 'f' if sample_width == 4 else 'd'
+    return struct.pack(('<' if little_endian else '>') + code * len(samples), *(value / float(peak) for value in samples))
+
+
+def write_wav(path, samples, channels, sample_width, is_float=False, peak=None, extensible=False):
+    if is_float:
+        data = _pack_floats(samples, sample_width, True, peak)
+        format_tag = 3
+    elif sample_width == 1:
+        data = bytes((value + 128) & 0xFF for value in samples)
+        format_tag = 1
+    else:
+        data = _pack_integers(samples, sample_width, True)
+        format_tag = 1
+    bits = sample_width * 8
+    block_align = channels * sample_width
+    fmt = struct.pack('<HHIIHH', 0xFFFE if extensible else format_tag, channels, 44100,
+                      44100 * block_align, block_align, bits)
+    if extensible:
+        fmt += struct.pack('<HHI', 22, bits, 0) + struct.pack('<H', format_tag) + b'\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
+    chunks = b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+    chunks += b'LIST' + struct.pack('<I', 4) + b'INFO'
+    chunks += b'data' + struct.pack('<I', len(data)) + data + (b'\x00' if len(data) & 1 else b'')
+    with open(path, 'wb') as wav_file:
+        wav_file.write(b'RIFF' + struct.pack('<I', 4 + len(chunks)) + b'WAVE' + chunks)
+
+
+def _extended_44100():
+    # 44100 as an 80-bit IEEE extended float.
+    return b'\x40\x0e\xac\x44\x00\x00\x00\x00\x00\x00'
+
+
+def write_aiff(path, samples, channels, sample_width, compression=None, peak=None):
+    """compression: None for AIFF, or an AIFF-C type such as b'NONE', b'sowt', b'fl32'."""
+    frame_count = len(samples) // channels
+    if compression in (b'fl32', b'fl64'):
+        data = _pack_floats(samples, 4 if compression == b'fl32' else 8, False, peak)
+        bits = 32 if compression == b'fl32' else 64
+    else:
+        data = _pack_integers(samples, sample_width, compression == b'sowt')
+        bits = sample_width * 8
+    comm = struct.pack('>hIh', channels, frame_count, bits) + _extended_44100()
+    if compression is not None:
+        comm += compression + b'\x00\x00'
+    chunks = b'COMM' + struct.pack('>I', len(comm)) + comm
+    ssnd = struct.pack('>II', 0, 0) + data
+    chunks += b'SSND' + struct.pack('>I', len(ssnd)) + ssnd + (b'\x00' if len(ssnd) & 1 else b'')
+    form_type = b'AIFF' if compression is None else b'AIFC'
+    with open(path, 'wb') as aiff_file:
+        aiff_file.write(b'FORM' + struct.pack('>I', 4 + len(chunks)) + form_type + chunks)
+
+
+def reference_bins(samples, channels, bin_frames):
+    """Per-bin min and max over all channels, computed the slow way."""
+    minimums = []
+    maximums = []
+    step = bin_frames * channels
+    for start in range(0, len(samples), step):
+        block = samples[start:start + step]
+        minimums.append(min(block))
+        maximums.append(max(block))
+    return minimums, maximums
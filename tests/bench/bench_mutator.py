@@ -0,0 +1,75 @@
+"""
+Mutator generation time and allocations per algorithm and per operation
+slot, on a dense two-bar melodic loop and a rhythmic loop. Run explicitly:
+
+    python -m pytest tests/bench/bench_mutator.py
+"""
+
+import random
+import tracemalloc
+
+import pytest
+
+import Tap as tap_module
+from conftest import start_tap
+from live_set import build_song
+from mutator_sources import SLOT_OPERATION_NAMES, SOURCES, mutator_settings, operation_names
+
+
+@pytest.fixture(scope='module')
+def tap():
+    tap, _ = start_tap(build_song(1, 1), connect=False)
+    yield tap
+    tap.disconnect()
+
+
+def record_allocations(benchmark, function):
+    """Peak traced memory and blocks still held by one call."""
+    tracemalloc.start()
+    try:
+        before_blocks = len(tracemalloc.take_snapshot().traces)
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        result = function()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        after_blocks = len(tracemalloc.take_snapshot().traces)
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info['peak_kib'] = round((peak_memory - start_memory) / 1024.0, 1)
+    benchmark.extra_info['held_blocks'] = after_blocks - before_blocks
+    return result
+
+
+@pytest.mark.parametrize('algorithm', tap_module.Tap.MUTATOR_ALGORITHMS)
+@pytest.mark.parametrize('kind', sorted(SOURCES))
+def test_algorithm_sections(benchmark, tap, algorithm, kind):
+    """All 17 section roles of a chain, as one generation pass builds them."""
+    source = SOURCES[kind](seed=3, count=64 if kind == 'melodic' else 128)
+    settings = mutator_settings(tap, algorithm, seed=3, rhythm=kind == 'rhythmic', depth=0.6)
+
+    def generate():
+        return [
+            tap._mutator_make_section_values(source, role, 0.0, 16.0, settings, random.Random(role))
+            for role in range(17)
+        ]
+
+    benchmark(generate)
+    record_allocations(benchmark, generate)
+
+
+@pytest.mark.parametrize('operation', range(10 + len(SLOT_OPERATION_NAMES)))
+@pytest.mark.parametrize('kind', sorted(SOURCES))
+def test_operation_pipeline(benchmark, tap, operation, kind):
+    """One operation slot through the depth pipeline at full role strength."""
+    rhythm = kind == 'rhythmic'
+    source = SOURCES[kind](seed=3, count=64 if kind == 'melodic' else 128)
+    settings = mutator_settings(tap, seed=3, rhythm=rhythm, depth=0.6, operations=(operation,))
+    target_pitches = settings['target_pitches'] or None
+
+    def apply():
+        return tap._mutator_apply_depth_pipeline(
+            source, 5, 16.0, settings, random.Random(operation), rhythm=rhythm, target_pitches=target_pitches)
+
+    benchmark(apply)
+    benchmark.extra_info['operation'] = operation_names(tap)[operation]
+    record_allocations(benchmark, apply)
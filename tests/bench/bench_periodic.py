@@ -0,0 +1,95 @@
+"""
+Timings for Tap's per-tick and SysEx paths on synthetic sets of 16/128
+tracks by 8/256 scenes. Run explicitly:
+
+    python -m pytest tests/bench/bench_periodic.py
+"""
+
+import itertools
+
+import pytest
+
+from conftest import start_tap
+from live_set import build_song, sysex, text_sysex
+
+GRID_SIZES = [(16, 8), (16, 256), (128, 8), (128, 256)]
+
+
+@pytest.fixture(scope='module', params=GRID_SIZES, ids=lambda size: '{}x{}'.format(*size))
+def grid(request):
+    track_count, scene_count = request.param
+    song = build_song(track_count, scene_count, notes_per_clip=4)
+    tap, c_instance = start_tap(song)
+    # Clip view, where clip slot deltas are flushed every frame.
+    tap.device_status = False
+    tap.handle_sysex(sysex(0x48, ()))
+    tap.update_display()
+    yield song, tap, c_instance
+    tap.disconnect()
+
+
+def launched_slots(song, count):
+    slots = [slot for track in song.tracks for slot in track.clip_slots if slot.has_clip]
+    return slots[:count]
+
+
+def test_full_clip_grid(benchmark, grid):
+    song, tap, c_instance = grid
+
+    def reset():
+        tap.old_clips_array = []
+        c_instance.sent_midi = []
+
+    def resend():
+        tap._update_clip_slots()
+        tap._flush_outbound_midi_frame()
+
+    benchmark.pedantic(resend, setup=reset, rounds=10)
+    assert len(c_instance.sysex(0x05)) >= len(song.tracks)
+
+
+def test_periodic_check(benchmark, grid):
+    _, tap, _ = grid
+    benchmark(tap._periodic_check)
+
+
+def test_idle_frame(benchmark, grid):
+    _, tap, _ = grid
+    tap.update_display()
+    benchmark(tap.update_display)
+
+
+def test_launch_burst_frame(benchmark, grid):
+    song, tap, c_instance = grid
+    slots = launched_slots(song, 32)
+    states = itertools.cycle((True, False))
+
+    def launch():
+        playing = next(states)
+        for slot in slots:
+            slot.is_playing = playing
+        c_instance.sent_midi = []
+
+    benchmark.pedantic(tap.update_display, setup=launch, rounds=20)
+    assert c_instance.sysex(0x4B)
+
+
+def test_sysex_mix(benchmark, grid):
+    song, tap, _ = grid
+    track_count = min(len(song.tracks), 128)
+    scene_count = min(len(song.scenes), 128)
+    messages = [text_sysex(22, '121.5'), text_sysex(22, '120.0'), sysex(23, (1,)), sysex(23, (0,))]
+    for index in range(16):
+        track_index = (index * 7) % track_count
+        scene_index = (index * 5) % scene_count
+        messages.append(sysex(9, (1, track_index, scene_index)))
+    messages.append(sysex(37, ()))
+    messages.append(sysex(0x47, (1, 0, 1, 2, 3)))
+    messages.append(sysex(0x47, (0,)))
+
+    def replay():
+        for message in messages:
+            tap.handle_sysex(message)
+        tap.update_display()
+
+    benchmark(replay)
@@ -0,0 +1,71 @@
+"""
+Replays a recorded-style SysEx mix through handle_sysex: mostly encoder
+gestures (ID 39) and note edits (ID 16), as sent while playing a set.
+Run the same file on an older checkout to compare messages per second:
+
+    python -m pytest tests/bench/bench_sysex.py
+"""
+
+import random
+
+from conftest import start_tap
+from live_set import build_song, note_edit_values, seven_bit_3, sysex, text_sysex
+
+
+def message_mix(song, count=1000, seed=7):
+    rng = random.Random(seed)
+    clip = song.view.highlighted_clip_slot.clip
+    notes = clip.get_all_notes_extended()
+    messages = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.6:
+            value = rng.randint(0, 65535)
+            messages.append(sysex(39, (rng.randint(0, 7), rng.choice((0, 1, 1, 1, 2))) + seven_bit_3(value)))
+        elif roll < 0.9:
+            note = rng.choice(notes)
+            messages.append(sysex(16, note_edit_values(note, pitch=rng.randint(36, 84))))
+        elif roll < 0.95:
+            messages.append(text_sysex(22, '{:.1f}'.format(rng.uniform(90.0, 140.0))))
+        else:
+            messages.append(sysex(37, ()))
+    return messages
+
+
+def report_rate(benchmark, message_count):
+    stats = benchmark.stats
+    mean = stats['mean'] if isinstance(stats, dict) else stats.stats.mean
+    benchmark.extra_info['messages_per_second'] = int(message_count / mean)
+
+
+def test_sysex_message_mix(benchmark):
+    song = build_song(16, 8, clip_density=1.0, notes_per_clip=32)
+    track = song.tracks[0]
+    track.view.selected_device = track.devices[0]
+    song.view.highlighted_clip_slot = track.clip_slots[0]
+    tap, _ = start_tap(song)
+    messages = message_mix(song)
+
+    def replay():
+        for message in messages:
+            tap.handle_sysex(message)
+        tap.update_display()
+
+    benchmark.pedantic(replay, rounds=5, warmup_rounds=1)
+    report_rate(benchmark, len(messages))
+    tap.disconnect()
+
+
+def test_sysex_dispatch_only(benchmark):
+    # Gesture state 9 is rejected by the handler straight away, so this
+    # measures finding the handler rather than what it does.
+    tap, _ = start_tap(build_song(4, 4))
+    messages = [sysex(39, (index % 8, 9, 0, 0, 0)) for index in range(1000)]
+
+    def replay():
+        for message in messages:
+            tap.handle_sysex(message)
+
+    benchmark.pedantic(replay, rounds=5, warmup_rounds=1)
+    report_rate(benchmark, len(messages))
+    tap.disconnect()
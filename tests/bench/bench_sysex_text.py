@@ -0,0 +1,65 @@
+"""
+SysEx text throughput on realistic Live names and automation payloads.
+Run explicitly:
+
+    python -m pytest tests/bench/bench_sysex_text.py
+"""
+
+import pytest
+
+from conftest import start_tap
+from live_set import build_song
+from sysex_text import automation_payload, name_corpus, reference_escape, reference_split, reference_unescape
+
+
+@pytest.fixture(scope='module')
+def tap():
+    tap, _ = start_tap(build_song(1, 1), connect=False)
+    yield tap
+    tap.disconnect()
+
+
+@pytest.fixture(scope='module')
+def names():
+    return name_corpus()
+
+
+def test_escape_reference(benchmark, names):
+    benchmark(lambda: [reference_escape(name) for name in names])
+
+
+def test_escape_cold_cache(benchmark, tap, names):
+    def clear():
+        tap._sanitized_sysex_text_cache.clear()
+        tap._escaped_sysex_text_cache.clear()
+
+    benchmark.pedantic(lambda: [tap._escape_sysex_string(name) for name in names], setup=clear, rounds=10)
+
+
+def test_escape_warm_cache(benchmark, tap, names):
+    benchmark(lambda: [tap._escape_sysex_string(name) for name in names])
+
+
+def split_payload(split, unescape, payload):
+    fields = split(payload, '|')
+    steps = split(fields[4], ',')
+    return [unescape(field) for field in fields], steps
+
+
+# A plain write token keeps the payload escape-free; an escaped one forces
+# the escape-aware path over the whole payload.
+PAYLOADS = {'plain': automation_payload(1024), 'escaped': automation_payload(1024, token='write\\|1')}
+
+
+@pytest.mark.parametrize('kind', sorted(PAYLOADS))
+def test_split_automation_payload_reference(benchmark, kind):
+    payload = PAYLOADS[kind]
+    benchmark(split_payload, reference_split, reference_unescape, payload)
+    benchmark.extra_info['bytes'] = len(payload)
+
+
+@pytest.mark.parametrize('kind', sorted(PAYLOADS))
+def test_split_automation_payload(benchmark, tap, kind):
+    payload = PAYLOADS[kind]
+    benchmark(split_payload, tap._split_escaped_sysex_fields, tap._unescape_sysex_string, payload)
+    benchmark.extra_info['bytes'] = len(payload)
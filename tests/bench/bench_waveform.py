@@ -0,0 +1,80 @@
+"""
+Peak extraction on generated 10-minute stereo files, built-in reader versus
+the afconvert subprocess path (macOS only). Run explicitly:
+
+    python -m pytest tests/bench/bench_waveform.py
+"""
+
+import os
+import struct
+
+import pytest
+
+from audio_files import sample_signal, write_aiff, write_wav
+from conftest import start_tap
+from live_set import build_song
+
+SAMPLE_RATE = 44100
+MINUTES = 10
+
+
+def write_long_file(path, writer, sample_width):
+    """Ten minutes of stereo audio, one generated second repeated."""
+    peak = 1 << (8 * sample_width - 1)
+    second = sample_signal(SAMPLE_RATE, 2, peak)
+    block_path = path + '.block'
+    if writer == 'wav':
+        write_wav(block_path, second, 2, sample_width)
+    else:
+        write_aiff(block_path, second, 2, sample_width)
+    with open(block_path, 'rb') as block_file:
+        block = block_file.read()
+    os.remove(block_path)
+    header_size = len(block) - len(second) * sample_width
+    header, data = block[:header_size], block[header_size:]
+    data_size = len(data) * MINUTES * 60
+    if writer == 'wav':
+        header = header[:4] + struct.pack('<I', len(header) - 8 + data_size) + header[8:-4] + struct.pack('<I', data_size)
+    else:
+        frame_count = SAMPLE_RATE * MINUTES * 60
+        comm = header.index(b'COMM') + 8
+        header = bytearray(header)
+        header[4:8] = struct.pack('>I', len(header) - 8 + data_size)
+        header[comm + 2:comm + 6] = struct.pack('>I', frame_count)
+        header[-12:-8] = struct.pack('>I', data_size + 8)
+        header = bytes(header)
+    with open(path, 'wb') as audio_file:
+        audio_file.write(header)
+        for _ in range(MINUTES * 60):
+            audio_file.write(data)
+    return path
+
+
+@pytest.fixture(scope='module')
+def tap():
+    tap, _ = start_tap(build_song(1, 1), connect=False)
+    yield tap
+    tap.disconnect()
+
+
+@pytest.mark.parametrize('writer,sample_width', [('wav', 2), ('wav', 3), ('aiff', 2)])
+def test_builtin_reader(benchmark, tap, tmp_path, writer, sample_width):
+    path = write_long_file(str(tmp_path / ('long.' + writer)), writer, sample_width)
+
+    peaks, minimums, maximums = benchmark.pedantic(
+        tap._decode_audio_waveform, args=(path, 'tap-bench-'), rounds=3)
+
+    # The whole file was read: ten minutes need more than half the bin budget.
+    assert tap.SIMPLER_WAVEFORM_MAX_BINS // 2 < len(maximums) <= tap.SIMPLER_WAVEFORM_MAX_BINS
+    benchmark.extra_info['megabytes'] = os.path.getsize(path) >> 20
+
+
+def test_afconvert_subprocess(benchmark, tap, tmp_path):
+    if not os.path.isfile(tap.AFCONVERT_PATH):
+        pytest.skip('afconvert is only available on macOS')
+    path = write_long_file(str(tmp_path / 'long.wav'), 'wav', 2)
+
+    minimums, maximums = benchmark.pedantic(
+        tap._decode_converted_waveform_bins, args=(path, 'tap-bench-'), rounds=3)
+
+    assert minimums
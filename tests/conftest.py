@@ -0,0 +1,99 @@
+"""
+Runs Tap outside Live against the stand-in modules in tests/stubs.
+
+Benchmarks use pytest-benchmark when it is installed. Without it a small
+fallback fixture times the same calls and reports them at the end of the run.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[0:0] = [os.path.join(TESTS_DIR, 'stubs'), os.path.dirname(TESTS_DIR)]
+
+import Tap as tap_module  # noqa: E402
+from live_set import CInstance, build_song  # noqa: E402
+
+
+def start_tap(song, connect=True):
+    """
+    A Tap for the song, by default past the app handshake and its first
+    frame, with the MIDI sent so far cleared.
+    """
+    c_instance = CInstance(song)
+    tap = tap_module.Tap(c_instance)
+    if connect:
+        tap._connection_established(1)
+        tap.update_display()
+    c_instance.sent_midi = []
+    return tap, c_instance
+
+
+@pytest.fixture
+def make_tap(tmp_path, monkeypatch):
+    """Build Taps that are disconnected after the test; the waveform disk cache goes to tmp_path."""
+    monkeypatch.setattr(
+        tap_module.Tap, '_simpler_waveform_disk_cache_directory',
+        lambda self: str(tmp_path / 'WaveformCache'))
+    surfaces = []
+
+    def make(song=None, connect=True):
+        tap, c_instance = start_tap(song if song is not None else build_song(), connect)
+        surfaces.append(tap)
+        return tap, c_instance
+
+    yield make
+    for tap in surfaces:
+        tap.disconnect()
+
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    _benchmark_results = []
+
+    class _Benchmark(object):
+
+        def __init__(self, name, rounds=5):
+            self.name = name
+            self.rounds = rounds
+            self.stats = None
+            self.extra_info = {}
+
+        def __call__(self, function, *args, **kwargs):
+            return self.pedantic(function, args, kwargs, rounds=self.rounds)
+
+        def pedantic(self, function, args=(), kwargs=None, setup=None, rounds=1, iterations=1, warmup_rounds=0):
+            kwargs = kwargs or {}
+            for _ in range(warmup_rounds):
+                if setup is not None:
+                    setup()
+                function(*args, **kwargs)
+            timings = []
+            result = None
+            for _ in range(rounds):
+                if setup is not None:
+                    setup()
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    result = function(*args, **kwargs)
+                timings.append((time.perf_counter() - started) / iterations)
+            self.stats = {'min': min(timings), 'mean': sum(timings) / len(timings), 'rounds': rounds}
+            _benchmark_results.append((self.name, self.stats, self.extra_info))
+            return result
+
+    @pytest.fixture
+    def benchmark(request):
+        return _Benchmark(request.node.nodeid)
+
+    def pytest_terminal_summary(terminalreporter):
+        if not _benchmark_results:
+            return
+        terminalreporter.section('benchmarks (min / mean, ms)')
+        for name, stats, extra_info in _benchmark_results:
+            terminalreporter.write_line('{:>10.3f} {:>10.3f}  {}{}'.format(
+                stats['min'] * 1000.0, stats['mean'] * 1000.0, name,
+                ''.join('  {}={}'.format(key, value) for key, value in sorted(extra_info.items()))))
@@ -0,0 +1,108 @@
+"""
+Synthetic Live sets for driving Tap through the stand-in Live API.
+"""
+
+import random
+
+import Live
+from Live.Application import Application
+from Live.Clip import MidiNoteSpecification
+from Live.Song import Scene, Song
+from Live.Track import Track
+
+
+class CInstance(object):
+    """The c_instance Live hands a script: song access and a MIDI sink."""
+
+    def __init__(self, song, application=None):
+        self._song = song
+        self._application = application or Application()
+        self.sent_midi = []
+        self.log = []
+        self.midi_map_rebuilds = 0
+
+    def song(self):
+        return self._song
+
+    def application(self):
+        return self._application
+
+    def send_midi(self, midi_bytes):
+        self.sent_midi.append(midi_bytes)
+
+    def log_message(self, message):
+        self.log.append(message)
+
+    def show_message(self, message):
+        pass
+
+    def request_rebuild_midi_map(self):
+        self.midi_map_rebuilds += 1
+
+    def sysex(self, manufacturer_id=None):
+        """Sent SysEx messages, optionally only those with the given id."""
+        return [
+            message for message in self.sent_midi
+            if message[0] == 0xF0 and (manufacturer_id is None or message[1] == manufacturer_id)
+        ]
+
+
+def random_notes(rng, count, length, pitches=range(36, 84)):
+    pitches = list(pitches)
+    notes = []
+    for _ in range(count):
+        start = round(rng.uniform(0.0, length - 0.25) * 4.0) / 4.0
+        notes.append(MidiNoteSpecification(
+            pitch=rng.choice(pitches), start_time=start,
+            duration=rng.choice((0.25, 0.5, 1.0)), velocity=rng.randint(40, 127)))
+    return notes
+
+
+def build_song(track_count=16, scene_count=8, clip_density=0.5, notes_per_clip=16, seed=0):
+    """
+    A set of MIDI tracks with clips scattered over the grid. The same seed
+    always builds the same set.
+    """
+    rng = random.Random(seed)
+    tracks = []
+    for track_index in range(track_count):
+        track = Track('Track {}'.format(track_index + 1), scene_count, send_count=2)
+        track.color = rng.randint(0, 0xFFFFFF)
+        track.devices = (Live.Device.Device('Instrument', type=Live.Device.DeviceType.instrument,
+                                            parameter_names=['Macro {}'.format(i + 1) for i in range(16)]),)
+        for clip_slot in track.clip_slots:
+            if rng.random() < clip_density:
+                clip = clip_slot.create_clip(4.0)
+                clip.name = 'Clip {}'.format(rng.randint(1, 999))
+                clip.add_new_notes(random_notes(rng, notes_per_clip, clip.length))
+        tracks.append(track)
+    scenes = [Scene('Scene {}'.format(index + 1)) for index in range(scene_count)]
+    return Song(tracks=tracks, scenes=scenes)
+
+
+def clip_slot(song, track_index, scene_index):
+    return song.tracks[track_index].clip_slots[scene_index]
+
+
+def sysex(manufacturer_id, values):
+    """An incoming SysEx message as the app sends it."""
+    return (0xF0, manufacturer_id) + tuple(values) + (0xF7,)
+
+
+def text_sysex(manufacturer_id, text):
+    return sysex(manufacturer_id, text.encode('ascii'))
+
+
+def seven_bit_3(value):
+    """A non-negative value as the three 7-bit bytes the app packs times into."""
+    return ((value >> 14) & 0x7F, (value >> 7) & 0x7F, value & 0x7F)
+
+
+def note_edit_values(note, pitch=None, start_time=None):
+    """One note of a 0x10 modify-notes message."""
+    return (
+        (note.note_id & 0x7F, note.note_id >> 7, note.pitch if pitch is None else pitch)
+        + seven_bit_3(int(round((note.start_time if start_time is None else start_time) * 1000.0)))
+        + seven_bit_3(int(round(note.duration * 1000.0)))
+        + (int(note.velocity), int(round(note.probability * 127.0)))
+    )
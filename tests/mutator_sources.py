@@ -0,0 +1,76 @@
+"""
+Synthetic Mutator sources and settings with fixed seeds.
+"""
+
+import random
+
+# Slot operation indexes after the ten depth keys (see _mutator_apply_depth_pipeline).
+SLOT_OPERATION_NAMES = (
+    'add_shift', 'loop_shift', 'reverse', 'invert', 'pitch_add', 'duplicate',
+    'phrase_shift', 'preserver',
+)
+RHYTHM_PITCHES = [36, 38, 42, 46]
+
+
+def operation_names(tap):
+    return tuple(tap._mutator_operation_depth_keys()) + SLOT_OPERATION_NAMES
+
+
+def note(pitch, start, duration, velocity):
+    return {
+        'pitch': pitch, 'start': start, 'duration': duration,
+        'velocity': velocity, 'mute': False, 'probability': 1.0,
+    }
+
+
+def melodic_source(seed=1, count=32):
+    """A two-bar line of sixteenths and eighths over a minor pentatonic."""
+    rng = random.Random(seed)
+    return [
+        note(60 + rng.choice((0, 3, 5, 7, 10, 12)), index * 0.25 + rng.choice((0.0, 0.0, 0.0625)),
+             rng.choice((0.125, 0.25, 0.5)), rng.randint(60, 120))
+        for index in range(count)
+    ]
+
+
+def rhythmic_source(seed=1, count=64):
+    """Two bars of eighth-note drums on kick, snare and hats."""
+    rng = random.Random(seed)
+    return [
+        note(rng.choice(RHYTHM_PITCHES), index * 0.125, 0.0625, rng.randint(60, 120))
+        for index in range(count)
+    ]
+
+
+SOURCES = {'melodic': melodic_source, 'rhythmic': rhythmic_source}
+
+
+def mutator_settings(tap, algorithm='mutator', seed=1, rhythm=False, depth=0.5, operations=()):
+    """
+    Settings as the app sends them, with every depth key at depth and one
+    fully active slot per operation index.
+    """
+    settings = {
+        'preset': 9, 'mutations_per_pass': 2, 'return_after_passes': 2, 'return_mode': 0,
+        'original_loops': 4, 'loops_per_pass': 1, 'regenerate_mode': 0, 'source_mode': 2,
+        'depth': depth, 'scale': 'Minor', 'root': 0, 'seed': seed, 'algorithm': algorithm,
+        'companion_mode': 'rhythm' if rhythm else 'melody',
+        'target_pitches': list(RHYTHM_PITCHES) if rhythm else [],
+        'operation_order': [],
+        'mutator_slots': [
+            {'operation': operation, 'activation_probability': 1.0, 'probability_depth': depth, 'range_depth': 0.5}
+            for operation in operations
+        ],
+        'mutator_slot_count': max(4, len(operations)) if operations else 0,
+    }
+    for key in tap._mutator_operation_depth_keys():
+        settings[key] = depth
+    return tap._mutator_resolve_slot_activation(settings)
+
+
+def canonical_values(values):
+    """Notes as sorted tuples with floats rounded, for comparing and hashing."""
+    return [
+        tuple(sorted((key, round(value, 6) if isinstance(value, float) else value) for key, value in note.items()))
+        for note in values
+    ]
@@ -0,0 +1,29 @@
+from .Base import LiveObject
+from .Browser import Browser
+
+
+class ApplicationView(LiveObject):
+
+    def __init__(self):
+        LiveObject.__init__(self, focused_document_view='Session')
+
+    def is_view_visible(self, view_name):
+        return True
+
+    def show_view(self, view_name):
+        pass
+
+    def focus_view(self, view_name):
+        pass
+
+
+class Application(LiveObject):
+
+    def __init__(self, browser=None):
+        LiveObject.__init__(self, browser=browser or Browser(), view=ApplicationView())
+
+    def get_major_version(self):
+        return 12
+
+    def get_minor_version(self):
+        return 0
@@ -0,0 +1,77 @@
+"""
+Listener plumbing shared by the stand-in Live objects.
+
+Any attribute an object actually has can be observed the way Live allows:
+add_<name>_listener, remove_<name>_listener and <name>_has_listener are
+synthesized on demand, and assigning the attribute notifies its listeners.
+"""
+
+missing_attributes = set()
+
+
+class LiveObject(object):
+    # Listenable properties that are not plain attributes, e.g. Clip.notes.
+    EVENTS = ()
+
+    def __init__(self, **values):
+        object.__setattr__(self, '_listeners', {})
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def _has_property(self, name):
+        return name in self.__dict__ or hasattr(type(self), name) or name in self.EVENTS
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name.startswith('add_') and name.endswith('_listener'):
+            prop = name[4:-9]
+            if self._has_property(prop):
+                return lambda listener: self._add_listener(prop, listener)
+        elif name.startswith('remove_') and name.endswith('_listener'):
+            prop = name[7:-9]
+            if self._has_property(prop):
+                return lambda listener: self._remove_listener(prop, listener)
+        elif name.endswith('_has_listener'):
+            prop = name[:-13]
+            if self._has_property(prop):
+                return lambda listener: listener in self._listeners.get(prop, ())
+        missing_attributes.add('{}.{}'.format(type(self).__name__, name))
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        changed = name.startswith('_') or self.__dict__.get(name, self) != value
+        object.__setattr__(self, name, value)
+        if changed and not name.startswith('_'):
+            self.notify(name)
+
+    def _add_listener(self, prop, listener):
+        listeners = self._listeners.setdefault(prop, [])
+        if listener in listeners:
+            raise RuntimeError('Listener already connected')
+        listeners.append(listener)
+
+    def _remove_listener(self, prop, listener):
+        listeners = self._listeners.get(prop, [])
+        if listener not in listeners:
+            raise RuntimeError('Listener not connected')
+        listeners.remove(listener)
+
+    def notify(self, prop):
+        for listener in list(self._listeners.get(prop, ())):
+            listener()
+
+    def listener_count(self, prop=None):
+        if prop is not None:
+            return len(self._listeners.get(prop, ()))
+        return sum(len(listeners) for listeners in self._listeners.values())
+
+
+class Enum(object):
+    """Named integer values, e.g. WarpMode.beats."""
+
+    def __init__(self, *names, **values):
+        for index, name in enumerate(names):
+            setattr(self, name, index)
+        for name, value in values.items():
+            setattr(self, name, value)
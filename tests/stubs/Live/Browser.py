@@ -0,0 +1,37 @@
+from .Base import LiveObject
+
+
+class BrowserItem(LiveObject):
+
+    def __init__(self, name, children=(), uri=None, source='Live', is_device=False, is_folder=None):
+        is_folder = bool(children) if is_folder is None else is_folder
+        LiveObject.__init__(
+            self, name=name, children=tuple(children), uri=uri or 'query:' + name,
+            source=source, is_device=is_device, is_folder=is_folder,
+            is_loadable=not is_folder, is_selected=False)
+
+    def iter_children(self):
+        return iter(self.children)
+
+
+class Browser(LiveObject):
+    ROOT_NAMES = (
+        'audio_effects', 'current_project', 'drums', 'instruments', 'max_for_live',
+        'midi_effects', 'packs', 'plugins', 'sounds', 'user_library', 'samples', 'clips',
+    )
+
+    def __init__(self, **roots):
+        values = dict((name, BrowserItem(name)) for name in self.ROOT_NAMES)
+        values.update(roots)
+        LiveObject.__init__(self, colors=(), user_folders=(), hotswap_target=None, **values)
+        self.loaded_items = []
+        self.previewed_items = []
+
+    def load_item(self, item):
+        self.loaded_items.append(item)
+
+    def preview_item(self, item):
+        self.previewed_items.append(item)
+
+    def stop_preview(self):
+        pass
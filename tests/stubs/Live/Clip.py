@@ -0,0 +1,149 @@
+import bisect
+
+from .Base import Enum, LiveObject
+
+WarpMode = Enum('beats', 'tones', 'texture', 'repitch', 'complex', 'rex', 'complex_pro')
+
+
+class MidiNoteSpecification(object):
+
+    def __init__(self, pitch, start_time, duration, velocity=100, mute=False,
+                 probability=1.0, velocity_deviation=0.0, release_velocity=64):
+        self.pitch = pitch
+        self.start_time = start_time
+        self.duration = duration
+        self.velocity = velocity
+        self.mute = mute
+        self.probability = probability
+        self.velocity_deviation = velocity_deviation
+        self.release_velocity = release_velocity
+
+
+class MidiNote(MidiNoteSpecification):
+
+    def __init__(self, note_id, specification):
+        MidiNoteSpecification.__init__(
+            self, specification.pitch, specification.start_time, specification.duration,
+            specification.velocity, specification.mute, specification.probability,
+            specification.velocity_deviation, specification.release_velocity)
+        self.note_id = note_id
+
+    def copy(self):
+        return MidiNote(self.note_id, self)
+
+
+class AutomationEnvelope(object):
+    """Step automation stored as sorted (time, value) breakpoints."""
+
+    def __init__(self, parameter):
+        self.parameter = parameter
+        self.times = []
+        self.values = []
+
+    def insert_step(self, time, length, value):
+        end = time + length
+        start_index = bisect.bisect_left(self.times, time)
+        end_index = bisect.bisect_left(self.times, end)
+        after = self.value_at_time(end)
+        self.times[start_index:end_index] = [time, end]
+        self.values[start_index:end_index] = [value, after]
+
+    def value_at_time(self, time):
+        index = bisect.bisect_right(self.times, time) - 1
+        if index < 0:
+            return self.parameter.value
+        return self.values[index]
+
+
+class ClipView(LiveObject):
+
+    def __init__(self):
+        LiveObject.__init__(self, grid_quantization=0, grid_is_triplet=False)
+
+
+class Clip(LiveObject):
+    EVENTS = ('notes',)
+
+    def __init__(self, length=4.0, is_midi_clip=True, name='', **values):
+        LiveObject.__init__(
+            self, name=name, color=0, color_index=0, length=length,
+            start_time=0.0, end_time=length, loop_start=0.0, loop_end=length,
+            start_marker=0.0, end_marker=length,
+            looping=True, is_midi_clip=is_midi_clip, is_audio_clip=not is_midi_clip,
+            playing_position=0.0, is_playing=False, is_triggered=False,
+            is_recording=False, warping=True, warp_mode=WarpMode.beats, muted=False,
+            signature_numerator=4, signature_denominator=4, launch_quantization=0,
+            view=ClipView(), **values)
+        self._notes = {}
+        self._next_note_id = 1
+        self._envelopes = {}
+
+    def add_new_notes(self, specifications):
+        note_ids = []
+        for specification in specifications:
+            note = MidiNote(self._next_note_id, specification)
+            self._notes[note.note_id] = note
+            note_ids.append(note.note_id)
+            self._next_note_id += 1
+        if note_ids:
+            self.notify('notes')
+        return tuple(note_ids)
+
+    def get_notes_extended(self, from_pitch, pitch_span, from_time, time_span):
+        return tuple(
+            note.copy() for note in self._sorted_notes()
+            if from_pitch <= note.pitch < from_pitch + pitch_span
+            and from_time <= note.start_time < from_time + time_span
+        )
+
+    def get_notes_by_id(self, note_ids):
+        return tuple(self._notes[note_id].copy() for note_id in note_ids if note_id in self._notes)
+
+    def get_all_notes_extended(self):
+        return tuple(note.copy() for note in self._sorted_notes())
+
+    def apply_note_modifications(self, notes):
+        for note in notes:
+            if note.note_id in self._notes:
+                self._notes[note.note_id] = note.copy()
+        self.notify('notes')
+
+    def remove_notes_extended(self, from_pitch, pitch_span, from_time, time_span):
+        self.remove_notes_by_id([
+            note.note_id for note in self.get_notes_extended(from_pitch, pitch_span, from_time, time_span)
+        ])
+
+    def remove_notes_by_id(self, note_ids):
+        removed = False
+        for note_id in note_ids:
+            removed = self._notes.pop(note_id, None) is not None or removed
+        if removed:
+            self.notify('notes')
+
+    def _sorted_notes(self):
+        return sorted(self._notes.values(), key=lambda note: (note.start_time, note.pitch))
+
+    def automation_envelope(self, parameter):
+        return self._envelopes.get(parameter)
+
+    def create_automation_envelope(self, parameter):
+        return self._envelopes.setdefault(parameter, AutomationEnvelope(parameter))
+
+    def clear_envelope(self, parameter):
+        self._envelopes.pop(parameter, None)
+
+    def clear_all_envelopes(self):
+        self._envelopes.clear()
+
+    def fire(self):
+        self.is_triggered = True
+
+    def stop(self):
+        self.is_playing = False
+        self.is_triggered = False
+
+    def select_all_notes(self):
+        pass
+
+    def deselect_all_notes(self):
+        pass
@@ -0,0 +1,43 @@
+from .Base import LiveObject
+from .Clip import Clip
+
+
+class ClipSlot(LiveObject):
+
+    def __init__(self, canonical_parent=None):
+        LiveObject.__init__(
+            self, canonical_parent=canonical_parent, clip=None, has_clip=False,
+            is_playing=False, is_triggered=False, is_recording=False,
+            has_stop_button=True, color=0, color_index=0, controls_other_clips=False,
+            is_group_slot=False, playing_status=0, will_record_on_start=False)
+
+    def create_clip(self, length, is_midi_clip=True):
+        if self.has_clip:
+            raise RuntimeError('Clip slot is not empty')
+        self.clip = Clip(length, is_midi_clip, canonical_parent=self)
+        self.has_clip = True
+        return self.clip
+
+    def delete_clip(self):
+        self.clip = None
+        self.has_clip = False
+        self.is_playing = False
+        self.is_triggered = False
+
+    def duplicate_clip_to(self, target):
+        source = self.clip
+        target.delete_clip()
+        clip = target.create_clip(source.length, source.is_midi_clip)
+        clip.name = source.name
+        clip.add_new_notes(source.get_all_notes_extended())
+
+    def fire(self, *a, **k):
+        self.is_triggered = True
+
+    def set_fire_button_state(self, state):
+        if state:
+            self.fire()
+
+    def stop(self):
+        self.is_playing = False
+        self.is_triggered = False
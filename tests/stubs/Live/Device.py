@@ -0,0 +1,23 @@
+from .Base import Enum, LiveObject
+from .DeviceParameter import DeviceParameter
+
+DeviceType = Enum('undefined', 'instrument', 'audio_effect', 'midi_effect')
+
+
+class DeviceView(LiveObject):
+
+    def __init__(self):
+        LiveObject.__init__(self, is_collapsed=False, selected_chain=None)
+
+
+class Device(LiveObject):
+
+    def __init__(self, name, class_name=None, type=DeviceType.audio_effect,
+                 parameter_names=(), **values):
+        parameters = [DeviceParameter('Device On', 1.0, is_quantized=True, value_items=('Off', 'On'))]
+        parameters.extend(DeviceParameter(parameter_name) for parameter_name in parameter_names)
+        LiveObject.__init__(
+            self, name=name, class_name=class_name or name,
+            class_display_name=name, type=type, parameters=tuple(parameters),
+            can_have_chains=False, can_have_drum_pads=False, is_active=True,
+            view=DeviceView(), **values)
@@ -0,0 +1,28 @@
+from .Base import Enum, LiveObject
+
+ParameterState = Enum('enabled', 'irrelevant', 'disabled')
+AutomationState = Enum('none', 'playing', 'overridden')
+
+
+class DeviceParameter(LiveObject):
+
+    def __init__(self, name, value=0.0, min=0.0, max=1.0, is_quantized=False,
+                 value_items=(), **values):
+        LiveObject.__init__(
+            self, name=name, original_name=name, value=value, min=min, max=max,
+            default_value=min, is_quantized=is_quantized, value_items=tuple(value_items),
+            state=ParameterState.enabled, is_enabled=True,
+            automation_state=AutomationState.none, **values)
+
+    def str_for_value(self, value):
+        if self.is_quantized and self.value_items:
+            index = int(value)
+            if 0 <= index < len(self.value_items):
+                return self.value_items[index]
+        return '{:.2f}'.format(value)
+
+    def __str__(self):
+        return self.str_for_value(self.value)
+
+    def re_enable_automation(self):
+        self.automation_state = AutomationState.none
@@ -0,0 +1,3 @@
+from .Base import Enum
+
+MapMode = Enum('absolute', 'absolute_14_bit', 'relative_signed_bit', 'relative_binary_offset')
@@ -0,0 +1,15 @@
+from .Device import Device
+
+
+class Chain(Device):
+    pass
+
+
+class RackDevice(Device):
+
+    def __init__(self, name, chains=(), **values):
+        Device.__init__(self, name, class_name='AudioEffectGroupDevice', **values)
+        self.can_have_chains = True
+        self.chains = tuple(chains)
+        self.variation_count = 0
+        self.selected_variation_index = -1
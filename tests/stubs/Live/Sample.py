@@ -0,0 +1,12 @@
+from .Base import Enum, LiveObject
+
+SlicingStyle = Enum('transient', 'beat', 'region', 'manual')
+
+
+class Sample(LiveObject):
+
+    def __init__(self, file_path='', length=0, sample_rate=44100, **values):
+        LiveObject.__init__(
+            self, file_path=file_path, length=length, sample_rate=sample_rate,
+            slicing_style=SlicingStyle.transient, slices=(), warping=False,
+            start_marker=0, end_marker=length, **values)
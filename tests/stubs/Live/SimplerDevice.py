@@ -0,0 +1,10 @@
+from .Device import Device, DeviceType
+
+
+class SimplerDevice(Device):
+
+    def __init__(self, name='Simpler', sample=None, **values):
+        Device.__init__(self, name, class_name='OriginalSimpler', type=DeviceType.instrument, **values)
+        self.sample = sample
+        self.playback_mode = 0
+        self.slicing_playback_mode = 0
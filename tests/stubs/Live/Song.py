@@ -0,0 +1,74 @@
+from .Base import Enum, LiveObject
+from .Track import Track
+
+Quantization = Enum(
+    'q_no_q', 'q_8_bars', 'q_4_bars', 'q_2_bars', 'q_bar', 'q_half', 'q_half_triplet',
+    'q_quarter', 'q_quarter_triplet', 'q_eight', 'q_eight_triplet', 'q_sixtenth',
+    'q_sixtenth_triplet', 'q_thirtytwoth')
+
+
+class Scene(LiveObject):
+
+    def __init__(self, name=''):
+        LiveObject.__init__(
+            self, name=name, color=0, color_index=0, is_triggered=False,
+            tempo=-1.0, tempo_enabled=False)
+
+    def fire(self, *a, **k):
+        self.is_triggered = True
+
+
+class SongView(LiveObject):
+
+    def __init__(self):
+        LiveObject.__init__(
+            self, selected_track=None, selected_scene=None, detail_clip=None,
+            highlighted_clip_slot=None, selected_parameter=None, selected_chain=None,
+            follow_song=False, draw_mode=False)
+
+    def select_device(self, device, *a):
+        track = self.selected_track
+        if track is not None:
+            track.view.selected_device = device
+
+
+class Song(LiveObject):
+
+    def __init__(self, tracks=(), scenes=(), return_tracks=(), **values):
+        LiveObject.__init__(
+            self, tracks=tuple(tracks), scenes=tuple(scenes),
+            return_tracks=tuple(return_tracks), visible_tracks=tuple(tracks),
+            master_track=Track('Master'), view=SongView(),
+            tempo=120.0, metronome=False, is_playing=False, session_record=False,
+            record_mode=False, overdub=False, scale_name='Major', root_note=0,
+            scale_mode=False, signature_numerator=4, signature_denominator=4,
+            re_enable_automation_enabled=False, current_song_time=0.0,
+            clip_trigger_quantization=Quantization.q_bar,
+            midi_recording_quantization=Quantization.q_no_q,
+            swing_amount=0.0, groove_amount=1.0, **values)
+        if self.tracks:
+            self.view.selected_track = self.tracks[0]
+        if self.scenes:
+            self.view.selected_scene = self.scenes[0]
+
+    def start_playing(self):
+        self.is_playing = True
+
+    def stop_playing(self):
+        self.is_playing = False
+
+    def continue_playing(self):
+        self.is_playing = True
+
+    def stop_all_clips(self, quantized=True):
+        for track in self.tracks:
+            track.stop_all_clips(quantized)
+
+    def tap_tempo(self):
+        pass
+
+    def begin_undo_step(self):
+        pass
+
+    def end_undo_step(self):
+        pass
@@ -0,0 +1,45 @@
+from .Base import LiveObject
+from .ClipSlot import ClipSlot
+from .DeviceParameter import DeviceParameter
+
+
+class MixerDevice(LiveObject):
+
+    def __init__(self, send_count=0):
+        LiveObject.__init__(
+            self, volume=DeviceParameter('Track Volume', 0.85),
+            panning=DeviceParameter('Track Panning', 0.0, -1.0, 1.0),
+            sends=tuple(DeviceParameter('Send {}'.format(chr(65 + index))) for index in range(send_count)),
+            track_activator=DeviceParameter('Speaker On', 1.0, is_quantized=True),
+            crossfade_assign=1)
+
+
+class TrackView(LiveObject):
+
+    def __init__(self):
+        LiveObject.__init__(self, selected_device=None, device_insert_mode=0, is_collapsed=False)
+
+    def select_instrument(self):
+        return False
+
+
+class Track(LiveObject):
+
+    def __init__(self, name, scene_count=0, has_midi_input=True, send_count=0, **values):
+        LiveObject.__init__(
+            self, name=name, color=0, color_index=0, arm=False, can_be_armed=True,
+            has_midi_input=has_midi_input, has_audio_input=not has_midi_input,
+            has_midi_output=has_midi_input, has_audio_output=True,
+            mute=False, solo=False, muted_via_solo=False, is_foldable=False,
+            fold_state=0, is_grouped=False, group_track=None, is_visible=True,
+            is_frozen=False, implicit_arm=False, playing_slot_index=-1,
+            fired_slot_index=-1, current_monitoring_state=1,
+            output_meter_left=0.0, output_meter_right=0.0, output_meter_level=0.0,
+            devices=(), mixer_device=MixerDevice(send_count), view=TrackView(),
+            **values)
+        self.clip_slots = tuple(ClipSlot(self) for _ in range(scene_count))
+
+    def stop_all_clips(self, quantized=True):
+        for clip_slot in self.clip_slots:
+            clip_slot.stop()
+        self.playing_slot_index = -1
@@ -0,0 +1,11 @@
+from .Device import Device, DeviceType
+
+
+class WavetableDevice(Device):
+
+    def __init__(self, name='Wavetable', **values):
+        Device.__init__(self, name, class_name='InstrumentVector', type=DeviceType.instrument, **values)
+        self.oscillator_1_wavetable_category = 0
+        self.oscillator_1_wavetable_index = 0
+        self.oscillator_2_wavetable_category = 0
+        self.oscillator_2_wavetable_index = 0
@@ -0,0 +1,11 @@
+"""
+Headless stand-in for the parts of Live's Python API that Tap touches.
+
+Only meant for tests and benchmarks run outside Live; the object model is
+plain Python, so timings measure the script and not Live's bindings.
+"""
+
+from . import (
+    Application, Base, Browser, Clip, ClipSlot, Device, DeviceParameter, MidiMap,
+    RackDevice, Sample, SimplerDevice, Song, Track, WavetableDevice,
+)
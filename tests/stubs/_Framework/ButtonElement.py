@@ -0,0 +1,14 @@
+from .InputControlElement import InputControlElement
+
+
+class ButtonElement(InputControlElement):
+
+    def __init__(self, is_momentary, msg_type, channel, identifier, *a, **k):
+        InputControlElement.__init__(self, msg_type, channel, identifier)
+        self.is_momentary = is_momentary
+
+    def turn_on(self):
+        self.send_value(127)
+
+    def turn_off(self):
+        self.send_value(0)
@@ -0,0 +1,75 @@
+from contextlib import contextmanager
+
+
+class ControlSurface(object):
+    """
+    Drives a script without Live. Scheduled messages run on update_display,
+    which stands in for Live's 100 ms timer, and sent MIDI is kept on the
+    c_instance for inspection.
+    """
+
+    def __init__(self, c_instance, *a, **k):
+        self._c_instance = c_instance
+        self._scheduled_messages = []
+        self._device_component = None
+
+    @contextmanager
+    def component_guard(self):
+        yield
+
+    def song(self):
+        return self._c_instance.song()
+
+    def application(self):
+        return self._c_instance.application()
+
+    def log_message(self, *message):
+        self._c_instance.log_message(' '.join(str(part) for part in message))
+
+    def show_message(self, message):
+        self._c_instance.show_message(message)
+
+    def schedule_message(self, delay_in_ticks, callback, parameter=None):
+        self._scheduled_messages.append([max(1, int(delay_in_ticks)), callback, parameter])
+
+    def update_display(self):
+        due = []
+        for message in list(self._scheduled_messages):
+            message[0] -= 1
+            if message[0] <= 0:
+                self._scheduled_messages.remove(message)
+                due.append(message)
+        for _, callback, parameter in due:
+            if parameter is None:
+                callback()
+            else:
+                callback(parameter)
+
+    def _send_midi(self, midi_event_bytes, optimized=None):
+        self._c_instance.send_midi(tuple(midi_event_bytes))
+        return True
+
+    def request_rebuild_midi_map(self):
+        self._c_instance.request_rebuild_midi_map()
+
+    def set_device_component(self, device_component):
+        self._device_component = device_component
+
+    def set_highlighting_session_component(self, session_component):
+        pass
+
+    def refresh_state(self):
+        pass
+
+    def build_midi_map(self, midi_map_handle):
+        pass
+
+    def receive_midi(self, midi_bytes):
+        if midi_bytes[0] == 0xF0:
+            self.handle_sysex(midi_bytes)
+
+    def handle_sysex(self, midi_bytes):
+        pass
+
+    def disconnect(self):
+        self._scheduled_messages = []
@@ -0,0 +1,17 @@
+class ControlSurfaceComponent(object):
+
+    def __init__(self, *a, **k):
+        self.name = ''
+        self._is_enabled = True
+
+    def set_enabled(self, enabled):
+        self._is_enabled = bool(enabled)
+
+    def is_enabled(self):
+        return self._is_enabled
+
+    def update(self):
+        pass
+
+    def disconnect(self):
+        pass
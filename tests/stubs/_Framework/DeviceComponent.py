@@ -0,0 +1,87 @@
+from .ControlSurfaceComponent import ControlSurfaceComponent
+
+BANK_SIZE = 8
+
+
+class DeviceComponent(ControlSurfaceComponent):
+    """Banks a device's parameters in pages of eight, skipping 'Device On'."""
+
+    def __init__(self, *a, **k):
+        ControlSurfaceComponent.__init__(self)
+        self._device = None
+        self._bank_index = 0
+        self._parameter_controls = None
+        self._bank_nav_buttons = (None, None)
+        self._device_listeners = []
+
+    def add_device_listener(self, listener):
+        self._device_listeners.append(listener)
+
+    def remove_device_listener(self, listener):
+        self._device_listeners.remove(listener)
+
+    def device_has_listener(self, listener):
+        return listener in self._device_listeners
+
+    def notify_device(self):
+        for listener in list(self._device_listeners):
+            listener()
+
+    def set_device(self, device):
+        if device != self._device:
+            self._device = device
+            self._bank_index = 0
+            self.update()
+            self.notify_device()
+
+    def set_parameter_controls(self, controls):
+        self._parameter_controls = tuple(controls) if controls else None
+        self.update()
+
+    def set_bank_nav_buttons(self, left_button, right_button):
+        self._bank_nav_buttons = (left_button, right_button)
+
+    def _device_parameters(self):
+        if self._device is None:
+            return ()
+        return tuple(self._device.parameters[1:])
+
+    def _parameter_banks(self):
+        return self._device_parameter_banks()
+
+    def _device_parameter_banks(self):
+        parameters = self._device_parameters()
+        banks = [
+            tuple(parameters[start:start + BANK_SIZE])
+            for start in range(0, len(parameters), BANK_SIZE)
+        ]
+        return [bank + (None,) * (BANK_SIZE - len(bank)) for bank in banks]
+
+    def _parameter_bank_names(self):
+        return tuple('Bank {}'.format(index + 1) for index in range(len(self._device_parameter_banks())))
+
+    def _best_of_parameter_bank(self):
+        return list(self._device_parameters()[:BANK_SIZE])
+
+    def _number_of_parameter_banks(self):
+        return len(self._parameter_banks())
+
+    def _current_bank_details(self):
+        banks = self._parameter_banks()
+        names = self._parameter_bank_names()
+        if not banks:
+            return '', (None,) * BANK_SIZE
+        index = self._bank_index if self._bank_index < len(banks) else 0
+        return names[index], banks[index]
+
+    def update(self):
+        if self._parameter_controls is None:
+            return
+        _, parameters = self._current_bank_details()
+        for control, parameter in zip(self._parameter_controls, parameters):
+            if control is None:
+                continue
+            if parameter is None:
+                control.release_parameter()
+            else:
+                control.connect_to(parameter)
@@ -0,0 +1,9 @@
+from .InputControlElement import *
+from .SubjectSlot import subject_slot
+
+
+class EncoderElement(InputControlElement):
+
+    def __init__(self, msg_type, channel, identifier, map_mode=None, *a, **k):
+        InputControlElement.__init__(self, msg_type, channel, identifier)
+        self.map_mode = map_mode
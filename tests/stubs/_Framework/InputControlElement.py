@@ -0,0 +1,50 @@
+MIDI_NOTE_TYPE = 0
+MIDI_CC_TYPE = 1
+MIDI_PB_TYPE = 2
+MIDI_SYSEX_TYPE = 3
+MIDI_NOTE_ON_STATUS = 0x90
+MIDI_NOTE_OFF_STATUS = 0x80
+MIDI_CC_STATUS = 0xB0
+
+
+class InputControlElement(object):
+
+    def __init__(self, msg_type, channel, identifier, *a, **k):
+        self.message_type = msg_type
+        self.channel = channel
+        self.identifier = identifier
+        self.name = ''
+        self.suppress_script_forwarding = False
+        self._value_listeners = []
+        self._parameter = None
+        self._last_value = None
+
+    def add_value_listener(self, listener, identify_sender=False):
+        self._value_listeners.append(listener)
+
+    def remove_value_listener(self, listener):
+        if listener in self._value_listeners:
+            self._value_listeners.remove(listener)
+
+    def value_has_listener(self, listener):
+        return listener in self._value_listeners
+
+    def receive_value(self, value):
+        self._last_value = value
+        for listener in list(self._value_listeners):
+            listener(value)
+
+    def connect_to(self, parameter):
+        self._parameter = parameter
+
+    def release_parameter(self):
+        self._parameter = None
+
+    def mapped_parameter(self):
+        return self._parameter
+
+    def send_value(self, value, force=False):
+        self._last_value = value
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
@@ -0,0 +1,35 @@
+from .ControlSurfaceComponent import ControlSurfaceComponent
+
+
+class ChannelStripComponent(ControlSurfaceComponent):
+
+    def __init__(self):
+        ControlSurfaceComponent.__init__(self)
+        self.controls = {}
+
+    def __getattr__(self, name):
+        if name.startswith('set_'):
+            return lambda *values: self.controls.__setitem__(name[4:], values)
+        raise AttributeError(name)
+
+
+class MixerComponent(ControlSurfaceComponent):
+
+    def __init__(self, num_tracks=0, num_returns=0, *a, **k):
+        ControlSurfaceComponent.__init__(self)
+        self._channel_strips = [ChannelStripComponent() for _ in range(num_tracks)]
+        self._return_strips = [ChannelStripComponent() for _ in range(num_returns)]
+        self._master_strip = ChannelStripComponent()
+        self._prehear_volume_control = None
+
+    def channel_strip(self, index):
+        return self._channel_strips[index]
+
+    def return_strip(self, index):
+        return self._return_strips[index]
+
+    def master_strip(self):
+        return self._master_strip
+
+    def set_prehear_volume_control(self, control):
+        self._prehear_volume_control = control
@@ -0,0 +1,7 @@
+from .ControlSurfaceComponent import ControlSurfaceComponent
+
+
+class SessionComponent(ControlSurfaceComponent):
+
+    def set_stop_all_clips_button(self, button):
+        self._stop_all_clips_button = button
@@ -0,0 +1,5 @@
+from .InputControlElement import InputControlElement
+
+
+class SliderElement(InputControlElement):
+    pass
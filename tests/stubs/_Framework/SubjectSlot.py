@@ -0,0 +1,49 @@
+class SubjectSlot(object):
+    """A listener bound to one event of whatever subject it is pointed at."""
+
+    def __init__(self, event, function, owner):
+        self._event = event
+        self._function = function
+        self._owner = owner
+        self._subject = None
+
+    def __call__(self, *a, **k):
+        return self._function(self._owner, *a, **k)
+
+    def _listener(self, *a, **k):
+        return self(*a, **k)
+
+    @property
+    def subject(self):
+        return self._subject
+
+    @subject.setter
+    def subject(self, subject):
+        if self._subject is not None:
+            remove = getattr(self._subject, 'remove_{}_listener'.format(self._event), None)
+            if remove is not None:
+                remove(self._listener)
+        self._subject = subject
+        if subject is not None:
+            getattr(subject, 'add_{}_listener'.format(self._event))(self._listener)
+
+
+class subject_slot(object):
+
+    def __init__(self, event):
+        self._event = event
+        self._function = None
+
+    def __call__(self, function):
+        self._function = function
+        self._name = function.__name__
+        return self
+
+    def __get__(self, owner, owner_type=None):
+        if owner is None:
+            return self
+        slots = owner.__dict__.setdefault('_subject_slots', {})
+        slot = slots.get(self._name)
+        if slot is None:
+            slot = slots[self._name] = SubjectSlot(self._event, self._function, owner)
+        return slot
@@ -0,0 +1,7 @@
+from .ControlSurfaceComponent import ControlSurfaceComponent
+
+
+class TransportComponent(ControlSurfaceComponent):
+
+    def set_metronome_button(self, button):
+        self._metronome_button = button
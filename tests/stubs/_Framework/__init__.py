@@ -0,0 +1 @@
+"""Headless stand-in for the _Framework classes Tap builds on."""
@@ -0,0 +1,15 @@
+"""Headless stand-in for the ableton.v2.base helpers Tap imports."""
+
+
+def liveobj_valid(obj):
+    return obj is not None
+
+
+def liveobj_changed(obj, other):
+    return obj is not other
+
+
+def listens(event, *a, **k):
+    def decorator(function):
+        return function
+    return decorator
@@ -0,0 +1,137 @@
+"""
+Reference SysEx text helpers, as they were before being memoized and
+compiled, and corpora of realistic Live names to compare against.
+"""
+
+import random
+import re
+
+ESCAPE_CHAR = '\\'
+RESERVED_SYMBOLS = (",", "|", ";", "^", "-", "%", ":", "/", "<", "*", "$", "_", "&", "(", ")", "\\")
+SYMBOL_REPLACEMENTS = (('♭', 'b'), ('♯', '#'), ('♮', 'nat'), ('𝄫', 'bb'), ('𝄪', '##'))
+ROUND_BRACKET_TEXT_RE = re.compile(r'\(([^()]*)\)')
+SQUARE_BRACKET_TEXT_RE = re.compile(r'\[([^\[\]]*)\]')
+CURLY_BRACKET_TEXT_RE = re.compile(r'\{([^{}]*)\}')
+MULTI_SPACE_RE = re.compile(r'\s{2,}')
+
+
+def reference_sanitize(value):
+    sanitized_value = str(value)
+    for symbol, replacement in SYMBOL_REPLACEMENTS:
+        sanitized_value = sanitized_value.replace(symbol, replacement)
+
+    def remove_ascii_empty_bracket_group(match):
+        inner_value = match.group(1)
+        ascii_inner_value = inner_value.encode('ascii', errors='ignore').decode('ascii')
+        if inner_value.strip() and not ascii_inner_value.strip():
+            return ''
+        return match.group(0)
+
+    sanitized_value = ROUND_BRACKET_TEXT_RE.sub(remove_ascii_empty_bracket_group, sanitized_value)
+    sanitized_value = SQUARE_BRACKET_TEXT_RE.sub(remove_ascii_empty_bracket_group, sanitized_value)
+    sanitized_value = CURLY_BRACKET_TEXT_RE.sub(remove_ascii_empty_bracket_group, sanitized_value)
+    sanitized_value = sanitized_value.encode('ascii', errors='ignore').decode('ascii')
+    sanitized_value = MULTI_SPACE_RE.sub(' ', sanitized_value)
+    return sanitized_value.strip()
+
+
+def reference_escape(value):
+    escaped_value = reference_sanitize(value)
+    escaped_value = escaped_value.replace(ESCAPE_CHAR, ESCAPE_CHAR + ESCAPE_CHAR)
+    for symbol in RESERVED_SYMBOLS:
+        if symbol == ESCAPE_CHAR:
+            continue
+        escaped_value = escaped_value.replace(symbol, ESCAPE_CHAR + symbol)
+    return escaped_value
+
+
+def reference_unescape(value):
+    result = []
+    escaping = False
+    for char in str(value):
+        if escaping:
+            result.append(char)
+            escaping = False
+        elif char == ESCAPE_CHAR:
+            escaping = True
+        else:
+            result.append(char)
+    if escaping:
+        result.append(ESCAPE_CHAR)
+    return ''.join(result)
+
+
+def reference_split(value, separator):
+    fields = []
+    field_chars = []
+    escaping = False
+    for char in str(value):
+        if escaping:
+            field_chars.append(ESCAPE_CHAR)
+            field_chars.append(char)
+            escaping = False
+        elif char == ESCAPE_CHAR:
+            escaping = True
+        elif char == separator:
+            fields.append(''.join(field_chars))
+            field_chars = []
+        else:
+            field_chars.append(char)
+    if escaping:
+        field_chars.append(ESCAPE_CHAR)
+    fields.append(''.join(field_chars))
+    return fields
+
+
+PARAMETER_NAMES = (
+    'Device On', 'Filter Freq', 'Filter Res', 'Filter Type', 'Env Amount', 'LFO Rate',
+    'LFO Amount', 'Attack', 'Decay', 'Sustain', 'Release', 'Osc 1 Shape', 'Osc 2 Detune',
+    'Dry/Wet', 'Feedback', 'L Sync', 'R 16th', 'Filter Freq (Hz)', 'Volume', 'Pan',
+    'Macro 1', 'Macro 2', 'Ch. 1 On', 'Send A', 'Pe Env < Vel', 'A-B Mix', 'Gain (dB)',
+    'Transpose', 'Glide Time', 'Voices', 'Spread %', 'Tone: Dark', 'Mod $ Amount',
+)
+DISPLAY_VALUES = (
+    '0.00 dB', '-12.0 dB', '440 Hz', '1.20 kHz', '50 %', '1/16', '1/8T', 'C3', 'D♯2',
+    'B♭1', '-inf dB', '100 ms', '2.50 s', 'On', 'Off', '12 st', '-7 ct', '3:1', '0.0',
+)
+PRESET_NAMES = (
+    'Grand Piano', 'Analog Bass (Deep)', 'Pad — Warm Strings', 'Kit-Core 909', 'Lo-Fi_Keys',
+    'Bright & Airy Lead', 'Drum Rack [Acoustic]', 'E♭ Minor Choir', 'Arp (↑ Up)', 'Sub/Bass 808',
+    'Café Rhodes', 'Tape Echo {Dub}', '  Wide   Chorus  ', 'Bell | Glass', 'Sweep; Slow',
+    'Résonance Filter', 'Pluck *Soft*', '100% Wet', 'Koto (琴)', 'Vox :: Breath',
+)
+
+
+def name_corpus(count=5000, seed=3):
+    """
+    Names in the proportions the script sends them: mostly parameter names
+    and display values that repeat constantly, plus a tail of one-off names.
+    """
+    rng = random.Random(seed)
+    names = []
+    for index in range(count):
+        roll = rng.random()
+        if roll < 0.45:
+            names.append(rng.choice(PARAMETER_NAMES))
+        elif roll < 0.8:
+            names.append(rng.choice(DISPLAY_VALUES))
+        elif roll < 0.95:
+            names.append(rng.choice(PRESET_NAMES))
+        else:
+            names.append('{} {}'.format(rng.choice(PRESET_NAMES), index))
+    return names
+
+
+def random_text(rng, length):
+    alphabet = 'abcXYZ 019' + ''.join(RESERVED_SYMBOLS) + '♭♯♮𝄫𝄪()[]{}é琴\t'
+    return ''.join(rng.choice(alphabet) for _ in range(length))
+
+
+def automation_payload(step_count=1024, token=''):
+    """A 0x32 automation write: header fields, then time:duration:value:curve:id:order steps."""
+    duration = 16.0 / step_count
+    steps = ','.join(
+        '{:.4f}:{:.4f}:{:.4f}:0.0:{}:{}'.format(index * duration, duration, (index % 64) / 63.0, index, index)
+        for index in range(step_count)
+    )
+    return '|'.join(('0', '0.0', '16.0', '{:.4f}'.format(duration), steps, str(step_count), '0', token))
@@ -0,0 +1,92 @@
+"""
+The background browser search index: folder walk, refresh and the sorted
+token suffixes substring terms are looked up in.
+"""
+
+from Live.Application import Application
+from Live.Browser import Browser, BrowserItem
+
+SAMPLES = 12
+
+
+def samples_browser(*children):
+    return Browser(samples=BrowserItem('samples', children=children))
+
+
+def build_index(tap, browser, category_index=SAMPLES):
+    """Run the index build for one category to completion; returns the ticks it took."""
+    tap._c_instance._application = Application(browser)
+    tap._ensure_browser_search_index([category_index])
+    ticks = 0
+    while tap.browser_search_index_work is not None:
+        tap.update_display()
+        ticks += 1
+    return ticks
+
+
+def refresh_index(tap, browser, category_index=SAMPLES):
+    tap.browser_search_index[category_index]['built_at'] -= tap.browser_search_index_max_age
+    return build_index(tap, browser, category_index)
+
+
+def search(tap, query, category_index=SAMPLES):
+    index = tap.browser_search_index[category_index]
+    return sorted(
+        index['entries'][entry_id]['normalized_name']
+        for entry_id in tap._browser_search_index_entry_ids(index, query.split()))
+
+
+def test_substring_terms_match_nested_items(make_tap):
+    tap, _ = make_tap(connect=False)
+    browser = samples_browser(
+        BrowserItem('Drums', children=[BrowserItem('kick_hard.wav'), BrowserItem('snare_soft.wav')]),
+        BrowserItem('loop_120.wav'))
+
+    build_index(tap, browser)
+
+    assert search(tap, 'ick') == ['kick_hard.wav']
+    assert search(tap, 'drums soft') == ['snare_soft.wav']
+    assert search(tap, '.wav') == ['kick_hard.wav', 'loop_120.wav', 'snare_soft.wav']
+    assert search(tap, 'hat') == []
+
+
+def test_refresh_lists_folders_that_were_empty(make_tap):
+    tap, _ = make_tap(connect=False)
+    empty = BrowserItem('New Folder', is_folder=True)
+    browser = samples_browser(BrowserItem('Drums', children=[empty, BrowserItem('snare.wav')]))
+    build_index(tap, browser)
+    assert search(tap, 'kick') == []
+
+    empty.children = (BrowserItem('kick.wav'),)
+    refresh_index(tap, browser)
+
+    assert search(tap, 'wav') == ['kick.wav', 'snare.wav']
+    assert search(tap, 'kick') == ['kick.wav']
+
+
+def test_refresh_reuses_unchanged_leaves(make_tap):
+    tap, _ = make_tap(connect=False)
+    kick = BrowserItem('kick.wav')
+    browser = samples_browser(BrowserItem('Drums', children=[kick]), BrowserItem('snare.wav'))
+    build_index(tap, browser)
+    entry = tap.browser_search_index[SAMPLES]['entries'][0]
+
+    refresh_index(tap, browser)
+
+    assert tap.browser_search_index[SAMPLES]['entries'][0] is entry
+    assert search(tap, 'kick') == ['kick.wav']
+
+
+def test_suffixes_are_sorted_and_merged_over_several_ticks(make_tap, monkeypatch):
+    tap, _ = make_tap(connect=False)
+    browser = samples_browser(*[BrowserItem('sample_{:03d}.wav'.format(number)) for number in range(60)])
+    monkeypatch.setattr(tap, 'browser_search_index_suffix_batch_size', 50)
+
+    ticks = build_index(tap, browser)
+
+    index = tap.browser_search_index[SAMPLES]
+    expected = sorted((token[offset:], token) for token in index['tokens'] for offset in range(len(token)))
+    assert list(zip(index['suffixes'], index['suffix_tokens'])) == expected
+    # Both the runs and the merge take many batches of 50 pairs.
+    assert ticks > 2 * len(expected) // 50
+    assert search(tap, '_04') == ['sample_{:03d}.wav'.format(number) for number in range(40, 50)]
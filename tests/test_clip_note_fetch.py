@@ -0,0 +1,71 @@
+"""
+_fetch_clip_notes reads only the marker range of the playhead clip while its
+notes listener says nothing has moved outside it.
+"""
+
+import pytest
+from Live.Clip import MidiNoteSpecification
+
+from live_set import build_song
+
+
+@pytest.fixture
+def clip_reads(make_tap, monkeypatch):
+    song = build_song(1, 2, clip_density=1.0, notes_per_clip=8)
+    tap, _ = make_tap(song, connect=False)
+    clip = song.tracks[0].clip_slots[0].clip
+    reads = []
+    get_notes_extended = clip.get_notes_extended
+
+    def recording(from_pitch, pitch_span, from_time, time_span):
+        reads.append((from_time, from_time + time_span))
+        return get_notes_extended(from_pitch, pitch_span, from_time, time_span)
+
+    monkeypatch.setattr(clip, 'get_notes_extended', recording)
+    return tap, clip, reads
+
+
+def wide_range(tap, clip):
+    return (-tap.clip_length_trick, clip.length + tap.clip_length_trick)
+
+
+def test_playhead_clip_reads_only_markers_until_notes_change(clip_reads):
+    tap, clip, reads = clip_reads
+    tap._set_playhead_note_index_clip(clip)
+
+    first = tap._fetch_clip_notes(clip)
+    second = tap._fetch_clip_notes(clip)
+
+    assert reads == [wide_range(tap, clip), (0.0, clip.length)]
+    assert [note.note_id for note in second] == [note.note_id for note in first]
+
+    clip.add_new_notes([MidiNoteSpecification(60, clip.length + 2.0, 0.5)])
+    del reads[:]
+    tap._fetch_clip_notes(clip)
+    notes = tap._fetch_clip_notes(clip)
+
+    # A note past the end marker keeps every read widened.
+    assert reads == [wide_range(tap, clip)] * 2
+    assert any(note.start_time == clip.length + 2.0 for note in notes)
+
+
+def test_marker_changes_widen_the_next_read(clip_reads):
+    tap, clip, reads = clip_reads
+    tap._set_playhead_note_index_clip(clip)
+    tap._fetch_clip_notes(clip)
+
+    clip.end_marker = clip.length + 4.0
+    del reads[:]
+    tap._fetch_clip_notes(clip)
+
+    assert reads == [(-tap.clip_length_trick, clip.length + 4.0 + tap.clip_length_trick)]
+
+
+def test_other_clips_are_always_widened(clip_reads):
+    tap, clip, reads = clip_reads
+    tap._set_playhead_note_index_clip(tap.song().tracks[0].clip_slots[1].clip)
+
+    tap._fetch_clip_notes(clip)
+    tap._fetch_clip_notes(clip)
+
+    assert reads == [wide_range(tap, clip)] * 2
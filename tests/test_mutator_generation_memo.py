@@ -0,0 +1,50 @@
+"""
+The Mutator generation memo keeps results for settings re-apply and undo;
+look-ahead generations bypass it.
+"""
+
+import time
+
+import pytest
+
+from live_set import build_song
+
+
+@pytest.fixture
+def tap(make_tap, monkeypatch):
+    tap, _ = make_tap(build_song(1, 1, clip_density=1.0), connect=False)
+    monkeypatch.setattr(tap, '_mutator_settings_from_info', lambda info, seed=None: {'seed': seed})
+    monkeypatch.setattr(tap, '_mutator_generation_snapshot', lambda clip, settings, info: {'settings': settings})
+    monkeypatch.setattr(tap, '_mutator_generation_memo_key', lambda snapshot: snapshot['settings']['seed'])
+    monkeypatch.setattr(tap, '_compute_mutator_generation', lambda snapshot: {'values': [snapshot['settings']['seed']]})
+    return tap
+
+
+def wait_for(job):
+    deadline = time.time() + 5.0
+    while not job['done'] and time.time() < deadline:
+        time.sleep(0.001)
+    assert job['done']
+
+
+def test_generation_jobs_fill_the_memo(tap):
+    job = {'snapshot': {'settings': {'seed': 7}}, 'done': False, 'result': None, 'error': None}
+
+    tap._start_mutator_generation_worker(job)
+    wait_for(job)
+
+    assert tap._mutator_generation_memo == {7: {'values': [7]}}
+
+
+def test_prepared_generations_bypass_the_memo(tap):
+    tap._mutator_generation_memo[7] = {'values': ['kept']}
+    clip = tap.song().tracks[0].clip_slots[0].clip
+
+    for key in range(tap.MUTATOR_GENERATION_MEMO_SIZE + 1):
+        assert tap._prepare_mutator_generation(key, clip, {})
+        job = tap._mutator_prepared_generations[key]
+        wait_for(job)
+        assert job['memo_key'] is None
+        assert job['result']['values'] != ['kept']
+
+    assert tap._mutator_generation_memo == {7: {'values': ['kept']}}
@@ -0,0 +1,99 @@
+"""
+Golden outputs for every Mutator algorithm and operation slot with fixed
+seeds. After an intended change to the engine's output, regenerate with:
+
+    TAP_UPDATE_GOLDEN=1 python -m pytest tests/test_mutator_golden.py
+"""
+
+import hashlib
+import json
+import os
+import random
+
+import pytest
+
+import Tap as tap_module
+from conftest import start_tap
+from live_set import build_song
+from mutator_sources import SOURCES, canonical_values, mutator_settings, operation_names
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden', 'mutator_outputs.json')
+SEED = 7
+LOOP_LENGTH = 8.0
+SECTION_DEPTH = 0.6
+OPERATION_DEPTHS = (0.35, 0.9)
+# Role 5 applies operations at full strength (see _mutator_role_operation_depth).
+OPERATION_ROLE = 5
+
+
+def digest(values):
+    canonical = canonical_values(values)
+    return {'notes': len(canonical), 'sha1': hashlib.sha1(repr(canonical).encode('utf-8')).hexdigest()}
+
+
+def section_outputs(tap):
+    outputs = {}
+    for kind in sorted(SOURCES):
+        source = SOURCES[kind](seed=SEED)
+        for algorithm in tap.MUTATOR_ALGORITHMS:
+            settings = mutator_settings(tap, algorithm, seed=SEED, rhythm=kind == 'rhythmic', depth=SECTION_DEPTH)
+            for role in range(17):
+                values = tap._mutator_make_section_values(
+                    source, role, 0.0, LOOP_LENGTH, settings, random.Random(SEED * 100 + role))
+                outputs['section/{}/{}/role-{:02d}'.format(kind, algorithm, role)] = digest(values)
+    return outputs
+
+
+def operation_outputs(tap):
+    outputs = {}
+    names = operation_names(tap)
+    for kind in sorted(SOURCES):
+        rhythm = kind == 'rhythmic'
+        source = SOURCES[kind](seed=SEED)
+        for operation, name in enumerate(names):
+            for depth in OPERATION_DEPTHS:
+                settings = mutator_settings(tap, seed=SEED, rhythm=rhythm, depth=depth, operations=(operation,))
+                values = tap._mutator_apply_depth_pipeline(
+                    source, OPERATION_ROLE, LOOP_LENGTH, settings, random.Random(SEED * 100 + operation),
+                    rhythm=rhythm, target_pitches=settings['target_pitches'] or None)
+                outputs['operation/{}/{:02d}-{}/depth-{}'.format(kind, operation, name, depth)] = digest(values)
+    return outputs
+
+
+@pytest.fixture(scope='module')
+def outputs():
+    tap, _ = start_tap(build_song(1, 1), connect=False)
+    try:
+        result = section_outputs(tap)
+        result.update(operation_outputs(tap))
+    finally:
+        tap.disconnect()
+    if os.environ.get('TAP_UPDATE_GOLDEN'):
+        with open(GOLDEN_PATH, 'w') as golden_file:
+            json.dump(result, golden_file, indent=1, sort_keys=True)
+            golden_file.write('\n')
+    return result
+
+
+@pytest.fixture(scope='module')
+def golden():
+    with open(GOLDEN_PATH) as golden_file:
+        return json.load(golden_file)
+
+
+@pytest.mark.parametrize('prefix', ['section/melodic', 'section/rhythmic', 'operation/melodic', 'operation/rhythmic'])
+def test_outputs_match_golden(outputs, golden, prefix):
+    expected = dict((key, value) for key, value in golden.items() if key.startswith(prefix + '/'))
+    actual = dict((key, value) for key, value in outputs.items() if key.startswith(prefix + '/'))
+
+    assert sorted(actual) == sorted(expected)
+    changed = sorted(key for key in expected if actual[key] != expected[key])
+    assert changed == []
+
+
+def test_golden_covers_every_algorithm_and_operation(golden):
+    algorithms = set(key.split('/')[2] for key in golden if key.startswith('section/'))
+    operations = set(key.split('/')[2] for key in golden if key.startswith('operation/'))
+
+    assert algorithms == set(tap_module.Tap.MUTATOR_ALGORITHMS)
+    assert len(operations) == 18
@@ -0,0 +1,69 @@
+"""
+The Mutator pipeline shares note dicts between stages; no stage may write
+to the notes it was given.
+"""
+
+import copy
+import random
+
+import pytest
+
+import Tap as tap_module
+from conftest import start_tap
+from live_set import build_song
+from mutator_sources import SOURCES, canonical_values, mutator_settings
+
+
+@pytest.fixture(scope='module')
+def tap():
+    tap, _ = start_tap(build_song(1, 1), connect=False)
+    yield tap
+    tap.disconnect()
+
+
+@pytest.mark.parametrize('algorithm', tap_module.Tap.MUTATOR_ALGORITHMS)
+@pytest.mark.parametrize('kind', sorted(SOURCES))
+def test_sections_leave_source_notes_untouched(tap, algorithm, kind):
+    source = SOURCES[kind](seed=3)
+    original = copy.deepcopy(source)
+    settings = mutator_settings(tap, algorithm, seed=3, rhythm=kind == 'rhythmic', depth=0.8)
+
+    sections = [
+        tap._mutator_make_section_values(source, role, 0.0, 8.0, settings, random.Random(role))
+        for role in range(17)
+    ]
+
+    assert source == original
+    # Shared dicts must not be changed by later sections either.
+    snapshot = [canonical_values(section) for section in sections]
+    for role in range(17):
+        tap._mutator_make_section_values(source, role, 0.0, 8.0, settings, random.Random(role))
+    assert [canonical_values(section) for section in sections] == snapshot
+
+
+@pytest.mark.parametrize('operation', range(18))
+@pytest.mark.parametrize('kind', sorted(SOURCES))
+def test_operations_leave_input_notes_untouched(tap, monkeypatch, operation, kind):
+    # The role shape copies every note up front; pass them through instead so
+    # each operation is handed the caller's dicts.
+    monkeypatch.setattr(tap, '_mutator_apply_role_shape', lambda values, *a, **k: list(values))
+    rhythm = kind == 'rhythmic'
+    source = SOURCES[kind](seed=5)
+    original = copy.deepcopy(source)
+    settings = mutator_settings(tap, seed=5, rhythm=rhythm, depth=0.9, operations=(operation,))
+
+    tap._mutator_apply_depth_pipeline(
+        source, 5, 8.0, settings, random.Random(operation), rhythm=rhythm,
+        target_pitches=settings['target_pitches'] or None)
+
+    assert source == original
+
+
+def test_sections_are_deterministic_for_a_seed(tap):
+    source = SOURCES['melodic'](seed=9)
+    settings = mutator_settings(tap, 'glass_steps', seed=9, depth=0.6)
+
+    first = tap._mutator_make_section_values(source, 6, 0.0, 8.0, settings, random.Random(1))
+    second = tap._mutator_make_section_values(source, 6, 0.0, 8.0, settings, random.Random(1))
+
+    assert canonical_values(first) == canonical_values(second)
@@ -0,0 +1,65 @@
+"""
+Smoke tests for running Tap against the stand-in Live API.
+"""
+
+import Tap as tap_module
+from live_set import build_song, clip_slot, sysex, text_sysex
+
+
+def test_handshake_sends_version_and_clip_grid(make_tap):
+    song = build_song(4, 4)
+    tap, c_instance = make_tap(song, connect=False)
+
+    tap._connection_established(1)
+    tap.update_display()
+
+    assert (0x93, 0x01, tap_module.secret_version_number) in c_instance.sent_midi
+    grid = [bytes(message[3:-1]).decode('ascii') for message in c_instance.sysex(0x05)]
+    assert set(row.split('%')[0] for row in grid) == {'0', '1', '2', '3'}
+
+
+def test_clip_slot_changes_are_flushed_as_deltas(make_tap):
+    song = build_song(4, 4, clip_density=1.0)
+    tap, c_instance = make_tap(song)
+    tap.device_status = False
+    tap.handle_sysex(sysex(0x48, ()))
+    tap.update_display()
+    c_instance.sent_midi = []
+
+    clip_slot(song, 2, 1).is_playing = True
+    clip_slot(song, 2, 1).is_triggered = False
+    tap.update_display()
+
+    deltas = [bytes(message[3:-1]).decode('ascii') for message in c_instance.sysex(0x4B)]
+    assert len(deltas) == 1
+    assert deltas[0].startswith('2%1%2:')
+
+
+def test_chunked_sysex_is_reassembled(make_tap):
+    tap, _ = make_tap()
+    received = []
+    tap._register_sysex_handler(0x3C, 3, received.append)
+    payload = b'search text'
+
+    tap.handle_sysex(sysex(0x3C, b'$' + payload[:6]))
+    tap.handle_sysex(sysex(0x3C, b'_' + payload[6:]))
+
+    assert received == [[0xF0, 0x3C] + list(payload) + [0xF7]]
+
+
+def test_tempo_sysex_sets_song_tempo(make_tap):
+    tap, _ = make_tap()
+
+    tap.handle_sysex(text_sysex(22, '98.5'))
+
+    assert tap.song().tempo == 98.5
+
+
+def test_disconnect_removes_song_listeners(make_tap):
+    song = build_song(2, 2)
+    tap, _ = make_tap(song)
+    assert song.listener_count('tracks') > 0
+
+    tap.disconnect()
+
+    assert song.listener_count('tracks') == 0
@@ -0,0 +1,59 @@
+"""
+The SysEx dispatch table: one lookup per message, per-ID minimum lengths.
+"""
+
+from live_set import build_song, note_edit_values, sysex
+
+
+def recorded_handlers(tap):
+    calls = []
+    for manufacturer_id, (min_length, _) in list(tap._sysex_handlers.items()):
+        tap._register_sysex_handler(
+            manufacturer_id, min_length,
+            lambda message, manufacturer_id=manufacturer_id: calls.append(manufacturer_id))
+    return calls
+
+
+def test_each_id_reaches_only_its_handler(make_tap):
+    tap, _ = make_tap(connect=False)
+    calls = recorded_handlers(tap)
+
+    for manufacturer_id, (min_length, _) in sorted(tap._sysex_handlers.items()):
+        message = [0xF0, manufacturer_id] + [1] * max(0, min_length - 3) + [0xF7]
+        tap._handle_full_sysex(message[:min_length] if min_length < 3 else message)
+
+    assert calls == sorted(tap._sysex_handlers)
+
+
+def test_messages_below_minimum_length_are_dropped(make_tap):
+    tap, _ = make_tap(connect=False)
+    calls = recorded_handlers(tap)
+
+    for manufacturer_id, (min_length, _) in tap._sysex_handlers.items():
+        tap._handle_full_sysex([0xF0, manufacturer_id, 1, 1, 1, 1, 1, 1, 1][:min_length - 1])
+
+    assert calls == []
+
+
+def test_unknown_ids_are_ignored(make_tap):
+    tap, c_instance = make_tap()
+    calls = recorded_handlers(tap)
+
+    tap.handle_sysex(sysex(0x7E, (1, 2, 3)))
+    tap.update_display()
+
+    assert calls == []
+    assert c_instance.sent_midi == []
+
+
+def test_modify_notes_updates_highlighted_clip(make_tap):
+    song = build_song(2, 2, clip_density=1.0, notes_per_clip=4)
+    clip_slot = song.tracks[0].clip_slots[0]
+    song.view.highlighted_clip_slot = clip_slot
+    tap, _ = make_tap(song)
+    note = clip_slot.clip.get_all_notes_extended()[0]
+
+    tap.handle_sysex(sysex(16, note_edit_values(note, pitch=note.pitch + 1, start_time=1.5)))
+
+    edited = clip_slot.clip.get_notes_by_id([note.note_id])[0]
+    assert (edited.pitch, edited.start_time) == (note.pitch + 1, 1.5)
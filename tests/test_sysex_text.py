@@ -0,0 +1,90 @@
+"""
+SysEx text sanitizing, escaping, splitting and unescaping.
+"""
+
+import random
+
+from sysex_text import (
+    automation_payload, name_corpus, random_text, reference_escape, reference_sanitize,
+    reference_split, reference_unescape,
+)
+
+
+def test_sanitize_and_escape_match_reference(make_tap):
+    tap = make_tap(connect=False)[0]
+    rng = random.Random(5)
+    texts = name_corpus(500) + [random_text(rng, rng.randint(0, 40)) for _ in range(3000)]
+
+    for text in texts + texts:
+        assert tap._sanitize_sysex_text(text) == reference_sanitize(text)
+        assert tap._escape_sysex_string(text) == reference_escape(text)
+
+
+def test_non_string_values_are_converted(make_tap):
+    tap = make_tap(connect=False)[0]
+
+    assert tap._escape_sysex_string(-1.5) == reference_escape(-1.5)
+    assert tap._sanitize_sysex_text(None) == 'None'
+
+
+def test_text_cache_is_bounded_and_skips_long_text(make_tap, monkeypatch):
+    tap = make_tap(connect=False)[0]
+    monkeypatch.setattr(tap, 'SYSEX_TEXT_CACHE_SIZE', 8)
+    tap._escaped_sysex_text_cache.clear()
+
+    for index in range(20):
+        tap._escape_sysex_string('Name {}'.format(index))
+    tap._escape_sysex_string('x' * (tap.SYSEX_TEXT_CACHE_MAX_LENGTH + 1))
+
+    assert list(tap._escaped_sysex_text_cache) == ['Name {}'.format(index) for index in range(12, 20)]
+
+
+def test_text_cache_evicts_least_recently_used(make_tap, monkeypatch):
+    tap = make_tap(connect=False)[0]
+    monkeypatch.setattr(tap, 'SYSEX_TEXT_CACHE_SIZE', 3)
+    tap._escaped_sysex_text_cache.clear()
+
+    for text in ('a', 'b', 'c', 'a', 'd'):
+        tap._escape_sysex_string(text)
+
+    assert list(tap._escaped_sysex_text_cache) == ['c', 'a', 'd']
+
+
+def test_split_and_unescape_match_reference(make_tap):
+    tap = make_tap(connect=False)[0]
+    rng = random.Random(11)
+
+    for _ in range(3000):
+        text = random_text(rng, rng.randint(0, 60))
+        if rng.random() < 0.2:
+            text += '\\'
+        assert tap._unescape_sysex_string(text) == reference_unescape(text)
+        for separator in ('|', ',', ';'):
+            assert tap._split_escaped_sysex_fields(text, separator) == reference_split(text, separator)
+
+
+def test_escaped_fields_round_trip(make_tap):
+    tap = make_tap(connect=False)[0]
+    rng = random.Random(13)
+
+    for _ in range(2000):
+        fields = [random_text(rng, rng.randint(0, 20)) for _ in range(rng.randint(1, 8))]
+        separator = rng.choice(('|', ','))
+        payload = separator.join(tap._escape_sysex_string(field) for field in fields)
+
+        split_fields = tap._split_escaped_sysex_fields(payload, separator)
+
+        assert [tap._unescape_sysex_string(field) for field in split_fields] == [
+            tap._sanitize_sysex_text(field) for field in fields
+        ]
+
+
+def test_nested_split_of_automation_payload(make_tap):
+    tap = make_tap(connect=False)[0]
+    payload = automation_payload(256, token='write\\|1')
+
+    fields = tap._split_escaped_sysex_fields(payload, '|')
+
+    assert len(fields) == 8
+    assert tap._unescape_sysex_string(fields[7]) == 'write|1'
+    assert len(tap._split_escaped_sysex_fields(fields[4], ',')) == 256
@@ -0,0 +1,56 @@
+"""
+The Simpler waveform disk cache lives in the per-user cache directory,
+never in the script folder.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+import Tap as tap_module
+from conftest import start_tap
+from live_set import build_song
+
+
+@pytest.fixture
+def tap():
+    tap, _ = start_tap(build_song(1, 1), connect=False)
+    yield tap
+    tap.disconnect()
+
+
+def test_macos_uses_library_caches(tap, monkeypatch):
+    monkeypatch.setattr(sys, 'platform', 'darwin')
+    monkeypatch.setenv('HOME', '/Users/tap')
+
+    assert tap._simpler_waveform_disk_cache_directory() == os.path.join(
+        '/Users/tap', 'Library', 'Caches', 'Tap', 'WaveformCache')
+
+
+def test_windows_uses_local_app_data(tap, monkeypatch):
+    monkeypatch.setattr(sys, 'platform', 'win32')
+    monkeypatch.setenv('LOCALAPPDATA', os.path.join(os.sep, 'AppData', 'Local'))
+
+    assert tap._simpler_waveform_disk_cache_directory() == os.path.join(
+        os.sep, 'AppData', 'Local', 'Tap', 'WaveformCache')
+
+
+def test_other_platforms_use_xdg_cache_home(tap, monkeypatch):
+    monkeypatch.setattr(sys, 'platform', 'linux')
+    monkeypatch.setenv('XDG_CACHE_HOME', '/var/cache/tap-user')
+
+    assert tap._simpler_waveform_disk_cache_directory() == os.path.join(
+        '/var/cache/tap-user', 'Tap', 'WaveformCache')
+
+
+def test_unresolvable_home_falls_back_to_the_temp_directory(tap, monkeypatch):
+    monkeypatch.setattr(sys, 'platform', 'win32')
+    monkeypatch.delenv('LOCALAPPDATA', raising=False)
+    monkeypatch.delenv('APPDATA', raising=False)
+
+    directory = tap._simpler_waveform_disk_cache_directory()
+
+    assert directory == os.path.join(tempfile.gettempdir(), 'Tap', 'WaveformCache')
+    assert not directory.startswith(os.path.dirname(os.path.abspath(tap_module.__file__)))
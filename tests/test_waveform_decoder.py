@@ -0,0 +1,122 @@
+"""
+The built-in WAV/AIFF peak reader against bins computed directly from the
+written samples, with and without audioop.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import Tap as tap_module
+from audio_files import reference_bins, sample_signal, write_aiff, write_wav
+
+FRAME_COUNT = 5000
+FORMATS = [
+    # (writer, channels, sample_width, options)
+    ('wav', 1, 1, {}),
+    ('wav', 2, 2, {}),
+    ('wav', 2, 3, {}),
+    ('wav', 1, 4, {}),
+    ('wav', 2, 2, {'extensible': True}),
+    ('wav', 2, 4, {'is_float': True}),
+    ('wav', 1, 8, {'is_float': True}),
+    ('aiff', 2, 2, {}),
+    ('aiff', 1, 3, {}),
+    ('aiff', 2, 2, {'compression': b'NONE'}),
+    ('aiff', 2, 2, {'compression': b'sowt'}),
+    ('aiff', 2, 3, {'compression': b'sowt'}),
+    ('aiff', 2, 4, {'compression': b'fl32'}),
+]
+
+
+@pytest.fixture(params=[True, False], ids=['audioop', 'array'])
+def tap(request, make_tap, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(tap_module, 'audioop', None)
+    elif tap_module.audioop is None:
+        pytest.skip('audioop is not available')
+    return make_tap(connect=False)[0]
+
+
+def format_id(value):
+    writer, channels, sample_width, options = value
+    return '{}-{}ch-{}b{}'.format(writer, channels, sample_width * 8, ''.join('-' + str(option) for option in options.values()))
+
+
+@pytest.mark.parametrize('audio_format', FORMATS, ids=format_id)
+def test_bins_match_written_samples(tap, tmp_path, audio_format):
+    writer, channels, sample_width, options = audio_format
+    is_float = options.get('is_float') or options.get('compression') in (b'fl32', b'fl64')
+    peak = 1 << (8 * min(sample_width, 3) - 1) if not is_float else 1 << 15
+    samples = sample_signal(FRAME_COUNT, channels, peak)
+    path = str(tmp_path / ('sample.' + writer))
+    if writer == 'wav':
+        write_wav(path, samples, channels, sample_width, peak=peak, **options)
+    else:
+        write_aiff(path, samples, channels, sample_width, peak=peak, **options)
+
+    minimums, maximums = tap._decode_pcm_waveform_bins(path)
+
+    expected_minimums, expected_maximums = reference_bins(samples, channels, tap.SIMPLER_WAVEFORM_MIN_BIN_FRAMES)
+    if is_float:
+        expected_minimums = [value / float(peak) for value in expected_minimums]
+        expected_maximums = [value / float(peak) for value in expected_maximums]
+        assert minimums == pytest.approx(expected_minimums, rel=1e-6)
+        assert maximums == pytest.approx(expected_maximums, rel=1e-6)
+        return
+    if sample_width == 3 and tap_module.audioop is None:
+        # The array path widens 24-bit samples into the top bytes of an int32.
+        expected_minimums = [value << 8 for value in expected_minimums]
+        expected_maximums = [value << 8 for value in expected_maximums]
+    assert (minimums, maximums) == (expected_minimums, expected_maximums)
+
+
+def test_bins_widen_to_stay_under_the_bin_limit(tap, tmp_path, monkeypatch):
+    monkeypatch.setattr(tap, 'SIMPLER_WAVEFORM_MAX_BINS', 16)
+    samples = sample_signal(FRAME_COUNT, 1, 1 << 15)
+    path = str(tmp_path / 'long.wav')
+    write_wav(path, samples, 1, 2)
+
+    minimums, maximums = tap._decode_pcm_waveform_bins(path)
+
+    # 5000 frames need 512-frame bins to fit in 16.
+    assert (minimums, maximums) == reference_bins(samples, 1, 512)
+
+
+def test_compressed_or_unknown_files_are_not_decoded(tap, tmp_path):
+    path = tmp_path / 'sample.flac'
+    path.write_bytes(b'fLaC' + bytes(200))
+    assert tap._decode_pcm_waveform_bins(str(path)) is None
+
+    aiff_path = str(tmp_path / 'sample.aifc')
+    write_aiff(aiff_path, sample_signal(100, 1, 1 << 15), 1, 2, compression=b'ima4')
+    assert tap._decode_pcm_waveform_bins(aiff_path) is None
+
+
+def test_normalized_bins_are_the_same_for_both_paths(make_tap, tmp_path, monkeypatch):
+    tap = make_tap(connect=False)[0]
+    samples = sample_signal(FRAME_COUNT, 2, 1 << 23)
+    path = str(tmp_path / 'sample.wav')
+    write_wav(path, samples, 2, 3)
+    if tap_module.audioop is None:
+        pytest.skip('audioop is not available')
+    with_audioop = tap._normalized_waveform_bins(*tap._decode_pcm_waveform_bins(path))
+
+    monkeypatch.setattr(tap_module, 'audioop', None)
+    without_audioop = tap._normalized_waveform_bins(*tap._decode_pcm_waveform_bins(path))
+
+    assert with_audioop == without_audioop
+
+
+def test_import_does_not_warn_about_audioop():
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+    # -c puts the working directory, the repository root, on sys.path.
+    result = subprocess.run(
+        [sys.executable, '-W', 'error::DeprecationWarning', '-c', 'import Tap'],
+        cwd=os.path.dirname(tests_dir),
+        env=dict(os.environ, PYTHONPATH=os.path.join(tests_dir, 'stubs')),
+        capture_output=True,
+    )
+    assert result.returncode == 0, result.stderr.decode('utf-8', 'replace')